@@ -0,0 +1,819 @@
+"""
+Agent Execution Engine
+
+Runs phase agents (the ``agents/*.md`` definitions) as queued jobs.
+Jobs are persisted in SQLite so an interrupted run resumes where it
+stopped; independent sub-tasks of a phase run concurrently, bounded by
+a global limit and a per-phase limit, across any number of projects.
+"""
+
+from contextlib import closing
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+import asyncio
+import inspect
+import json
+import logging
+import os
+import socket
+import sqlite3
+import sys
+import time
+import uuid
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from workflow_context import WorkflowContext, ResearchPhase
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_DB_PATH = Path.home() / ".research_workflow" / "jobs.sqlite"
+
+AGENTS_DIR = Path(__file__).parent.parent / "agents"
+
+# Seconds a running job stays claimed without a heartbeat from its engine;
+# after that another engine may re-queue it
+DEFAULT_LEASE_SECONDS = 300
+
+# Jobs of one phase allowed to run at once, across all projects
+# (literature search is bound by database API rate limits, analysis by CPU)
+DEFAULT_PHASE_LIMITS = {
+    ResearchPhase.LITERATURE_REVIEW: 4,
+    ResearchPhase.ANALYSIS: 2,
+}
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of an agent job"""
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class AgentDefinition:
+    """A phase agent parsed from agents/<name>.md"""
+    name: str
+    description: str = ""
+    tools: List[str] = field(default_factory=list)
+    model: Optional[str] = None
+    prompt: str = ""  # Markdown body, used as the agent's system prompt
+    path: Optional[Path] = None
+
+    @classmethod
+    def from_file(cls, path: Path) -> "AgentDefinition":
+        """Parse an agent definition (YAML frontmatter + markdown body)"""
+        text = Path(path).read_text()
+        meta, body = {}, text
+        if text.startswith("---"):
+            _, frontmatter, body = text.split("---", 2)
+            meta = yaml.safe_load(frontmatter) or {}
+
+        tools = meta.get("tools") or []
+        if isinstance(tools, str):
+            tools = [t.strip() for t in tools.split(",") if t.strip()]
+
+        return cls(
+            name=meta.get("name", Path(path).stem),
+            description=meta.get("description", ""),
+            tools=tools,
+            model=meta.get("model"),
+            prompt=body.strip(),
+            path=Path(path)
+        )
+
+
+def load_agent_definitions(agents_dir: Optional[Path] = None) -> Dict[str, AgentDefinition]:
+    """
+    Load every agent definition in a directory.
+
+    Args:
+        agents_dir: Directory of agent markdown files (default: repository agents/)
+
+    Returns:
+        Definitions by agent name
+    """
+    definitions = {}
+    for path in sorted(Path(agents_dir or AGENTS_DIR).glob("*.md")):
+        definition = AgentDefinition.from_file(path)
+        definitions[definition.name] = definition
+    return definitions
+
+
+@dataclass
+class SubTask:
+    """One unit of a phase's work, run as a separate job"""
+    key: str
+    agent: str
+    task: str
+    depends_on: List[str] = field(default_factory=list)  # keys of sub-tasks in the same phase
+
+
+# Phases split into sub-tasks; sub-tasks without mutual dependencies run concurrently.
+# Phases not listed run their orchestrator agent as a single job.
+PHASE_TASKS: Dict[ResearchPhase, List[SubTask]] = {
+    ResearchPhase.LITERATURE_REVIEW: [
+        SubTask("search", "literature-reviewer",
+                "Search, screen and extract the literature. Write data/literature/*.csv, "
+                "results/prisma_flow_diagram.md and results/risk_of_bias_assessment.csv."),
+        SubTask("citations", "citation-manager",
+                "Verify the citations of the included studies (retractions, duplicates, "
+                "formatting).", ["search"]),
+    ],
+    ResearchPhase.EXPERIMENTAL_DESIGN: [
+        SubTask("protocol", "experiment-designer",
+                "Draft docs/experimental_protocol.md, including sex as a biological variable."),
+        SubTask("power_analysis", "experiment-designer",
+                "Write docs/power_analysis.md with a sample size for at least 80% power."),
+        SubTask("randomization", "experiment-designer",
+                "Write code/randomization.py with a fixed random seed."),
+        SubTask("review", "quality-assurance",
+                "Review the experimental design against NIH rigor standards.",
+                ["protocol", "power_analysis", "randomization"]),
+    ],
+    ResearchPhase.ANALYSIS: [
+        SubTask("analysis", "data-analyst",
+                "Run the pre-registered primary analysis. Write code/analysis/ and results/."),
+        SubTask("code_review", "code-reviewer",
+                "Review the analysis code for correctness and reproducibility.", ["analysis"]),
+    ],
+    ResearchPhase.WRITING: [
+        SubTask("manuscript", "manuscript-writer",
+                "Write docs/manuscript/manuscript.md following the relevant reporting guideline."),
+        SubTask("citations", "citation-manager",
+                "Verify and format every citation in the manuscript.", ["manuscript"]),
+    ],
+}
+
+
+@dataclass
+class AgentJob:
+    """A queued agent run"""
+    job_id: str
+    project_root: str
+    phase: ResearchPhase
+    agent: str
+    task: str  # Prompt given to the agent
+    depends_on: List[str] = field(default_factory=list)  # job IDs
+    status: JobStatus = JobStatus.PENDING
+    attempts: int = 0
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    owner: Optional[str] = None  # Engine holding the job while it runs
+    lease_expires: Optional[float] = None  # Unix time the owner's claim lapses
+
+
+class JobStore:
+    """
+    SQLite persistence for agent jobs.
+
+    Every status change is committed immediately, so after a crash the
+    store shows which jobs finished. Several engines can share one store:
+    an engine claims a pending job with a conditional update and holds a
+    lease on it while it runs, renewed by heartbeats. ``recover``
+    re-queues only running jobs whose lease expired, i.e. whose engine
+    stopped.
+    """
+
+    _COLUMNS = (
+        "job_id, project_root, phase, agent, task, depends_on, status, attempts, "
+        "result, error, created_at, started_at, finished_at, owner, lease_expires"
+    )
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize job store.
+
+        Args:
+            db_path: SQLite database (default: ~/.research_workflow/jobs.sqlite)
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_JOB_DB_PATH
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_db(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    project_root TEXT,
+                    phase TEXT,
+                    agent TEXT,
+                    task TEXT,
+                    depends_on TEXT,  -- JSON list of job IDs
+                    status TEXT,
+                    attempts INTEGER,
+                    result TEXT,  -- JSON
+                    error TEXT,
+                    created_at TEXT,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    owner TEXT,
+                    lease_expires REAL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_project ON jobs(project_root, phase)")
+            conn.commit()
+
+    def save(self, job: AgentJob):
+        """Insert or update a job"""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO jobs ({self._COLUMNS}) VALUES ({', '.join('?' * 15)})",
+                (
+                    job.job_id, job.project_root, job.phase.value, job.agent, job.task,
+                    json.dumps(job.depends_on), job.status.value, job.attempts,
+                    json.dumps(job.result) if job.result is not None else None,
+                    job.error, job.created_at, job.started_at, job.finished_at,
+                    job.owner, job.lease_expires
+                )
+            )
+            conn.commit()
+
+    def claim(self, job: AgentJob, owner: str, lease_seconds: float) -> bool:
+        """
+        Mark a pending job running for ``owner``, unless another engine got it first.
+
+        Args:
+            job: Job to claim (updated in place on success)
+            owner: Claiming engine's ID
+            lease_seconds: Seconds the claim lasts without renewal
+
+        Returns:
+            True if this call claimed the job
+        """
+        started_at = datetime.now().isoformat()
+        lease_expires = time.time() + lease_seconds
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, started_at = ?, "
+                "owner = ?, lease_expires = ? WHERE job_id = ? AND status = ?",
+                (JobStatus.RUNNING.value, started_at, owner, lease_expires,
+                 job.job_id, JobStatus.PENDING.value)
+            )
+            conn.commit()
+        if cursor.rowcount != 1:
+            return False
+        job.status = JobStatus.RUNNING
+        job.attempts += 1
+        job.started_at = started_at
+        job.owner, job.lease_expires = owner, lease_expires
+        return True
+
+    def renew(self, job_ids: Iterable[str], owner: str, lease_seconds: float) -> int:
+        """
+        Extend the leases ``owner`` holds on running jobs.
+
+        Returns:
+            Number of leases renewed
+        """
+        job_ids = list(job_ids)
+        renewed = 0
+        with closing(self._connect()) as conn:
+            for i in range(0, len(job_ids), 500):
+                chunk = job_ids[i:i + 500]
+                renewed += conn.execute(
+                    f"UPDATE jobs SET lease_expires = ? WHERE owner = ? AND status = ? "
+                    f"AND job_id IN ({', '.join('?' * len(chunk))})",
+                    [time.time() + lease_seconds, owner, JobStatus.RUNNING.value] + chunk
+                ).rowcount
+            conn.commit()
+        return renewed
+
+    def finish(self, job: AgentJob, owner: Optional[str] = None) -> bool:
+        """
+        Record a job's final status, result and error.
+
+        A running job is only updated while ``owner`` still holds it; a job
+        is finished without running (``owner`` None) only while pending.
+        Either way, a job another engine has taken over is left alone.
+
+        Returns:
+            True if the job was updated
+        """
+        if owner is None:
+            condition, params = "status = ?", [JobStatus.PENDING.value]
+        else:
+            condition, params = "status = ? AND owner = ?", [JobStatus.RUNNING.value, owner]
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                f"UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, "
+                f"lease_expires = NULL WHERE job_id = ? AND {condition}",
+                [
+                    job.status.value,
+                    json.dumps(job.result) if job.result is not None else None,
+                    job.error, job.finished_at, job.job_id
+                ] + params
+            )
+            conn.commit()
+        return cursor.rowcount == 1
+
+    def get(self, job_id: str) -> Optional[AgentJob]:
+        """Get one job"""
+        jobs = self._select("WHERE job_id = ?", [job_id])
+        return jobs[0] if jobs else None
+
+    def list(
+        self,
+        status: Optional[JobStatus] = None,
+        project_root: Optional[Union[str, Path]] = None,
+        phase: Optional[ResearchPhase] = None
+    ) -> List[AgentJob]:
+        """
+        List jobs, oldest first.
+
+        Args:
+            status: Only jobs with this status
+            project_root: Only jobs of this project
+            phase: Only jobs of this phase
+
+        Returns:
+            Matching jobs
+        """
+        clauses, params = [], []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(JobStatus(status).value)
+        if project_root is not None:
+            clauses.append("project_root = ?")
+            params.append(str(project_root))
+        if phase is not None:
+            clauses.append("phase = ?")
+            params.append(ResearchPhase(phase).value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._select(f"{where} ORDER BY created_at, rowid", params)
+
+    def statuses(self, job_ids: Iterable[str]) -> Dict[str, JobStatus]:
+        """Current status of each existing job among ``job_ids``"""
+        job_ids = list(job_ids)
+        statuses = {}
+        with closing(self._connect()) as conn:
+            for i in range(0, len(job_ids), 500):
+                chunk = job_ids[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT job_id, status FROM jobs WHERE job_id IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                statuses.update((job_id, JobStatus(status)) for job_id, status in rows)
+        return statuses
+
+    def recover(self) -> int:
+        """
+        Re-queue running jobs whose lease expired (their engine stopped).
+
+        Jobs another engine is still running keep their lease and are left
+        alone.
+
+        Returns:
+            Number of jobs re-queued
+        """
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, started_at = NULL, owner = NULL, lease_expires = NULL "
+                "WHERE status = ? AND (lease_expires IS NULL OR lease_expires < ?)",
+                (JobStatus.PENDING.value, JobStatus.RUNNING.value, time.time())
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    def _select(self, where: str, params: list) -> List[AgentJob]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(f"SELECT {self._COLUMNS} FROM jobs {where}", params).fetchall()
+        return [
+            AgentJob(
+                job_id=row[0],
+                project_root=row[1],
+                phase=ResearchPhase(row[2]),
+                agent=row[3],
+                task=row[4],
+                depends_on=json.loads(row[5]),
+                status=JobStatus(row[6]),
+                attempts=row[7],
+                result=json.loads(row[8]) if row[8] is not None else None,
+                error=row[9],
+                created_at=row[10],
+                started_at=row[11],
+                finished_at=row[12],
+                owner=row[13],
+                lease_expires=row[14]
+            )
+            for row in rows
+        ]
+
+
+class LocalStubRunner:
+    """
+    Runner that does not invoke any agent, for tests and dry runs.
+
+    Each job waits ``delay`` seconds, then returns ``handler(job, agent)``
+    (a dict, or an awaitable of one) or a placeholder result.
+    """
+
+    def __init__(
+        self,
+        handler: Optional[Callable[[AgentJob, AgentDefinition], Union[dict, Awaitable[dict]]]] = None,
+        delay: float = 0.0
+    ):
+        self.handler = handler
+        self.delay = delay
+
+    async def run(self, job: AgentJob, agent: AgentDefinition) -> dict:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.handler is None:
+            return {"output": f"[stub] {agent.name}: {job.task.splitlines()[0]}"}
+        result = self.handler(job, agent)
+        if inspect.isawaitable(result):
+            result = await result
+        return result or {}
+
+
+class ClaudeCLIRunner:
+    """
+    Runner that executes an agent with the ``claude`` CLI in print mode.
+
+    The agent definition's body is appended to the system prompt and its
+    tools and model are passed through; the job runs in its project root.
+    """
+
+    def __init__(self, executable: str = "claude", timeout: Optional[float] = 3600.0):
+        """
+        Initialize runner.
+
+        Args:
+            executable: CLI executable
+            timeout: Seconds before a job is killed and failed (None: no limit)
+        """
+        self.executable = executable
+        self.timeout = timeout
+
+    async def run(self, job: AgentJob, agent: AgentDefinition) -> dict:
+        args = [
+            self.executable, "-p", job.task,
+            "--output-format", "json",
+            "--append-system-prompt", agent.prompt
+        ]
+        if agent.tools:
+            args += ["--allowedTools", ",".join(agent.tools)]
+        if agent.model:
+            args += ["--model", agent.model]
+
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=job.project_root,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), self.timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise RuntimeError(f"Agent {agent.name} timed out after {self.timeout}s") from None
+
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"Agent {agent.name} exited with {process.returncode}: "
+                f"{stderr.decode(errors='replace').strip()[-2000:]}"
+            )
+        try:
+            return json.loads(stdout)
+        except ValueError:
+            return {"output": stdout.decode(errors="replace")}
+
+
+class ExecutionEngine:
+    """
+    Asynchronous job queue for phase agents.
+
+    ``submit_phase`` queues a phase's sub-tasks as jobs; ``run`` executes
+    queued jobs from every project until none are left. A job starts once
+    its dependencies succeeded and both the global and its phase's
+    concurrency limits have room, so a slow agent in one project only
+    holds its own slot. A job whose dependency failed fails without
+    running.
+
+    Engines sharing a store never run the same job twice: each claims a
+    job atomically and renews its lease every ``lease_seconds / 3`` while
+    the job runs. Only jobs whose lease expired are re-queued.
+    """
+
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        runner: Optional[Any] = None,
+        agents: Optional[Dict[str, AgentDefinition]] = None,
+        max_concurrency: int = 8,
+        phase_limits: Optional[Dict[ResearchPhase, int]] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            store: Job persistence (default: ~/.research_workflow/jobs.sqlite)
+            runner: Object with ``async run(job, agent) -> dict`` (default: ClaudeCLIRunner)
+            agents: Agent definitions by name (default: repository agents/)
+            max_concurrency: Jobs running at once, across all phases
+            phase_limits: Jobs of a phase running at once (default: DEFAULT_PHASE_LIMITS)
+            lease_seconds: Seconds a claimed job stays this engine's without a heartbeat
+        """
+        self.store = store or JobStore()
+        self.runner = runner or ClaudeCLIRunner()
+        self.agents = agents if agents is not None else load_agent_definitions()
+        self.max_concurrency = max_concurrency
+        self.phase_limits = phase_limits if phase_limits is not None else DEFAULT_PHASE_LIMITS
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    def submit(
+        self,
+        project_root: Union[str, Path],
+        phase: ResearchPhase,
+        agent: str,
+        task: str,
+        depends_on: Iterable[str] = ()
+    ) -> str:
+        """
+        Queue one agent job.
+
+        Args:
+            project_root: Project the agent works in
+            phase: Phase the job belongs to (for concurrency limits)
+            agent: Agent name
+            task: Prompt for the agent
+            depends_on: Job IDs that must succeed first
+
+        Returns:
+            Job ID
+        """
+        job = AgentJob(
+            job_id=str(uuid.uuid4()),
+            project_root=str(project_root),
+            phase=ResearchPhase(phase),
+            agent=agent,
+            task=task,
+            depends_on=list(depends_on)
+        )
+        self.store.save(job)
+        return job.job_id
+
+    def submit_phase(
+        self,
+        context: WorkflowContext,
+        phase: ResearchPhase,
+        agent: str,
+        resubmit: bool = False
+    ) -> List[str]:
+        """
+        Queue the sub-tasks of a phase for one project.
+
+        If the phase already has jobs and none of them failed, their IDs
+        are returned instead, so re-executing a phase after a restart does
+        not duplicate work. A phase with a failed job is queued afresh.
+
+        Args:
+            context: Project workflow context
+            phase: Phase to run
+            agent: Agent for phases without sub-tasks in PHASE_TASKS
+            resubmit: Queue new jobs even if the phase has some
+
+        Returns:
+            Job IDs, in sub-task order
+        """
+        project_root = str(context.project_root)
+        if not resubmit:
+            existing = self.phase_jobs(project_root, phase)
+            if existing and all(job.status != JobStatus.FAILED for job in existing):
+                return [job.job_id for job in existing]
+
+        subtasks = PHASE_TASKS.get(phase) or [
+            SubTask(phase.value, agent, f"Complete the {phase.value.replace('_', ' ')} phase.")
+        ]
+        job_ids: Dict[str, str] = {}
+        for subtask in subtasks:
+            job_ids[subtask.key] = self.submit(
+                project_root,
+                phase,
+                subtask.agent,
+                _task_prompt(subtask.task, context),
+                [job_ids[key] for key in subtask.depends_on]
+            )
+        return list(job_ids.values())
+
+    def phase_jobs(self, project_root: Union[str, Path], phase: ResearchPhase) -> List[AgentJob]:
+        """
+        Latest job of each sub-task queued for a project's phase.
+
+        Jobs superseded by a later submission of the same agent and task
+        (e.g. after a failure) are left out.
+
+        Args:
+            project_root: Project root
+            phase: Research phase
+
+        Returns:
+            Jobs, oldest first
+        """
+        latest: Dict[tuple, AgentJob] = {}
+        for job in self.store.list(project_root=str(project_root), phase=phase):
+            latest.pop((job.agent, job.task), None)
+            latest[(job.agent, job.task)] = job
+        return list(latest.values())
+
+    async def run(self, on_finished: Optional[Callable[[AgentJob], None]] = None) -> Dict[str, int]:
+        """
+        Run queued jobs until none can start and none of this engine's are running.
+
+        Jobs whose engine stopped (lease expired) are re-queued; jobs
+        another engine is running are left to it. Jobs queued while running
+        (e.g. by ``on_finished``) are picked up.
+
+        Args:
+            on_finished: Called with each job once it succeeded or failed
+
+        Returns:
+            Number of jobs finished in this run, by final status
+        """
+        counts = {JobStatus.SUCCEEDED.value: 0, JobStatus.FAILED.value: 0}
+        running: Dict[asyncio.Task, AgentJob] = {}
+
+        def finished(job: AgentJob):
+            counts[job.status.value] += 1
+            if on_finished is not None:
+                on_finished(job)
+
+        heartbeat = asyncio.create_task(self._heartbeat(running))
+        try:
+            while True:
+                recovered = self.store.recover()
+                if recovered:
+                    logger.info(f"Re-queued {recovered} job(s) whose engine stopped")
+
+                startable, failed = self._startable(list(running.values()))
+                for job in failed:
+                    finished(job)
+                for job in startable:
+                    # Claimed before the task starts, so neither the next pass
+                    # nor another engine can start it again
+                    if self.store.claim(job, self.owner, self.lease_seconds):
+                        running[asyncio.create_task(self._execute(job))] = job
+
+                if not running:
+                    if failed:
+                        continue  # Callbacks may have queued more jobs
+                    return counts
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    del running[task]
+                    job = task.result()
+                    if job is not None:
+                        finished(job)
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, running: Dict[asyncio.Task, AgentJob]):
+        """Renew the leases of this engine's running jobs"""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            if running:
+                self.store.renew(
+                    [job.job_id for job in running.values()], self.owner, self.lease_seconds
+                )
+
+    def _startable(self, running: List[AgentJob]) -> Tuple[List[AgentJob], List[AgentJob]]:
+        """Pending jobs that can start now, and pending jobs failed because a dependency failed"""
+        pending = self.store.list(status=JobStatus.PENDING)
+        if not pending:
+            return [], []
+
+        statuses = self.store.statuses({dep for job in pending for dep in job.depends_on})
+        # A failure cascades to every job downstream of it in this pass
+        failed = []
+        failed_any = True
+        while failed_any:
+            failed_any = False
+            for job in pending:
+                if job.status == JobStatus.PENDING and any(
+                    statuses.get(dep) in (JobStatus.FAILED, None) for dep in job.depends_on
+                ):
+                    failed_any = True
+                    if self._finish(job, JobStatus.FAILED, error="Dependency failed or missing"):
+                        statuses[job.job_id] = JobStatus.FAILED
+                        failed.append(job)
+                    else:
+                        # Claimed by another engine meanwhile
+                        statuses[job.job_id] = JobStatus.RUNNING
+
+        phase_counts: Dict[ResearchPhase, int] = {}
+        for job in running:
+            phase_counts[job.phase] = phase_counts.get(job.phase, 0) + 1
+
+        startable = []
+        for job in pending:
+            if len(running) + len(startable) >= self.max_concurrency:
+                break
+            if job.status != JobStatus.PENDING or any(
+                statuses[dep] != JobStatus.SUCCEEDED for dep in job.depends_on
+            ):
+                continue
+            limit = self.phase_limits.get(job.phase)
+            if limit is not None and phase_counts.get(job.phase, 0) >= limit:
+                continue
+
+            phase_counts[job.phase] = phase_counts.get(job.phase, 0) + 1
+            startable.append(job)
+
+        return startable, failed
+
+    async def _execute(self, job: AgentJob) -> Optional[AgentJob]:
+        """
+        Run one claimed job and persist its outcome.
+
+        Returns:
+            The finished job, or None if the lease lapsed and another
+            engine took the job over (its outcome is then discarded)
+        """
+        agent = self.agents.get(job.agent)
+        if agent is None:
+            finished = self._finish(job, JobStatus.FAILED, error=f"Unknown agent: {job.agent}")
+            return job if finished else None
+
+        logger.info(f"Running {job.agent} for {job.phase.value} in {job.project_root}")
+        try:
+            result = await self.runner.run(job, agent)
+        except Exception as e:
+            logger.error(f"Job {job.job_id} ({job.agent}) failed: {e}")
+            finished = self._finish(job, JobStatus.FAILED, error=str(e))
+        else:
+            finished = self._finish(job, JobStatus.SUCCEEDED, result=result)
+        if not finished:
+            logger.warning(f"Job {job.job_id} ({job.agent}) was taken over by another engine")
+            return None
+        return job
+
+    def _finish(
+        self,
+        job: AgentJob,
+        status: JobStatus,
+        result: Optional[dict] = None,
+        error: Optional[str] = None
+    ) -> bool:
+        """Record a job's outcome; False if the job is no longer this engine's to finish"""
+        owner = self.owner if job.status == JobStatus.RUNNING else None
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = datetime.now().isoformat()
+        job.lease_expires = None
+        return self.store.finish(job, owner)
+
+
+def _task_prompt(task: str, context: WorkflowContext) -> str:
+    """Task description with the project context an agent needs"""
+    return (
+        f"{task}\n\n"
+        f"Research question: {context.research_question}\n"
+        f"Domain: {context.domain or 'unspecified'}\n"
+        f"Mode: {context.mode.value}\n"
+        f"Project root: {context.project_root}"
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run queued research agent jobs")
+    parser.add_argument("--db", help="Job database path")
+    parser.add_argument("--stub", action="store_true", help="Use the local stub runner")
+    parser.add_argument("--jobs", type=int, default=8, help="Jobs to run at once")
+    parser.add_argument("--list", action="store_true", help="List jobs instead of running them")
+    args = parser.parse_args()
+
+    store = JobStore(Path(args.db) if args.db else None)
+    if args.list:
+        for job in store.list():
+            print(f"  {job.status.value:9} {job.phase.value:22} {job.agent:20} {job.project_root}")
+    else:
+        engine = ExecutionEngine(
+            store,
+            runner=LocalStubRunner() if args.stub else None,
+            max_concurrency=args.jobs
+        )
+        counts = asyncio.run(engine.run())
+        print(f"Succeeded {counts['succeeded']}, failed {counts['failed']}")
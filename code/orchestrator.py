@@ -5,7 +5,7 @@ Orchestrates agent execution for each research phase.
 Manages transitions between phases and validates outputs.
 """
 
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from pathlib import Path
 import logging
 import sys
@@ -14,7 +14,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from workflow_context import WorkflowContext, ResearchPhase, Mode, ValidationResult
 from research_workflow import ResearchWorkflow
-from validators import FINERValidator, PRISMAValidator, NIHRigorValidator
+from phase_outputs import PhaseOutputIndex
+from agent_engine import ExecutionEngine, AgentJob, JobStatus
+from validators import FINERValidator, PRISMAValidator, NIHRigorValidator, ValidationCache
 
 logger = logging.getLogger(__name__)
 
@@ -53,15 +55,34 @@ class WorkflowOrchestrator:
         ResearchPhase.PUBLICATION: "quality-assurance"
     }
 
-    def __init__(self, workflow: ResearchWorkflow):
+    def __init__(
+        self,
+        workflow: ResearchWorkflow,
+        use_cache: bool = True,
+        engine: Optional[ExecutionEngine] = None,
+        persist_cache: bool = False
+    ):
         """
         Initialize orchestrator with workflow.
 
         Args:
             workflow: ResearchWorkflow state machine
+            use_cache: Reuse exit validation results while the validator's
+                input files are unchanged
+            engine: Execution engine that queues phase agents as jobs
+                (None: execute_phase only reports which agent to run)
+            persist_cache: Keep cached validation results in
+                .research_workflow/validation_cache.json under the project
+                root, so later orchestrators reuse them (default: in memory)
         """
         self.workflow = workflow
         self.context = workflow.context
+        self.engine = engine
+        cache_file = self.context.project_root / ".research_workflow" / "validation_cache.json"
+        self.validation_cache = ValidationCache(
+            cache_file if persist_cache else None
+        ) if use_cache else None
+        self.output_index = PhaseOutputIndex(self.context.project_root)
 
     def get_validator(self, phase: ResearchPhase) -> Optional[object]:
         """Get validator for a specific phase"""
@@ -103,16 +124,26 @@ class WorkflowOrchestrator:
         """
         validator = self.get_validator(phase)
         if validator:
+            if self.validation_cache is not None:
+                return self.validation_cache.can_exit(validator)
             return validator.can_exit()
 
-        # No validator = assume complete if in phase history
-        is_complete = self.context.has_completed_phase(phase)
+        # No validator = assume complete if in phase history,
+        # or once every agent job queued for the phase has succeeded
+        is_complete = self.context.has_completed_phase(phase) or self._phase_jobs_succeeded(phase)
         return ValidationResult(
             passed=is_complete,
             score=1.0 if is_complete else 0.0,
             warnings=["No validator for this phase"]
         )
 
+    def _phase_jobs_succeeded(self, phase: ResearchPhase) -> bool:
+        """Whether the engine ran the phase's agent jobs and all of them succeeded"""
+        if self.engine is None:
+            return False
+        jobs = self.engine.phase_jobs(self.context.project_root, phase)
+        return bool(jobs) and all(job.status == JobStatus.SUCCEEDED for job in jobs)
+
     def can_progress(self) -> bool:
         """
         Check if workflow can progress to next phase.
@@ -167,10 +198,24 @@ class WorkflowOrchestrator:
                 "mode": self.context.mode.value
             }
 
-        # In actual implementation, would invoke agent here via Claude Code
-        # For now, return agent invocation info
         logger.info(f"Phase {phase.value} uses agent: {agent}")
 
+        if self.engine is not None:
+            # Queued jobs run when the engine runs (ExecutionEngine.run)
+            job_ids = self.engine.submit_phase(self.context, phase, agent)
+            self.context.add_audit_entry(
+                "phase_jobs_queued",
+                {"phase": phase.value, "agent": agent, "jobs": job_ids}
+            )
+            return {
+                "success": True,
+                "phase": phase.value,
+                "agent": agent,
+                "jobs": job_ids,
+                "message": f"Queued {len(job_ids)} job(s) for agent {agent}",
+                "mode": self.context.mode.value
+            }
+
         return {
             "success": True,
             "phase": phase.value,
@@ -203,8 +248,7 @@ class WorkflowOrchestrator:
                 "validation": validation
             }
 
-        # Mark current phase as complete
-        # Get outputs (simplified - would scan output directories in real implementation)
+        # Mark current phase as complete, with the outputs found on disk
         outputs = self._get_phase_outputs(current_phase)
         self.context.complete_phase(validation, outputs)
 
@@ -213,6 +257,9 @@ class WorkflowOrchestrator:
 
         if success:
             new_phase = ResearchPhase(self.workflow.current_state.value)
+            # State transitions only audit; record the new phase so the next
+            # complete_phase() closes the right PhaseRecord
+            self.context.start_phase(new_phase, agent=self.get_agent(new_phase))
             logger.info(f"Advanced from {current_phase.value} to {new_phase.value}")
 
             return {
@@ -233,25 +280,11 @@ class WorkflowOrchestrator:
         """
         Get list of outputs for a phase.
 
-        In real implementation, would scan project directories.
-        For now, returns placeholder based on phase.
+        Returns the files currently in the phase's configured output
+        locations (see phase_outputs.PHASE_OUTPUT_PATHS), from an index
+        that is updated incrementally rather than re-walked.
         """
-        output_map = {
-            ResearchPhase.PROBLEM_FORMULATION: ["docs/problem_statement.md"],
-            ResearchPhase.LITERATURE_REVIEW: [
-                "data/literature/search_results.csv",
-                "data/literature/included_studies.csv"
-            ],
-            ResearchPhase.GAP_ANALYSIS: ["docs/gap_analysis.md"],
-            ResearchPhase.HYPOTHESIS_FORMATION: ["docs/hypotheses.md"],
-            ResearchPhase.EXPERIMENTAL_DESIGN: [
-                "docs/experimental_protocol.md",
-                "docs/power_analysis.md",
-                "code/randomization.py"
-            ],
-        }
-
-        return output_map.get(phase, [f"output_{phase.value}.md"])
+        return self.output_index.outputs(phase)
 
     def get_workflow_status(self) -> Dict:
         """Get current workflow status"""
@@ -273,12 +306,24 @@ class WorkflowOrchestrator:
             "total_phases": len(list(ResearchPhase))
         }
 
+    def close(self):
+        """Release the output index's directory watches"""
+        self.output_index.close()
+
+    def __enter__(self) -> "WorkflowOrchestrator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 
 def create_orchestrator(
     research_question: str,
     domain: str = "",
     mode: Mode = Mode.ASSISTANT,
-    project_root: Optional[Path] = None
+    project_root: Optional[Path] = None,
+    engine: Optional[ExecutionEngine] = None,
+    persist_cache: bool = False
 ) -> WorkflowOrchestrator:
     """
     Create a new workflow orchestrator.
@@ -288,6 +333,8 @@ def create_orchestrator(
         domain: Research domain
         mode: Operation mode (ASSISTANT or AUTONOMOUS)
         project_root: Project root directory
+        engine: Execution engine for phase agents
+        persist_cache: Persist validation results under the project root
 
     Returns:
         Initialized WorkflowOrchestrator
@@ -301,7 +348,86 @@ def create_orchestrator(
         project_root=project_root
     )
 
-    return WorkflowOrchestrator(workflow)
+    return WorkflowOrchestrator(workflow, engine=engine, persist_cache=persist_cache)
+
+
+async def drive_autonomous(
+    orchestrators: List[WorkflowOrchestrator],
+    engine: ExecutionEngine
+) -> Dict[str, str]:
+    """
+    Advance many autonomous-mode projects through their agent phases at once.
+
+    Each project's current phase is queued on the engine. As soon as the
+    last job of a project's phase finishes, that project is validated,
+    advanced and its next phase queued, without waiting for other
+    projects. A project stops at a phase that needs a human, a failed job
+    or a failed validation. Projects in assistant mode are skipped, since
+    they advance only with human approval. Each project's state is saved
+    after every advance and whenever its jobs are queued, so state.json
+    (and the registry that indexes it) stays current if the run stops.
+
+    Args:
+        orchestrators: One orchestrator per project, sharing ``engine``
+        engine: Execution engine that runs the agent jobs
+
+    Returns:
+        Phase each project stopped in, by workflow ID
+    """
+    by_root = {}
+    outstanding: Dict[str, set] = {}
+
+    def advance(orchestrator: WorkflowOrchestrator) -> bool:
+        success = orchestrator.advance_workflow()["success"]
+        orchestrator.workflow.save_state()
+        return success
+
+    def queue(orchestrator: WorkflowOrchestrator):
+        root = str(orchestrator.context.project_root)
+        while True:
+            result = orchestrator.execute_phase()
+            orchestrator.workflow.save_state()
+            if not result.get("jobs"):
+                return  # Needs a human, or entry requirements not met
+            statuses = engine.store.statuses(result["jobs"])
+            remaining = {
+                job_id for job_id, status in statuses.items() if status != JobStatus.SUCCEEDED
+            }
+            if remaining:
+                outstanding[root] = remaining
+                return
+            # Phase already ran (resumed run): advance straight away
+            if not advance(orchestrator):
+                return
+
+    def on_finished(job: AgentJob):
+        remaining = outstanding.get(job.project_root)
+        if remaining is None or job.job_id not in remaining:
+            return
+        if job.status == JobStatus.FAILED:
+            logger.warning(f"Stopping {job.project_root}: {job.agent} failed: {job.error}")
+            del outstanding[job.project_root]
+            return
+        remaining.discard(job.job_id)
+        if not remaining:
+            del outstanding[job.project_root]
+            orchestrator = by_root[job.project_root]
+            if advance(orchestrator):
+                queue(orchestrator)
+
+    for orchestrator in orchestrators:
+        if orchestrator.context.mode != Mode.AUTONOMOUS:
+            logger.info(f"Skipping {orchestrator.context.workflow_id}: not in autonomous mode")
+            continue
+        by_root[str(orchestrator.context.project_root)] = orchestrator
+        queue(orchestrator)
+
+    await engine.run(on_finished)
+
+    return {
+        orchestrator.context.workflow_id: orchestrator.workflow.current_state.value
+        for orchestrator in orchestrators
+    }
 
 
 if __name__ == "__main__":
@@ -0,0 +1,508 @@
+"""
+Phase Output Index
+
+Discovers the files each research phase produced by scanning its
+configured output locations, and keeps a manifest of them (path, size,
+mtime, SHA-256) up to date incrementally instead of re-walking the
+project on every phase advance.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+import hashlib
+import json
+import logging
+import os
+import stat
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from workflow_context import ResearchPhase, _write_json_atomic
+
+# Optional: inotify_simple reports changes as they happen (Linux only);
+# without it every refresh re-checks mtimes
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
+logger = logging.getLogger(__name__)
+
+# Output locations of each phase, relative to project root.
+# Entries ending in "/" are directories, indexed recursively.
+PHASE_OUTPUT_PATHS: Dict[ResearchPhase, List[str]] = {
+    ResearchPhase.PROBLEM_FORMULATION: ["docs/problem_statement.md"],
+    ResearchPhase.LITERATURE_REVIEW: [
+        "data/literature/",
+        "results/prisma_flow_diagram.md",
+        "results/risk_of_bias_assessment.csv"
+    ],
+    ResearchPhase.GAP_ANALYSIS: ["docs/gap_analysis.md", "data/gap_matrix.csv"],
+    ResearchPhase.HYPOTHESIS_FORMATION: [
+        "docs/hypotheses.md",
+        "docs/hypothesis_generation_log.md",
+        "docs/falsifiability_statements.md"
+    ],
+    ResearchPhase.EXPERIMENTAL_DESIGN: [
+        "docs/experimental_design_rationale.md",
+        "docs/experimental_protocol.md",
+        "docs/power_analysis.md",
+        "docs/data_management_plan.md",
+        "code/randomization.py",
+        "data/preregistration.md"
+    ],
+    ResearchPhase.IRB_APPROVAL: ["docs/irb_approval.pdf", "docs/consent_forms.pdf"],
+    ResearchPhase.DATA_COLLECTION: ["data/raw/", "data/data_quality_log.csv"],
+    ResearchPhase.ANALYSIS: [
+        "code/analysis/",
+        "results/primary_results.json",
+        "results/assumption_tests.csv",
+        "results/effect_sizes.csv"
+    ],
+    ResearchPhase.INTERPRETATION: ["docs/interpretation.md", "docs/limitations.md"],
+    ResearchPhase.WRITING: ["docs/manuscript/", "results/figures/", "results/tables/"],
+    ResearchPhase.PUBLICATION: ["docs/publication/"],
+}
+
+# Manifest of a project, relative to its root
+MANIFEST_FILE = Path(".research_workflow") / "outputs_manifest.json"
+
+MANIFEST_VERSION = "1"
+
+# Files and directories modified this close to a scan may change again
+# within the same mtime tick, so they are re-checked instead of trusted
+RACY_WINDOW_NS = 2_000_000_000
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class OutputRecord:
+    """One indexed output file"""
+    path: str  # relative to project root, '/' separated
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+class PhaseOutputIndex:
+    """
+    Manifest of the output files of each research phase.
+
+    The first refresh walks each phase's configured locations, hashing
+    every file. Later refreshes are incremental:
+
+    - With inotify_simple installed, every indexed directory is watched;
+      a refresh reads pending events and re-checks only the files and
+      directories they name. A location with a directory that could not
+      be watched (e.g. ``max_user_watches`` reached) is checked by mtime.
+    - Otherwise (or on the first refresh of a new process) a refresh
+      stats the indexed files and directories, re-lists only directories
+      whose mtime changed, and re-hashes only files whose size or mtime
+      changed.
+
+    A file or directory indexed within the same mtime tick as its last
+    change could change again unnoticed, so it is re-checked until it has
+    been indexed with an older mtime. The manifest is saved to
+    ``.research_workflow/outputs_manifest.json``, so a new process starts
+    from it rather than re-hashing everything.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        output_paths: Optional[Dict[ResearchPhase, List[str]]] = None,
+        manifest_path: Optional[Path] = None,
+        use_inotify: bool = True
+    ):
+        """
+        Initialize index.
+
+        Args:
+            project_root: Project root directory
+            output_paths: Output locations per phase (default: PHASE_OUTPUT_PATHS)
+            manifest_path: Manifest file (default: .research_workflow/outputs_manifest.json)
+            use_inotify: Watch directories with inotify when available
+        """
+        self.project_root = Path(project_root)
+        self.output_paths = output_paths if output_paths is not None else PHASE_OUTPUT_PATHS
+        self.manifest_path = (
+            Path(manifest_path) if manifest_path else self.project_root / MANIFEST_FILE
+        )
+        self.use_inotify = use_inotify and inotify_simple is not None
+
+        self._files: Dict[str, OutputRecord] = {}
+        self._racy_files: Set[str] = set()
+        self._dirs: Dict[str, dict] = {}  # rel dir -> {"mtime_ns", "racy", "files", "dirs"}
+        self._loaded = False
+        self._changed = False
+
+        self._inotify = None
+        self._watches: Dict[int, str] = {}  # watch descriptor -> rel dir
+        self._watched_dirs: Dict[str, int] = {}  # rel dir -> watch descriptor
+        self._watch_errors: Set[str] = set()  # dirs that exist but could not be watched
+
+    def outputs(self, phase: ResearchPhase) -> List[str]:
+        """
+        Output files of a phase that currently exist.
+
+        Args:
+            phase: Research phase
+
+        Returns:
+            Sorted paths relative to project root
+        """
+        return [record.path for record in self.records(phase)]
+
+    def records(self, phase: ResearchPhase) -> List[OutputRecord]:
+        """
+        Manifest records of a phase's current output files.
+
+        Args:
+            phase: Research phase
+
+        Returns:
+            Records sorted by path
+        """
+        self.refresh([phase])
+        entries = self.output_paths.get(phase, [])
+        return sorted(
+            (record for path, record in self._files.items()
+             if any(_covers(entry, path) for entry in entries)),
+            key=lambda record: record.path
+        )
+
+    def refresh(self, phases: Optional[Iterable[ResearchPhase]] = None):
+        """
+        Bring the manifest up to date with the project.
+
+        Args:
+            phases: Phases whose locations to check (default: all).
+                While inotify is watching, pending events are applied for
+                every phase regardless.
+        """
+        self._load()
+
+        if self.use_inotify and self._inotify is None:
+            self._start_watching()
+
+        if self._inotify is not None:
+            self._apply_events()
+            # Locations that do not exist yet, or whose watches could not
+            # all be added, are checked by mtime instead
+            entries = [
+                entry for entry in self._entries(None) if not self._fully_watched(entry)
+            ]
+        else:
+            entries = self._entries(phases)
+
+        for entry in entries:
+            self._refresh_entry(entry)
+
+        if self._changed:
+            self._save()
+
+    def close(self):
+        """Stop watching directories"""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+            self._watches.clear()
+            self._watched_dirs.clear()
+
+    def _fully_watched(self, entry: str) -> bool:
+        """Whether every directory that reports changes to a location is watched"""
+        target = _watch_target(entry)
+        ancestor = os.path.dirname(target)
+        while ancestor:
+            if ancestor not in self._watched_dirs:
+                return False
+            ancestor = os.path.dirname(ancestor)
+        if target and target not in self._watched_dirs:
+            return False
+        prefix = target + "/"
+        return all(
+            rel in self._watched_dirs for rel in self._dirs
+            if rel == target or rel.startswith(prefix)
+        )
+
+    def _entries(self, phases: Optional[Iterable[ResearchPhase]]) -> List[str]:
+        selected = list(phases) if phases is not None else list(self.output_paths)
+        entries = []
+        for phase in selected:
+            for entry in self.output_paths.get(phase, []):
+                if entry not in entries:
+                    entries.append(entry)
+        return entries
+
+    def _refresh_entry(self, entry: str):
+        """Re-check one configured location"""
+        # Watching ancestors reports a move of any directory above the entry
+        ancestor = os.path.dirname(_watch_target(entry))
+        while ancestor:
+            self._watch(ancestor)
+            ancestor = os.path.dirname(ancestor)
+
+        if _is_dir_entry(entry):
+            self._scan_dir(entry.rstrip("/"), recursive=True)
+        else:
+            self._watch(_watch_target(entry))
+            self._update_file(entry)
+
+    def _scan_dir(self, rel: str, recursive: bool, force: bool = False):
+        """
+        Index a directory's files, re-listing it only if its mtime changed.
+
+        Args:
+            rel: Directory relative to project root
+            recursive: Also check subdirectories that were already indexed
+            force: Re-list even if the directory's mtime is unchanged
+        """
+        path = self.project_root / rel
+        # Watch before listing, so nothing created after the listing is missed
+        self._watch(rel)
+        listed_at_ns = time.time_ns()
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._drop_dir(rel)
+            return
+        if not stat.S_ISDIR(st.st_mode):
+            self._drop_dir(rel)
+            return
+
+        known = self._dirs.get(rel)
+        if (
+            not force and known is not None and not known["racy"]
+            and known["mtime_ns"] == st.st_mtime_ns
+        ):
+            files, subdirs = known["files"], known["dirs"]
+        else:
+            files, subdirs = [], []
+            with os.scandir(path) as it:
+                for dir_entry in it:
+                    if dir_entry.name.startswith("."):
+                        continue
+                    if dir_entry.is_dir(follow_symlinks=False):
+                        subdirs.append(dir_entry.name)
+                    elif dir_entry.is_file():
+                        files.append(dir_entry.name)
+            files.sort()
+            subdirs.sort()
+
+            if known is not None:
+                for name in set(known["files"]) - set(files):
+                    self._drop_file(_join(rel, name))
+                for name in set(known["dirs"]) - set(subdirs):
+                    self._drop_dir(_join(rel, name))
+            self._dirs[rel] = {
+                "mtime_ns": st.st_mtime_ns,
+                "racy": st.st_mtime_ns >= listed_at_ns - RACY_WINDOW_NS,
+                "files": files,
+                "dirs": subdirs
+            }
+            self._changed = True
+
+        for name in files:
+            self._update_file(_join(rel, name))
+        for name in subdirs:
+            # Subdirectories not indexed yet (new, or dropped by an event) are always scanned
+            if recursive or _join(rel, name) not in self._dirs:
+                self._scan_dir(_join(rel, name), recursive=True)
+
+    def _update_file(self, rel: str):
+        """Re-index one file, hashing it only if its size or mtime changed"""
+        path = self.project_root / rel
+        checked_at_ns = time.time_ns()
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._drop_file(rel)
+            return
+        if not stat.S_ISREG(st.st_mode):
+            self._drop_file(rel)
+            return
+
+        record = self._files.get(rel)
+        if (
+            record is not None and rel not in self._racy_files
+            and record.size == st.st_size and record.mtime_ns == st.st_mtime_ns
+        ):
+            return
+
+        try:
+            digest = _hash_file(path)
+        except FileNotFoundError:
+            self._drop_file(rel)
+            return
+        self._files[rel] = OutputRecord(rel, st.st_size, st.st_mtime_ns, digest)
+        if st.st_mtime_ns >= checked_at_ns - RACY_WINDOW_NS:
+            self._racy_files.add(rel)
+        else:
+            self._racy_files.discard(rel)
+        if record != self._files[rel] or rel in self._racy_files:
+            self._changed = True
+
+    def _drop_file(self, rel: str):
+        self._racy_files.discard(rel)
+        if self._files.pop(rel, None) is not None:
+            self._changed = True
+
+    def _drop_dir(self, rel: str):
+        """Forget a directory and everything indexed under it"""
+        prefix = rel + "/"
+        for path in [p for p in self._files if p.startswith(prefix)]:
+            self._drop_file(path)
+        for path in [d for d in self._dirs if d == rel or d.startswith(prefix)]:
+            del self._dirs[path]
+            self._changed = True
+        for watched in [d for d in self._watched_dirs if d == rel or d.startswith(prefix)]:
+            wd = self._watched_dirs.pop(watched)
+            del self._watches[wd]
+            try:
+                self._inotify.rm_watch(wd)
+            except OSError:
+                pass  # Directory already gone
+
+    def _start_watching(self):
+        try:
+            self._inotify = inotify_simple.INotify()
+        except OSError as e:
+            logger.warning(f"inotify unavailable, falling back to mtime scans: {e}")
+            self.use_inotify = False
+
+    def _watch(self, rel: str):
+        """Watch a directory for changes (no-op without inotify)"""
+        if self._inotify is None or rel in self._watched_dirs:
+            return
+        flags = inotify_simple.flags
+        try:
+            wd = self._inotify.add_watch(
+                str(self.project_root / rel),
+                flags.CREATE | flags.DELETE | flags.MODIFY | flags.CLOSE_WRITE
+                | flags.ATTRIB | flags.MOVED_FROM | flags.MOVED_TO | flags.MOVE_SELF
+                | flags.ONLYDIR
+            )
+        except (FileNotFoundError, NotADirectoryError):
+            return  # Missing; stat'ed on each refresh until it appears
+        except OSError as e:
+            # Typically max_user_watches reached; the location containing
+            # this directory is then checked by mtime on every refresh
+            if rel not in self._watch_errors:
+                self._watch_errors.add(rel)
+                logger.warning(f"Cannot watch {rel or '.'}, checking it by mtime instead: {e}")
+            return
+        self._watch_errors.discard(rel)
+        # A moved directory keeps its watch descriptor
+        self._watched_dirs.pop(self._watches.get(wd), None)
+        self._watches[wd] = rel
+        self._watched_dirs[rel] = wd
+
+    def _apply_events(self):
+        """Re-check what pending inotify events name"""
+        flags = inotify_simple.flags
+        dirty_dirs = set()
+        for event in self._inotify.read(timeout=0):
+            if event.mask & flags.Q_OVERFLOW:
+                logger.warning("inotify queue overflowed, rescanning all outputs")
+                for entry in self._entries(None):
+                    self._refresh_entry(entry)
+                return
+            if event.mask & flags.IGNORED:
+                # Watched directory deleted (or its watch removed by _drop_dir)
+                rel = self._watches.pop(event.wd, None)
+                if rel is not None:
+                    self._watched_dirs.pop(rel, None)
+                    self._drop_dir(rel)
+                continue
+
+            if event.mask & flags.MOVE_SELF:
+                # The watch follows the directory, so its path is stale
+                rel = self._watches.get(event.wd)
+                if rel is not None:
+                    self._drop_dir(rel)
+                continue
+
+            rel_dir = self._watches.get(event.wd)
+            if rel_dir is None or not event.name:
+                continue
+            rel = _join(rel_dir, event.name)
+            listing_changed = event.mask & (
+                flags.ISDIR | flags.CREATE | flags.DELETE | flags.MOVED_FROM | flags.MOVED_TO
+            )
+            if rel_dir in self._dirs and listing_changed:
+                dirty_dirs.add(rel_dir)
+            elif any(_covers(entry, rel) for entry in self._entries(None)):
+                self._update_file(rel)
+
+        for rel_dir in sorted(dirty_dirs):
+            self._scan_dir(rel_dir, recursive=False, force=True)
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable output manifest {self.manifest_path}: {e}")
+            return
+        if data.get("version") != MANIFEST_VERSION:
+            return
+        self._files = {
+            path: OutputRecord(path, *values) for path, values in data.get("files", {}).items()
+        }
+        self._racy_files = set(data.get("racy_files", []))
+        self._dirs = data.get("dirs", {})
+
+    def _save(self):
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_json_atomic(self.manifest_path, {
+                "version": MANIFEST_VERSION,
+                "files": {
+                    path: [r.size, r.mtime_ns, r.sha256]
+                    for path, r in sorted(self._files.items())
+                },
+                "racy_files": sorted(self._racy_files),
+                "dirs": self._dirs
+            })
+            self._changed = False
+        except OSError as e:
+            logger.warning(f"Cannot write output manifest {self.manifest_path}: {e}")
+
+
+def _is_dir_entry(entry: str) -> bool:
+    return entry.endswith("/")
+
+
+def _covers(entry: str, path: str) -> bool:
+    """Whether a configured location contains (or is) a file path"""
+    if _is_dir_entry(entry):
+        return path.startswith(entry)
+    return path == entry
+
+
+def _watch_target(entry: str) -> str:
+    """Directory whose watch reports changes to a configured location"""
+    if _is_dir_entry(entry):
+        return entry.rstrip("/")
+    return os.path.dirname(entry)
+
+
+def _join(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
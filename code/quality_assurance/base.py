@@ -6,11 +6,14 @@ Core classes and utilities for quality assurance validation.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import IO, List, Optional, Dict, Any, Set, Tuple
 from pathlib import Path
 from enum import Enum
 import logging
 
+from .code_index import CodeIndex, ModuleIndex
+from .file_index import ProjectSnapshot, text_sha256
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +37,7 @@ class ValidationResult:
         details: Additional details (dict)
         timestamp: When check was performed
         category: Validation category (reproducibility, citation, statistical)
+        cached: Served from the incremental QA cache rather than re-run
     """
     check_name: str
     status: ValidationStatus
@@ -41,6 +45,7 @@ class ValidationResult:
     details: Optional[Dict[str, Any]] = None
     timestamp: datetime = field(default_factory=datetime.now)
     category: str = "general"
+    cached: bool = False
 
     def is_passing(self) -> bool:
         """Check if validation passed."""
@@ -62,9 +67,23 @@ class ValidationResult:
             "message": self.message,
             "details": self.details,
             "timestamp": self.timestamp.isoformat(),
-            "category": self.category
+            "category": self.category,
+            "cached": self.cached
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ValidationResult":
+        """Rebuild a result from to_dict() output."""
+        return cls(
+            check_name=data["check_name"],
+            status=ValidationStatus(data["status"]),
+            message=data["message"],
+            details=data.get("details"),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            category=data.get("category", "general"),
+            cached=data.get("cached", False)
+        )
+
 
 @dataclass
 class QAReport:
@@ -76,11 +95,13 @@ class QAReport:
         project: Project name/path
         phase: Research phase (optional)
         results: All validation results
+        validator_timings: Wall time in seconds per validator
     """
     timestamp: datetime
     project: str
     phase: Optional[str] = None
     results: List[ValidationResult] = field(default_factory=list)
+    validator_timings: Dict[str, float] = field(default_factory=dict)
 
     @property
     def total_checks(self) -> int:
@@ -107,6 +128,11 @@ class QAReport:
         """Number of skipped checks."""
         return sum(1 for r in self.results if r.status == ValidationStatus.SKIPPED)
 
+    @property
+    def cached_checks(self) -> List[str]:
+        """Names of checks served from the incremental QA cache."""
+        return [r.check_name for r in self.results if r.cached]
+
     @property
     def status(self) -> ValidationStatus:
         """Overall report status."""
@@ -144,6 +170,12 @@ class QAReport:
             f"",
         ])
 
+        if self.validator_timings:
+            lines.extend(["## Validator Timings", ""])
+            for name, seconds in self.validator_timings.items():
+                lines.append(f"- {name}: {seconds:.2f}s")
+            lines.append("")
+
         # Group by category
         categories = set(r.category for r in self.results)
 
@@ -167,6 +199,8 @@ class QAReport:
                 lines.append(f"")
                 lines.append(f"**Status:** {result.status.value}")
                 lines.append(f"**Message:** {result.message}")
+                if result.cached:
+                    lines.append("**Source:** cached")
 
                 if result.details:
                     lines.append(f"")
@@ -190,8 +224,10 @@ class QAReport:
                 "warnings": self.warnings,
                 "errors": self.errors,
                 "skipped": self.skipped,
+                "cached": len(self.cached_checks),
                 "status": self.status.value,
             },
+            "validator_timings": self.validator_timings,
             "results": [r.to_dict() for r in self.results],
         }
 
@@ -212,20 +248,42 @@ class BaseValidator:
     Base class for all validators.
 
     Provides common validation patterns and utilities.
+
+    Subclasses bump VERSION whenever their checks change, which invalidates
+    results cached by incremental QA runs. Subclasses that QAManager may run
+    in a worker process list the globs they read in READ_PATTERNS, so those
+    files are loaded into the shared snapshot before the process starts.
     """
 
-    def __init__(self, project_root: Path, config: Optional[Dict] = None):
+    VERSION = "1"
+    READ_PATTERNS: Tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        project_root: Path,
+        config: Optional[Dict] = None,
+        snapshot: Optional["ProjectSnapshot"] = None
+    ):
         """
         Initialize validator.
 
         Args:
             project_root: Project root directory
             config: Configuration dictionary
+            snapshot: Shared file index; if None, the filesystem is used directly
         """
         self.project_root = Path(project_root)
         self.config = config or {}
+        self.snapshot = snapshot
         self.results: List[ValidationResult] = []
 
+        # AST index of Python sources; QAManager shares a persistent one
+        self.code_index: Optional[CodeIndex] = None
+
+        # Inputs consulted since the last clear_results(), for incremental QA
+        self._input_globs: Dict[str, List[str]] = {}
+        self._input_files: Set[str] = set()
+
     def add_result(
         self,
         check_name: str,
@@ -273,6 +331,39 @@ class BaseValidator:
     def clear_results(self):
         """Clear all validation results."""
         self.results = []
+        self._input_globs = {}
+        self._input_files = set()
+
+    def _relative_key(self, filepath: Path) -> Optional[str]:
+        """POSIX path relative to project_root, or None if outside it."""
+        try:
+            return Path(filepath).relative_to(self.project_root).as_posix()
+        except ValueError:
+            return None
+
+    def input_manifest(self) -> Dict[str, Any]:
+        """
+        Describe the inputs consulted by the last validate() run.
+
+        Returns:
+            Dict with ``globs`` (pattern -> matched relative paths) and
+            ``files`` (relative path -> SHA-256 of contents, None if missing)
+        """
+        files = {}
+        for rel in sorted(self._input_files):
+            path = self.project_root / rel
+            files[rel] = self.snapshot.sha256(path) if self.snapshot is not None \
+                else text_sha256(path)
+        return {"globs": dict(self._input_globs), "files": files}
+
+    def cache_ttl(self) -> Optional[float]:
+        """
+        Seconds cached results stay valid regardless of inputs.
+
+        None means results only depend on inputs and config. Validators
+        that consult external services override this.
+        """
+        return None
 
     def get_results(self) -> List[ValidationResult]:
         """Get all validation results."""
@@ -302,6 +393,10 @@ class BaseValidator:
         """
         if relative:
             filepath = self.project_root / filepath
+
+        rel = self._relative_key(filepath)
+        if rel is not None:
+            self._input_files.add(rel)
         return filepath.exists()
 
     def read_file(self, filepath: Path, relative: bool = True) -> Optional[str]:
@@ -318,6 +413,13 @@ class BaseValidator:
         if relative:
             filepath = self.project_root / filepath
 
+        rel = self._relative_key(filepath)
+        if rel is not None:
+            self._input_files.add(rel)
+
+        if self.snapshot is not None:
+            return self.snapshot.read(filepath)
+
         if not filepath.exists():
             return None
 
@@ -327,6 +429,44 @@ class BaseValidator:
             logger.error(f"Error reading {filepath}: {e}")
             return None
 
+    def open_file(self, filepath: Path, relative: bool = True) -> Optional[IO[bytes]]:
+        """
+        Open a file for streaming reads, bypassing the snapshot's content cache.
+
+        Args:
+            filepath: File path
+            relative: If True, resolve relative to project_root
+
+        Returns:
+            Binary file object (caller closes it) or None if it can't be opened
+        """
+        if relative:
+            filepath = self.project_root / filepath
+
+        rel = self._relative_key(filepath)
+        if rel is not None:
+            self._input_files.add(rel)
+
+        try:
+            return open(filepath, "rb")
+        except OSError as e:
+            logger.error(f"Error opening {filepath}: {e}")
+            return None
+
+    def index_code(self, source: str) -> ModuleIndex:
+        """
+        Get the import/call index of Python source.
+
+        Args:
+            source: Python source code
+
+        Returns:
+            ModuleIndex (check ``parsed`` before relying on it)
+        """
+        if self.code_index is None:
+            self.code_index = CodeIndex()
+        return self.code_index.get(source)
+
     def find_files(self, pattern: str) -> List[Path]:
         """
         Find files matching glob pattern.
@@ -337,7 +477,15 @@ class BaseValidator:
         Returns:
             List of matching file paths
         """
-        return list(self.project_root.glob(pattern))
+        if self.snapshot is not None:
+            matches = self.snapshot.find_files(pattern)
+        else:
+            matches = list(self.project_root.glob(pattern))
+
+        self._input_globs[pattern] = sorted(
+            rel for rel in (self._relative_key(p) for p in matches) if rel is not None
+        )
+        return matches
 
 
 class QAException(Exception):
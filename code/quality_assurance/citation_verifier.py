@@ -6,16 +6,123 @@ Validates citations for accuracy, retraction status, and completeness.
 
 from pathlib import Path
 from typing import List, Optional, Dict, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import re
 import requests
+import requests.adapters
+import threading
 import time
 import logging
 from datetime import datetime, timedelta
 
 from .base import BaseValidator, ValidationResult, ValidationStatus
+from .file_index import ProjectSnapshot
+from .doi_store import DOIMetadataStore, DEFAULT_STORE_PATH
 
 logger = logging.getLogger(__name__)
 
+# Crossref public pool defaults until the API reports its own limits
+CROSSREF_DEFAULT_RATE_LIMIT = 20
+CROSSREF_DEFAULT_RATE_INTERVAL = 1.0
+CROSSREF_MAX_RETRIES = 3
+
+
+def extract_dois(entries: List[Dict]) -> List[Tuple[str, str]]:
+    """
+    Extract (key, DOI) pairs from BibTeX entries.
+
+    Args:
+        entries: Parsed BibTeX entries
+
+    Returns:
+        List of (citation key, cleaned DOI) tuples
+    """
+    dois = []
+    for entry in entries:
+        doi = entry.get("doi", "").strip()
+        if doi:
+            # Clean DOI (remove URL prefix if present)
+            doi = doi.replace("https://doi.org/", "").replace("http://dx.doi.org/", "")
+            dois.append((entry["key"], doi))
+    return dois
+
+
+def _header(headers, name: str) -> Optional[str]:
+    """Read a response header, ignoring anything that is not a string."""
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    return value if isinstance(value, str) else None
+
+
+def _parse_seconds(value) -> Optional[float]:
+    """Parse a header value like "1s", "60" or "500ms" into seconds."""
+    if not isinstance(value, str):
+        return None
+    value = value.strip().lower()
+    try:
+        if value.endswith("ms"):
+            return float(value[:-2]) / 1000.0
+        if value.endswith("s"):
+            return float(value[:-1])
+        return float(value)
+    except ValueError:
+        return None
+
+
+class CrossrefRateLimiter:
+    """
+    Thread-safe request spacer driven by Crossref's rate limit headers.
+
+    Crossref reports its current allowance as ``X-Rate-Limit-Limit`` requests
+    per ``X-Rate-Limit-Interval``. Each call to :meth:`wait` reserves the next
+    free slot, so concurrent workers never exceed the advertised rate.
+    """
+
+    def __init__(
+        self,
+        limit: int = CROSSREF_DEFAULT_RATE_LIMIT,
+        interval: float = CROSSREF_DEFAULT_RATE_INTERVAL
+    ):
+        self.limit = limit
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def spacing(self) -> float:
+        """Minimum seconds between consecutive requests."""
+        return self.interval / max(self.limit, 1)
+
+    def wait(self):
+        """Block until the caller may issue its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.spacing
+        if slot > now:
+            time.sleep(slot - now)
+
+    def update(self, headers) -> None:
+        """Adopt the limits advertised in a Crossref response."""
+        try:
+            limit = headers.get("X-Rate-Limit-Limit")
+            interval = _parse_seconds(headers.get("X-Rate-Limit-Interval"))
+        except AttributeError:
+            return
+
+        with self._lock:
+            if isinstance(limit, str) and limit.strip().isdigit() and int(limit) > 0:
+                self.limit = int(limit)
+            if interval and interval > 0:
+                self.interval = interval
+
+    def back_off(self, seconds: float):
+        """Hold all workers for ``seconds`` (e.g. after HTTP 429)."""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
 
 class CitationVerifier(BaseValidator):
     """
@@ -28,7 +135,12 @@ class CitationVerifier(BaseValidator):
     - Citation completeness
     """
 
-    def __init__(self, project_root: Path, config: Optional[Dict] = None):
+    def __init__(
+        self,
+        project_root: Path,
+        config: Optional[Dict] = None,
+        snapshot: Optional[ProjectSnapshot] = None
+    ):
         """
         Initialize citation verifier.
 
@@ -41,8 +153,13 @@ class CitationVerifier(BaseValidator):
                 - require_recent_papers: Require recent literature
                 - recent_paper_threshold_years: Years threshold for "recent"
                 - crossref_email: Email for Crossref API (polite pool)
+                - crossref_max_workers: Concurrent Crossref lookups
+                - doi_cache: Persist Crossref records across runs
+                - doi_cache_path: SQLite file (default .research_workflow/doi_cache.sqlite)
+                - retraction_ttl_days: Days before retraction status is rechecked
+            snapshot: Shared project file index (optional)
         """
-        super().__init__(project_root, config)
+        super().__init__(project_root, config, snapshot)
 
         cfg = config or {}
         self.check_retractions = cfg.get("check_retractions", True)
@@ -51,6 +168,19 @@ class CitationVerifier(BaseValidator):
         self.require_recent_papers = cfg.get("require_recent_papers", True)
         self.recent_threshold_years = cfg.get("recent_paper_threshold_years", 5)
         self.crossref_email = cfg.get("crossref_email", None)
+        self.crossref_max_workers = max(1, int(cfg.get("crossref_max_workers", 5)))
+
+        # Shared by all lookups so concurrent workers respect one rate limit
+        self.rate_limiter = CrossrefRateLimiter()
+        self._session: Optional[requests.Session] = None
+
+        # Cross-run store shared with the citation-management MCP server
+        self.doi_store: Optional[DOIMetadataStore] = None
+        if cfg.get("doi_cache", True):
+            self.doi_store = DOIMetadataStore(
+                Path(cfg.get("doi_cache_path", self.project_root / DEFAULT_STORE_PATH)),
+                retraction_ttl=float(cfg.get("retraction_ttl_days", 7)) * 24 * 3600
+            )
 
         # Cache for API results (DOI -> result)
         self.doi_cache: Dict[str, Dict] = {}
@@ -105,6 +235,12 @@ class CitationVerifier(BaseValidator):
 
         return self.get_results()
 
+    def cache_ttl(self) -> Optional[float]:
+        """Cached QA results expire once stored retraction statuses may be stale."""
+        if not (self.validate_dois or self.check_retractions):
+            return None
+        return self.doi_store.retraction_ttl if self.doi_store else 24 * 3600
+
     # ============================================================================
     # BibTeX Parsing
     # ============================================================================
@@ -233,6 +369,142 @@ class CitationVerifier(BaseValidator):
                 details={"count": count, "minimum": self.min_citation_count}
             )
 
+    # ============================================================================
+    # Crossref Access
+    # ============================================================================
+
+    def _get_session(self) -> requests.Session:
+        """Return the pooled HTTP session used for Crossref lookups."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.crossref_max_workers
+            )
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def prefetch_dois(self, dois: List[str]):
+        """
+        Fetch Crossref metadata for every uncached DOI.
+
+        DOIs with a fresh record in the persistent store are served from
+        it. The rest are requested (conditionally, if a stale record exists)
+        on a bounded thread pool sharing one rate limiter, so each DOI is
+        fetched at most once and the result serves both DOI validation and
+        retraction checking.
+
+        Args:
+            dois: DOIs to fetch (duplicates and cached DOIs are skipped)
+        """
+        pending = []
+        for doi in dict.fromkeys(d for d in dois if d not in self.doi_cache):
+            record = self.doi_store.get(doi) if self.doi_store else None
+            if record and record["metadata_fresh"] and (
+                record["retraction_fresh"] or not record["valid"] or not self.check_retractions
+            ):
+                self.doi_cache[doi] = {"valid": record["valid"], "metadata": record["metadata"]}
+            else:
+                pending.append((doi, record))
+
+        if not pending:
+            return
+
+        workers = min(self.crossref_max_workers, len(pending))
+        if workers <= 1:
+            for doi, record in pending:
+                self._store_refresh(doi, *self._refresh_doi(doi, record))
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._refresh_doi, doi, record): doi
+                for doi, record in pending
+            }
+            for future in as_completed(futures):
+                self._store_refresh(futures[future], *future.result())
+
+    def _refresh_doi(self, doi: str, record: Optional[Dict]) -> Tuple[Dict, Optional[str], Optional[Dict]]:
+        """
+        Fetch or revalidate one DOI.
+
+        Returns:
+            (doi_cache entry, store action, response headers) where the
+            action is "fetched", "revalidated" or None for transient errors
+        """
+        fallback = {"valid": record["valid"], "metadata": record["metadata"]} if record else \
+            {"valid": False, "metadata": None}
+
+        try:
+            response = self._request_crossref(doi, DOIMetadataStore.conditional_headers(record))
+
+            if response.status_code == 304 and record:
+                return fallback, "revalidated", None
+            if response.status_code == 200:
+                metadata = response.json().get("message", {})
+                return {"valid": True, "metadata": metadata}, "fetched", response.headers
+            if response.status_code == 404:
+                return {"valid": False, "metadata": None}, "fetched", response.headers
+
+            logger.warning(f"Crossref returned HTTP {response.status_code} for {doi}")
+        except Exception as e:
+            logger.error(f"Error checking DOI {doi}: {e}")
+
+        return fallback, None, None
+
+    def _store_refresh(self, doi: str, entry: Dict, action: Optional[str], headers: Optional[Dict]):
+        """Record a refresh result in memory and, unless transient, on disk."""
+        self.doi_cache[doi] = entry
+        if not self.doi_store or action is None:
+            return
+
+        if action == "revalidated":
+            self.doi_store.mark_revalidated(doi)
+        else:
+            self.doi_store.put(
+                doi,
+                entry["valid"],
+                entry["metadata"],
+                etag=_header(headers, "ETag"),
+                last_modified=_header(headers, "Last-Modified")
+            )
+
+    def _request_crossref(self, doi: str, extra_headers: Optional[Dict[str, str]] = None):
+        """
+        GET a Crossref work record through the pooled session.
+
+        Requests honour the shared rate limiter; HTTP 429 responses are
+        retried after the server's Retry-After delay.
+
+        Args:
+            doi: DOI to request
+            extra_headers: Additional request headers (e.g. conditional)
+
+        Returns:
+            Final requests.Response
+        """
+        url = f"https://api.crossref.org/works/{doi}"
+        headers = dict(extra_headers or {})
+
+        if self.crossref_email:
+            headers["User-Agent"] = f"ResearchAssistant/1.0 (mailto:{self.crossref_email})"
+
+        session = self._get_session()
+
+        for attempt in range(CROSSREF_MAX_RETRIES + 1):
+            self.rate_limiter.wait()
+            response = session.get(url, headers=headers, timeout=10)
+            self.rate_limiter.update(response.headers)
+
+            if response.status_code != 429 or attempt == CROSSREF_MAX_RETRIES:
+                break
+
+            delay = _parse_seconds(_header(response.headers, "Retry-After")) or 2.0 ** attempt
+            self.rate_limiter.back_off(delay)
+
+        return response
+
     # ============================================================================
     # DOI Validation
     # ============================================================================
@@ -242,14 +514,7 @@ class CitationVerifier(BaseValidator):
         check_name = "DOI Validation"
         category = "citation"
 
-        # Extract DOIs
-        dois = []
-        for entry in entries:
-            doi = entry.get("doi", "").strip()
-            if doi:
-                # Clean DOI (remove URL prefix if present)
-                doi = doi.replace("https://doi.org/", "").replace("http://dx.doi.org/", "")
-                dois.append((entry["key"], doi))
+        dois = extract_dois(entries)
 
         if not dois:
             self.skip_check(
@@ -259,33 +524,18 @@ class CitationVerifier(BaseValidator):
             )
             return
 
+        self.prefetch_dois([doi for _, doi in dois])
+
         # Validate DOIs
         valid_dois = []
         invalid_dois = []
 
         for key, doi in dois:
-            # Check cache first
-            if doi in self.doi_cache:
-                if self.doi_cache[doi].get("valid", False):
-                    valid_dois.append(doi)
-                else:
-                    invalid_dois.append((key, doi))
-                continue
-
-            # Query Crossref
-            is_valid, metadata = self.check_doi_crossref(doi)
-
-            # Cache result
-            self.doi_cache[doi] = {"valid": is_valid, "metadata": metadata}
-
-            if is_valid:
+            if self.doi_cache[doi].get("valid", False):
                 valid_dois.append(doi)
             else:
                 invalid_dois.append((key, doi))
 
-            # Rate limiting
-            time.sleep(0.05)  # 20 requests/second
-
         if not invalid_dois:
             self.pass_check(
                 check_name,
@@ -316,13 +566,7 @@ class CitationVerifier(BaseValidator):
             (is_valid, metadata) tuple
         """
         try:
-            url = f"https://api.crossref.org/works/{doi}"
-            headers = {}
-
-            if self.crossref_email:
-                headers["User-Agent"] = f"ResearchAssistant/1.0 (mailto:{self.crossref_email})"
-
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self._request_crossref(doi)
 
             if response.status_code == 200:
                 data = response.json()
@@ -344,13 +588,7 @@ class CitationVerifier(BaseValidator):
         check_name = "Retraction Check"
         category = "citation"
 
-        # Extract DOIs
-        dois = []
-        for entry in entries:
-            doi = entry.get("doi", "").strip()
-            if doi:
-                doi = doi.replace("https://doi.org/", "").replace("http://dx.doi.org/", "")
-                dois.append((entry["key"], doi))
+        dois = extract_dois(entries)
 
         if not dois:
             self.skip_check(
@@ -360,25 +598,19 @@ class CitationVerifier(BaseValidator):
             )
             return
 
+        # Reuses metadata already fetched by validate_dois_batch
+        self.prefetch_dois([doi for _, doi in dois])
+
         retracted = []
 
         for key, doi in dois:
             # Check cache
-            if doi in self.retraction_cache:
-                if self.retraction_cache[doi]:
-                    retracted.append((key, doi))
-                continue
+            if doi not in self.retraction_cache:
+                self.retraction_cache[doi] = self.check_retraction_crossref(doi)
 
-            # Check Crossref for retraction status
-            is_retracted = self.check_retraction_crossref(doi)
-            self.retraction_cache[doi] = is_retracted
-
-            if is_retracted:
+            if self.retraction_cache[doi]:
                 retracted.append((key, doi))
 
-            # Rate limiting
-            time.sleep(0.05)
-
         if not retracted:
             self.pass_check(
                 check_name,
@@ -410,10 +642,11 @@ class CitationVerifier(BaseValidator):
         try:
             # First check if we have metadata cached
             if doi in self.doi_cache:
-                metadata = self.doi_cache[doi].get("metadata", {})
+                metadata = self.doi_cache[doi].get("metadata") or {}
             else:
                 # Fetch metadata
                 is_valid, metadata = self.check_doi_crossref(doi)
+                self.doi_cache[doi] = {"valid": is_valid, "metadata": metadata}
                 if not is_valid or not metadata:
                     return False
 
@@ -38,6 +38,9 @@ Examples:
   # Run for specific phase
   python -m code.quality_assurance.cli full --phase analysis
 
+  # Only re-run validators whose inputs changed since the last run
+  python -m code.quality_assurance.cli full --incremental
+
   # Generate default config
   python -m code.quality_assurance.cli init
 
@@ -90,6 +93,12 @@ Examples:
         help="Don't block/exit with error on critical issues"
     )
 
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse cached results for validators whose inputs are unchanged"
+    )
+
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -141,42 +150,19 @@ Examples:
     # Run appropriate command
     try:
         if args.command == "full":
-            report = manager.run_full_qa(phase=args.phase)
-
-        elif args.command == "reproducibility":
-            logger.info("Running reproducibility validation...")
-            results = manager.reproducibility.validate()
-            from .base import QAReport
-            from datetime import datetime
-            report = QAReport(
-                timestamp=datetime.now(),
-                project=str(args.project_root.name),
-                phase=args.phase,
-                results=results
-            )
+            report = manager.run_full_qa(phase=args.phase, incremental=args.incremental)
 
-        elif args.command == "citations":
-            logger.info("Running citation verification...")
-            results = manager.citations.validate()
+        elif args.command in ("reproducibility", "citations", "statistics"):
+            logger.info(f"Running {args.command} validation...")
+            results, timings = manager.run_validators([args.command], incremental=args.incremental)
             from .base import QAReport
             from datetime import datetime
             report = QAReport(
                 timestamp=datetime.now(),
                 project=str(args.project_root.name),
                 phase=args.phase,
-                results=results
-            )
-
-        elif args.command == "statistics":
-            logger.info("Running statistical validation...")
-            results = manager.statistics.validate()
-            from .base import QAReport
-            from datetime import datetime
-            report = QAReport(
-                timestamp=datetime.now(),
-                project=str(args.project_root.name),
-                phase=args.phase,
-                results=results
+                results=results,
+                validator_timings=timings
             )
 
         else:
@@ -207,6 +193,15 @@ Examples:
                 print(f"{key.replace('_', ' ').title()}: {value}")
         print("=" * 70)
 
+        if args.incremental:
+            cached = report.cached_checks
+            if cached:
+                print(f"\n♻️  {len(cached)} CHECK(S) SERVED FROM CACHE:")
+                for check_name in cached:
+                    print(f"  - {check_name}")
+            else:
+                print("\nNo cached results reused (inputs changed or first run)")
+
         # Print errors and warnings
         if report.errors > 0:
             print(f"\n❌ {report.errors} ERROR(S):")
@@ -0,0 +1,332 @@
+"""
+Python Code Index
+
+AST-derived index of imports and call targets, cached by content hash.
+"""
+
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+import ast
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Bump when the indexed fields change; stored entries of other versions are rebuilt
+INDEX_VERSION = 1
+
+# Aliases resolved by convention when a snippet uses them without importing
+CONVENTIONAL_ALIASES = {
+    "np": "numpy",
+    "pd": "pandas",
+    "tf": "tensorflow",
+    "sm": "statsmodels.api",
+    "smf": "statsmodels.formula.api",
+}
+
+# IPython magics and shell escapes in notebook cells ("%timeit", "!pip ...")
+_MAGIC_LINE = re.compile(r"^[ \t]*[%!].*$", re.MULTILINE)
+
+_LOOP_NODES = (
+    ast.For, ast.AsyncFor, ast.While,
+    ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp,
+)
+
+
+class ImportSite(NamedTuple):
+    """An imported name: fully qualified module or object, bound alias, line."""
+    name: str
+    alias: str
+    line: int
+
+
+class CallSite(NamedTuple):
+    """A call with its resolved dotted target, line, loop nesting and arg count."""
+    target: str
+    line: int
+    in_loop: bool
+    nargs: int
+
+
+class ModuleIndex:
+    """
+    Imports and call targets of one Python source.
+
+    Call targets are resolved through the module's import aliases, so
+    ``from scipy import stats; stats.ttest_ind(a, b)`` is recorded as
+    ``scipy.stats.ttest_ind``. Comments and string literals never
+    produce entries.
+
+    Attributes:
+        imports: Imported names in source order
+        calls: Calls whose target is a dotted name, in source order
+        syntax_error: Parse error message if the source is not valid Python
+    """
+
+    def __init__(
+        self,
+        imports: Optional[List[ImportSite]] = None,
+        calls: Optional[List[CallSite]] = None,
+        syntax_error: Optional[str] = None
+    ):
+        self.imports = imports or []
+        self.calls = calls or []
+        self.syntax_error = syntax_error
+
+    @property
+    def parsed(self) -> bool:
+        """Whether the source parsed (otherwise the index is empty)."""
+        return self.syntax_error is None
+
+    def calls_to(self, targets: Iterable[str]) -> List[CallSite]:
+        """Calls whose resolved target is one of ``targets``."""
+        targets = set(targets)
+        return [call for call in self.calls if call.target in targets]
+
+    def calls_named(self, roots: Iterable[str], names: Iterable[str]) -> List[CallSite]:
+        """
+        Calls of functions ``names`` from any module under packages ``roots``.
+
+        Matches on the top-level package and the final name, so
+        ``statsmodels.stats.multitest.multipletests`` and
+        ``statsmodels.stats.api.multipletests`` are both found with
+        roots ``{"statsmodels"}`` and names ``{"multipletests"}``.
+        """
+        roots, names = set(roots), set(names)
+        return [
+            call for call in self.calls
+            if call.target.split(".", 1)[0] in roots and call.target.rsplit(".", 1)[-1] in names
+        ]
+
+    def imports_from(self, module: str) -> List[ImportSite]:
+        """Imports of ``module`` or anything inside it."""
+        return [
+            site for site in self.imports
+            if site.name == module or site.name.startswith(module + ".")
+        ]
+
+    def to_dict(self) -> Dict:
+        """Convert to JSON-serializable dict."""
+        return {
+            "imports": [list(site) for site in self.imports],
+            "calls": [list(call) for call in self.calls],
+            "syntax_error": self.syntax_error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ModuleIndex":
+        """Rebuild from to_dict() output."""
+        return cls(
+            imports=[ImportSite(*site) for site in data.get("imports", [])],
+            calls=[CallSite(*call) for call in data.get("calls", [])],
+            syntax_error=data.get("syntax_error"),
+        )
+
+
+class _IndexBuilder(ast.NodeVisitor):
+    """Collect imports and alias-resolved call targets in one tree walk."""
+
+    def __init__(self):
+        self.imports: List[ImportSite] = []
+        self.calls: List[CallSite] = []
+        self.aliases: Dict[str, str] = {}
+        self.loop_depth = 0
+
+    def visit_Import(self, node: ast.Import):
+        for name in node.names:
+            if name.asname:
+                self.aliases[name.asname] = name.name
+                self.imports.append(ImportSite(name.name, name.asname, node.lineno))
+            else:
+                # "import a.b" binds "a"
+                head = name.name.split(".", 1)[0]
+                self.aliases[head] = head
+                self.imports.append(ImportSite(name.name, head, node.lineno))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if node.level or not node.module:
+            return  # Relative imports are project-local
+        for name in node.names:
+            if name.name == "*":
+                self.imports.append(ImportSite(node.module, "*", node.lineno))
+                continue
+            qualified = f"{node.module}.{name.name}"
+            alias = name.asname or name.name
+            self.aliases[alias] = qualified
+            self.imports.append(ImportSite(qualified, alias, node.lineno))
+
+    def visit_Call(self, node: ast.Call):
+        parts = []
+        func = node.func
+        while isinstance(func, ast.Attribute):
+            parts.append(func.attr)
+            func = func.value
+        if isinstance(func, ast.Name):
+            parts.append(func.id)
+            parts.reverse()
+            self.calls.append(CallSite(
+                ".".join(parts),
+                node.lineno,
+                self.loop_depth > 0,
+                len(node.args) + len(node.keywords),
+            ))
+        self.generic_visit(node)
+
+    def generic_visit(self, node: ast.AST):
+        if isinstance(node, _LOOP_NODES):
+            self.loop_depth += 1
+            super().generic_visit(node)
+            self.loop_depth -= 1
+        else:
+            super().generic_visit(node)
+
+    def resolve(self, target: str) -> str:
+        head, _, rest = target.partition(".")
+        module = self.aliases.get(head) or CONVENTIONAL_ALIASES.get(head)
+        if module is None:
+            return target
+        return f"{module}.{rest}" if rest else module
+
+
+def build_module_index(source: str) -> ModuleIndex:
+    """
+    Parse Python source and index its imports and calls.
+
+    Notebook magics and shell escapes are blanked (keeping line numbers)
+    if the raw source does not parse.
+
+    Args:
+        source: Python source code
+
+    Returns:
+        ModuleIndex (empty, with syntax_error set, if parsing fails)
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        try:
+            tree = ast.parse(_MAGIC_LINE.sub("", source))
+        except (SyntaxError, ValueError) as e:
+            return ModuleIndex(syntax_error=str(e))
+
+    builder = _IndexBuilder()
+    builder.visit(tree)
+
+    # Aliases are module-wide, so resolve once every import has been seen
+    calls = [call._replace(target=builder.resolve(call.target)) for call in builder.calls]
+    return ModuleIndex(builder.imports, calls)
+
+
+class CodeIndex:
+    """
+    Content-addressed cache of ModuleIndex entries.
+
+    Entries are keyed by the SHA-256 of the source, so each version of a
+    file is parsed once. With a ``path``, entries are also persisted to a
+    SQLite file and reused by later runs.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize code index.
+
+        Args:
+            path: SQLite file for persistent entries (None keeps them in memory)
+        """
+        self.path = Path(path) if path else None
+        self.parse_count = 0
+        self._memo: Dict[str, ModuleIndex] = {}
+        self._lock = threading.Lock()
+
+        if self.path:
+            try:
+                self._init_db()
+            except sqlite3.Error as e:
+                logger.warning(f"Code index store unavailable ({e}); using memory only")
+                self.path = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _init_db(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS code_index (
+                    content_hash TEXT PRIMARY KEY,
+                    index_version INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+
+    def get(self, source: str) -> ModuleIndex:
+        """
+        Get the index for a source, parsing it only if not cached.
+
+        Args:
+            source: Python source code
+
+        Returns:
+            ModuleIndex
+        """
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        with self._lock:
+            cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        index = self._load(key)
+        if index is None:
+            index = build_module_index(source)
+            self._save(key, index)
+            with self._lock:
+                self.parse_count += 1
+
+        with self._lock:
+            self._memo[key] = index
+        return index
+
+    def _load(self, key: str) -> Optional[ModuleIndex]:
+        if not self.path:
+            return None
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT data FROM code_index WHERE content_hash = ? AND index_version = ?",
+                    (key, INDEX_VERSION)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Code index read failed: {e}")
+            return None
+        return ModuleIndex.from_dict(json.loads(row[0])) if row else None
+
+    def _save(self, key: str, index: ModuleIndex):
+        if not self.path:
+            return
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO code_index VALUES (?, ?, ?, ?)",
+                    (key, INDEX_VERSION, json.dumps(index.to_dict()), time.time())
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Code index write failed: {e}")
@@ -0,0 +1,215 @@
+"""
+Persistent DOI Metadata Store
+
+SQLite-backed cache of Crossref work records shared by the QA citation
+verifier and the citation-management MCP server.
+"""
+
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Optional
+import json
+import logging
+import sqlite3
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = Path(".research_workflow") / "doi_cache.sqlite"
+
+# Retraction status can change at any time; bibliographic metadata does not
+RETRACTION_TTL = 7 * 24 * 3600
+# Unresolvable DOIs are retried in case they were registered since
+NOT_FOUND_TTL = 24 * 3600
+
+# Keep in sync with the schema in mcp-servers/citation-management.py
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS doi_metadata (
+        doi TEXT PRIMARY KEY,
+        valid INTEGER NOT NULL,
+        metadata TEXT,
+        etag TEXT,
+        last_modified TEXT,
+        metadata_fetched_at REAL NOT NULL,
+        retraction_checked_at REAL NOT NULL
+    )
+"""
+
+
+def normalize_doi(doi: str) -> str:
+    """
+    Strip resolver prefixes and lowercase a DOI for use as a key.
+
+    The citation-management MCP server writes the same file, so its
+    normalize_doi must produce the same keys.
+    """
+    doi = doi.strip()
+    for prefix in ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/",
+                   "http://dx.doi.org/", "doi:"):
+        if doi.lower().startswith(prefix):
+            doi = doi[len(prefix):]
+            break
+    return doi.lower()
+
+
+class DOIMetadataStore:
+    """
+    On-disk DOI metadata cache with per-field freshness.
+
+    Each row holds the Crossref work record for one DOI together with the
+    HTTP validators (ETag/Last-Modified) it was served with. Bibliographic
+    metadata never expires; retraction status is trusted only for
+    ``retraction_ttl`` seconds after the record was last fetched or
+    revalidated, after which callers should re-request it conditionally.
+    """
+
+    def __init__(self, path: Path, retraction_ttl: float = RETRACTION_TTL,
+                 not_found_ttl: float = NOT_FOUND_TTL, enabled: bool = True):
+        """
+        Initialize DOI metadata store.
+
+        Args:
+            path: SQLite file path (created on first use)
+            retraction_ttl: Seconds a retraction status stays fresh
+            not_found_ttl: Seconds before an unresolvable DOI is retried
+            enabled: If False, all reads miss and writes are dropped
+        """
+        self.path = Path(path)
+        self.retraction_ttl = retraction_ttl
+        self.not_found_ttl = not_found_ttl
+        self.enabled = enabled
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(SCHEMA)
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def get(self, doi: str) -> Optional[Dict]:
+        """
+        Look up the stored record for a DOI.
+
+        Args:
+            doi: DOI (any common prefix form)
+
+        Returns:
+            Record dict with ``valid``, ``metadata``, ``etag``,
+            ``last_modified``, ``metadata_fresh`` and ``retraction_fresh``,
+            or None if the DOI has never been stored
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    """
+                    SELECT valid, metadata, etag, last_modified,
+                           metadata_fetched_at, retraction_checked_at
+                    FROM doi_metadata WHERE doi = ?
+                    """,
+                    (normalize_doi(doi),)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"DOI store read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        valid, metadata, etag, last_modified, fetched_at, checked_at = row
+        now = time.time()
+        return {
+            "valid": bool(valid),
+            "metadata": json.loads(metadata) if metadata else None,
+            "etag": etag,
+            "last_modified": last_modified,
+            "metadata_fresh": bool(valid) or now - fetched_at < self.not_found_ttl,
+            "retraction_fresh": now - checked_at < self.retraction_ttl,
+        }
+
+    def put(self, doi: str, valid: bool, metadata: Optional[Dict] = None,
+            etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        Store a freshly fetched Crossref record.
+
+        Args:
+            doi: DOI
+            valid: Whether the DOI resolved
+            metadata: Crossref ``message`` payload
+            etag: ETag response header, for conditional revalidation
+            last_modified: Last-Modified response header
+        """
+        if not self.enabled:
+            return
+
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO doi_metadata
+                        (doi, valid, metadata, etag, last_modified,
+                         metadata_fetched_at, retraction_checked_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (normalize_doi(doi), int(valid),
+                     json.dumps(metadata) if metadata is not None else None,
+                     etag, last_modified, now, now)
+                )
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"DOI store write failed: {e}")
+
+    def mark_revalidated(self, doi: str):
+        """Record that a conditional request confirmed the record is unchanged."""
+        if not self.enabled:
+            return
+
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    "UPDATE doi_metadata SET retraction_checked_at = ? WHERE doi = ?",
+                    (time.time(), normalize_doi(doi))
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"DOI store write failed: {e}")
+
+    @staticmethod
+    def conditional_headers(record: Optional[Dict]) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from a stored record."""
+        headers = {}
+        if record and record.get("valid"):
+            if record.get("etag"):
+                headers["If-None-Match"] = record["etag"]
+            if record.get("last_modified"):
+                headers["If-Modified-Since"] = record["last_modified"]
+        return headers
+
+    def stats(self) -> Dict:
+        """Row counts for the on-disk store."""
+        stats = {"enabled": self.enabled, "path": str(self.path)}
+        if not self.enabled:
+            return stats
+
+        try:
+            with closing(self._connect()) as conn:
+                total, valid, stale = conn.execute(
+                    """
+                    SELECT COUNT(*), COALESCE(SUM(valid), 0),
+                           COALESCE(SUM(retraction_checked_at < ?), 0)
+                    FROM doi_metadata
+                    """,
+                    (time.time() - self.retraction_ttl,)
+                ).fetchone()
+            stats.update({"entries": total, "valid": valid, "retraction_stale": stale})
+        except sqlite3.Error as e:
+            stats["error"] = str(e)
+        return stats
@@ -0,0 +1,312 @@
+"""
+Project File Index
+
+Single-walk snapshot of a project tree shared by all QA validators.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import fnmatch
+import hashlib
+import logging
+import os
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Directory names skipped anywhere, and paths skipped relative to the root
+DEFAULT_EXCLUDED_DIRS = {".git", ".venv", "venv", "node_modules", "__pycache__"}
+DEFAULT_EXCLUDED_PATHS = {".dvc/cache"}
+
+
+def text_sha256(filepath: Path, chunk_size: int = 1 << 20) -> Optional[str]:
+    """
+    SHA-256 of a file's text as ``read_text()`` would return it, UTF-8 encoded.
+
+    The file is read in chunks, so large files are never held in memory.
+
+    Returns:
+        Hex digest, or None if the file is missing or unreadable
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(filepath) as f:
+            for chunk in iter(lambda: f.read(chunk_size), ""):
+                digest.update(chunk.encode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    return digest.hexdigest()
+
+
+def glob_to_regex(pattern: str) -> "re.Pattern":
+    """
+    Compile a glob with ``**`` support into a regex over POSIX relative paths.
+
+    ``*`` and ``?`` never cross a ``/``; ``**/`` matches zero or more
+    directories, as in ``Path.glob``.
+    """
+    i, out = 0, []
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(pattern[i]))
+                i += 1
+            else:
+                # Reuse fnmatch's character class handling
+                out.append(fnmatch.translate(pattern[i:end + 1])[4:-3])
+                i = end + 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(out) + r"\Z")
+
+
+class GitIgnoreRules:
+    """
+    Minimal ``.gitignore`` matcher.
+
+    Supports comments, negation (``!``), directory-only rules (trailing
+    ``/``), anchored rules (containing ``/``) and ``**``. Rules from a
+    nested ``.gitignore`` apply relative to its directory; the last
+    matching rule wins.
+    """
+
+    def __init__(self):
+        # (base dir, regex, negated, dir_only) in file order
+        self.rules: List[Tuple[str, "re.Pattern", bool, bool]] = []
+
+    def load(self, gitignore: Path, base: str):
+        """Add the rules of a .gitignore located in relative directory ``base``."""
+        try:
+            lines = gitignore.read_text(errors="ignore").splitlines()
+        except OSError as e:
+            logger.warning(f"Could not read {gitignore}: {e}")
+            return
+
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.strip("/") if dir_only else line
+
+            if "/" in line.lstrip("/"):
+                pattern = line.lstrip("/")
+            else:
+                pattern = "**/" + line.lstrip("/")
+
+            self.rules.append((base, glob_to_regex(pattern), negated, dir_only))
+
+    def ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Check whether a POSIX path relative to the project root is ignored."""
+        ignored = False
+        for base, regex, negated, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if base:
+                if not rel_path.startswith(base + "/"):
+                    continue
+                candidate = rel_path[len(base) + 1:]
+            else:
+                candidate = rel_path
+            if regex.match(candidate):
+                ignored = not negated
+        return ignored
+
+
+class ProjectSnapshot:
+    """
+    Immutable listing of project files with memoized contents.
+
+    The tree is walked once on construction, honouring ``.gitignore``
+    files and skipping virtualenvs, ``node_modules`` and the DVC cache.
+    File contents are loaded on first ``read`` and kept, so within one
+    process every file is read from disk at most once per snapshot.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        excluded_dirs: Optional[set] = None,
+        excluded_paths: Optional[set] = None,
+        respect_gitignore: bool = True
+    ):
+        """
+        Build snapshot.
+
+        Args:
+            project_root: Project root directory
+            excluded_dirs: Directory names to skip at any depth
+            excluded_paths: Root-relative directory paths to skip
+            respect_gitignore: Apply .gitignore rules found while walking
+        """
+        self.project_root = Path(project_root)
+        self.excluded_dirs = DEFAULT_EXCLUDED_DIRS if excluded_dirs is None else excluded_dirs
+        self.excluded_paths = DEFAULT_EXCLUDED_PATHS if excluded_paths is None else excluded_paths
+        self.respect_gitignore = respect_gitignore
+
+        self.paths: List[str] = []
+        self.read_count = 0
+        self._contents: Dict[Path, Optional[str]] = {}
+        self._glob_cache: Dict[str, List[Path]] = {}
+        self._lock = threading.Lock()
+
+        self._walk()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _walk(self):
+        rules = GitIgnoreRules()
+
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            rel_dir = Path(dirpath).relative_to(self.project_root).as_posix()
+            rel_dir = "" if rel_dir == "." else rel_dir
+
+            if self.respect_gitignore and ".gitignore" in filenames:
+                rules.load(Path(dirpath) / ".gitignore", rel_dir)
+
+            kept = []
+            for name in sorted(dirnames):
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                if name in self.excluded_dirs or rel in self.excluded_paths:
+                    continue
+                if self.respect_gitignore and rules.ignored(rel, is_dir=True):
+                    continue
+                kept.append(name)
+            dirnames[:] = kept
+
+            for name in sorted(filenames):
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                if self.respect_gitignore and rules.ignored(rel, is_dir=False):
+                    continue
+                self.paths.append(rel)
+
+        logger.debug(f"Indexed {len(self.paths)} files under {self.project_root}")
+
+    def find_files(self, pattern: str) -> List[Path]:
+        """
+        Find indexed files matching a glob pattern.
+
+        Args:
+            pattern: Glob pattern relative to the root (e.g., "**/*.py")
+
+        Returns:
+            List of absolute file paths, in walk order
+        """
+        with self._lock:
+            cached = self._glob_cache.get(pattern)
+        if cached is not None:
+            return list(cached)
+
+        regex = glob_to_regex(pattern)
+        matches = [self.project_root / rel for rel in self.paths if regex.match(rel)]
+
+        with self._lock:
+            self._glob_cache[pattern] = matches
+        return list(matches)
+
+    def sha256(self, filepath: Path) -> Optional[str]:
+        """
+        Content hash of a file (see text_sha256).
+
+        Uses the memoized contents if the file has been read; otherwise the
+        file is hashed in chunks without being cached.
+        """
+        filepath = Path(filepath)
+        if not filepath.is_absolute():
+            filepath = self.project_root / filepath
+
+        with self._lock:
+            loaded = filepath in self._contents
+            content = self._contents.get(filepath)
+        if not loaded:
+            return text_sha256(filepath)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest() if content is not None else None
+
+    def read(self, filepath: Path) -> Optional[str]:
+        """
+        Read file contents, loading each file at most once.
+
+        Args:
+            filepath: Absolute path (or path relative to the project root)
+
+        Returns:
+            File contents, or None if missing or unreadable
+        """
+        filepath = Path(filepath)
+        if not filepath.is_absolute():
+            filepath = self.project_root / filepath
+
+        with self._lock:
+            if filepath in self._contents:
+                return self._contents[filepath]
+
+        content = None
+        if filepath.exists():
+            try:
+                content = filepath.read_text()
+            except Exception as e:
+                logger.error(f"Error reading {filepath}: {e}")
+
+        with self._lock:
+            if filepath not in self._contents:
+                self._contents[filepath] = content
+                self.read_count += 1
+            return self._contents[filepath]
+
+    def preload(self, patterns) -> int:
+        """
+        Read every indexed file matching the given globs.
+
+        Called before the snapshot is copied into a worker process, so the
+        worker and the parent share one read of each file.
+
+        Returns:
+            Number of files matched
+        """
+        paths = {path for pattern in patterns for path in self.find_files(pattern)}
+        for path in paths:
+            self.read(path)
+        return len(paths)
+
+    def loaded(self) -> Dict[Path, Optional[str]]:
+        """Copy of the memoized contents, by absolute path."""
+        with self._lock:
+            return dict(self._contents)
+
+    def absorb(self, contents: Dict[Path, Optional[str]]):
+        """
+        Merge contents read by a copy of this snapshot in another process.
+
+        Each entry counts as a read, so ``read_count`` exceeds the number of
+        memoized files if the same file was read here as well.
+        """
+        with self._lock:
+            for path, content in contents.items():
+                self._contents.setdefault(path, content)
+                self.read_count += 1
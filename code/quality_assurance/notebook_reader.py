@@ -0,0 +1,58 @@
+"""
+Notebook Reader
+
+Extracts code cells from Jupyter notebooks without loading their outputs.
+"""
+
+from typing import BinaryIO, Iterator, List, Union
+import json
+
+# Optional: ijson streams the notebook so outputs are never held in memory
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_SOURCE_PREFIXES = ("cells.item.source", "cells.item.source.item")
+
+
+def _join_source(source: Union[str, List[str]]) -> str:
+    return "".join(source) if isinstance(source, list) else source
+
+
+def iter_code_cells(fp: BinaryIO) -> Iterator[str]:
+    """
+    Yield the source of each code cell, in notebook order.
+
+    With ijson installed the file is parsed as an event stream: only the
+    current cell's ``cell_type`` and ``source`` are kept, and outputs
+    (base64 images, large text) are discarded value by value rather than
+    built into a document. Without ijson the notebook is parsed whole.
+
+    Args:
+        fp: Notebook file opened in binary mode
+
+    Yields:
+        Code cell sources
+    """
+    if ijson is None:
+        notebook = json.load(fp)
+        for cell in notebook.get("cells", []):
+            if cell.get("cell_type") == "code":
+                yield _join_source(cell.get("source", []))
+        return
+
+    cell_type, source = None, []
+    for prefix, event, value in ijson.parse(fp):
+        if prefix == "cells.item.cell_type":
+            cell_type = value
+            if cell_type != "code":
+                source = []
+        elif prefix in _SOURCE_PREFIXES and event == "string":
+            # cell_type may come after source in hand-written notebooks
+            if cell_type in (None, "code"):
+                source.append(value)
+        elif prefix == "cells.item" and event == "end_map":
+            if cell_type == "code":
+                yield "".join(source)
+            cell_type, source = None, []
@@ -0,0 +1,172 @@
+"""
+Multi-Pattern Scanner
+
+Single-pass matching of many regex families over a text.
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+import re
+
+# Characters that start a regex construct rather than a literal
+_REGEX_META = set(".^$*+?{}[]()|\\")
+
+
+def split_alternatives(source: str) -> List[str]:
+    """
+    Split a regex on top-level ``|`` (outside groups and character classes).
+
+    Args:
+        source: Regex source
+
+    Returns:
+        List of alternative sources
+    """
+    parts, depth, in_class, start, i = [], 0, False, 0, 0
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            parts.append(source[start:i])
+            start = i + 1
+        i += 1
+    parts.append(source[start:])
+    return parts
+
+
+def leading_char(source: str) -> Optional[str]:
+    """
+    First literal character every match of ``source`` starts with.
+
+    Leading ``\\b`` assertions are skipped. Returns None if the pattern
+    does not start with a literal (e.g. a group or character class).
+    """
+    while source.startswith("\\b"):
+        source = source[2:]
+    if not source:
+        return None
+    if source[0] == "\\":
+        if len(source) > 1 and not source[1].isalnum():
+            return source[1].lower()
+        return None
+    if source[0] in _REGEX_META:
+        return None
+    return source[0].lower()
+
+
+class ScanHits:
+    """
+    Per-family match offsets for one scanned text.
+
+    Attributes:
+        offsets: Family name -> sorted start offsets of matches
+    """
+
+    def __init__(self, text: str, offsets: Dict[str, List[int]]):
+        self.offsets = offsets
+        self._text = text
+        self._line_starts: Optional[List[int]] = None
+
+    def has(self, family: str) -> bool:
+        """Check whether any pattern of a family matched."""
+        return bool(self.offsets.get(family))
+
+    def any(self, families: Iterable[str]) -> bool:
+        """Check whether any of several families matched."""
+        return any(self.has(family) for family in families)
+
+    def lines(self, family: str) -> List[int]:
+        """1-based line numbers of a family's matches (deduplicated)."""
+        if self._line_starts is None:
+            self._line_starts = [0] + [m.end() for m in re.finditer("\n", self._text)]
+        return sorted({bisect_right(self._line_starts, offset) for offset in self.offsets.get(family, [])})
+
+
+class PatternScanner:
+    """
+    Scan text for many pattern families in a single pass.
+
+    All patterns are compiled once into one alternation. The scan advances
+    to each position where any alternative matches and then tests only the
+    patterns that can start with the character found there, so every
+    position where a pattern matches is found (including overlapping
+    matches of different families) without one sweep per pattern.
+    """
+
+    def __init__(self, families: Dict[str, List[str]], flags: int = re.IGNORECASE):
+        """
+        Compile pattern families.
+
+        Args:
+            families: Family name -> list of regex sources
+            flags: Regex flags applied to every pattern
+        """
+        self.families = list(families)
+        self.patterns: List[Tuple[str, "re.Pattern"]] = []
+        self._by_char: Dict[str, List[int]] = {}
+        self._unanchored: List[int] = []
+
+        sources = []
+        for family, family_sources in families.items():
+            for family_source in family_sources:
+                for source in split_alternatives(family_source):
+                    index = len(self.patterns)
+                    self.patterns.append((family, re.compile(source, flags)))
+                    sources.append(source)
+
+                    char = leading_char(source)
+                    if char is None:
+                        self._unanchored.append(index)
+                    else:
+                        self._by_char.setdefault(char, []).append(index)
+                        if char.upper() != char:
+                            self._by_char.setdefault(char.upper(), []).append(index)
+
+        for indexes in self._by_char.values():
+            indexes.extend(self._unanchored)
+        self._all = list(range(len(self.patterns)))
+
+        self.combined = re.compile("|".join(f"(?:{source})" for source in sources), flags)
+
+    def scan(self, text: str) -> ScanHits:
+        """
+        Find all matches of all families.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            ScanHits with start offsets per family
+        """
+        offsets: Dict[str, List[int]] = {family: [] for family in self.families}
+        search = self.combined.search
+        by_char = self._by_char
+        patterns = self.patterns
+
+        pos = 0
+        while True:
+            match = search(text, pos)
+            if match is None:
+                break
+            start = match.start()
+
+            # Characters outside the buckets (e.g. Unicode case folds) test everything
+            for index in by_char.get(text[start], self._all):
+                family, pattern = patterns[index]
+                family_offsets = offsets[family]
+                if (not family_offsets or family_offsets[-1] != start) and pattern.match(text, start):
+                    family_offsets.append(start)
+
+            pos = start + 1
+
+        return ScanHits(text, offsets)
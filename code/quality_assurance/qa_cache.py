@@ -0,0 +1,204 @@
+"""
+Incremental QA Result Cache
+
+Content-hash manifest that lets QA runs skip validators whose inputs have
+not changed since their last successful run.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import logging
+import os
+import time
+
+from .base import BaseValidator, ValidationResult
+from .file_index import ProjectSnapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QA_CACHE_DIR = Path(".research_workflow") / "qa_cache"
+MANIFEST_VERSION = 1
+
+# Files modified this close to the time they were fingerprinted may have
+# changed within the same mtime tick, so their stat data is not trusted
+RACY_WINDOW_SECONDS = 2.0
+
+
+def config_hash(config: Dict) -> str:
+    """Stable hash of a validator's config section."""
+    raw = json.dumps(config or {}, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class QAResultCache:
+    """
+    Per-validator result cache keyed on inputs.
+
+    For each validator the manifest stores its class and VERSION, a hash
+    of its config section, the files matched by every glob it issued, and
+    a fingerprint (SHA-256 plus mtime/size) of every file it read. A cached
+    entry is reused only if all of these still match the current project.
+    """
+
+    def __init__(self, cache_dir: Path, project_root: Path):
+        """
+        Initialize result cache.
+
+        Args:
+            cache_dir: Directory holding manifest.json
+            project_root: Project root that manifest paths are relative to
+        """
+        self.cache_dir = Path(cache_dir)
+        self.project_root = Path(project_root)
+        self.manifest_path = self.cache_dir / "manifest.json"
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            data = json.loads(self.manifest_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable QA cache manifest: {e}")
+            return {}
+        if data.get("manifest_version") != MANIFEST_VERSION:
+            return {}
+        return data.get("validators", {})
+
+    def save(self):
+        """Write the manifest atomically if anything changed."""
+        if not self._dirty:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(
+            {"manifest_version": MANIFEST_VERSION, "validators": self.entries},
+            indent=2
+        )
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_text(payload)
+        os.replace(tmp_path, self.manifest_path)
+        self._dirty = False
+
+    def lookup(
+        self,
+        name: str,
+        validator: BaseValidator,
+        config: Dict,
+        snapshot: ProjectSnapshot
+    ) -> Optional[List[ValidationResult]]:
+        """
+        Return cached results if the validator's inputs are unchanged.
+
+        Args:
+            name: Validator name (manifest key)
+            validator: Validator instance (class and VERSION are checked)
+            config: Validator config section
+            snapshot: Current project snapshot
+
+        Returns:
+            Cached results marked ``cached=True``, or None on a miss
+        """
+        entry = self.entries.get(name)
+        if not entry:
+            return None
+
+        if entry.get("validator") != type(validator).__name__ \
+                or entry.get("version") != validator.VERSION:
+            return None
+        if entry.get("config_hash") != config_hash(config):
+            return None
+        if entry.get("expires_at") is not None and entry["expires_at"] <= time.time():
+            return None
+
+        for pattern, matched in entry.get("globs", {}).items():
+            current = sorted(
+                path.relative_to(self.project_root).as_posix()
+                for path in snapshot.find_files(pattern)
+            )
+            if current != matched:
+                logger.debug(f"QA cache miss for {name}: {pattern} matches changed")
+                return None
+
+        for rel, fingerprint in entry.get("files", {}).items():
+            if not self._unchanged(rel, fingerprint, entry.get("stored_at", 0.0), snapshot):
+                logger.debug(f"QA cache miss for {name}: {rel} changed")
+                return None
+
+        results = []
+        for data in entry.get("results", []):
+            result = ValidationResult.from_dict(data)
+            result.cached = True
+            results.append(result)
+        return results
+
+    def _unchanged(
+        self,
+        rel: str,
+        fingerprint: Optional[Dict[str, Any]],
+        stored_at: float,
+        snapshot: ProjectSnapshot
+    ) -> bool:
+        path = self.project_root / rel
+        try:
+            stat = path.stat()
+        except OSError:
+            return fingerprint is None
+
+        if fingerprint is None:
+            return False
+
+        if (stat.st_mtime_ns == fingerprint["mtime_ns"] and stat.st_size == fingerprint["size"]
+                and stat.st_mtime < stored_at - RACY_WINDOW_SECONDS):
+            return True
+
+        return snapshot.sha256(path) == fingerprint["sha256"]
+
+    def store(
+        self,
+        name: str,
+        validator: BaseValidator,
+        config: Dict,
+        inputs: Dict[str, Any],
+        results: List[ValidationResult]
+    ):
+        """
+        Record a validator's results against its inputs.
+
+        Args:
+            name: Validator name (manifest key)
+            validator: Validator instance
+            config: Validator config section
+            inputs: validator.input_manifest() from the run
+            results: Results produced by the run
+        """
+        now = time.time()
+        files = {}
+        for rel, sha256 in inputs.get("files", {}).items():
+            if sha256 is None:
+                files[rel] = None
+                continue
+            try:
+                stat = (self.project_root / rel).stat()
+            except OSError:
+                files[rel] = None
+                continue
+            files[rel] = {"sha256": sha256, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+        ttl = validator.cache_ttl()
+        self.entries[name] = {
+            "validator": type(validator).__name__,
+            "version": validator.VERSION,
+            "config_hash": config_hash(config),
+            "stored_at": now,
+            "expires_at": now + ttl if ttl is not None else None,
+            "globs": inputs.get("globs", {}),
+            "files": files,
+            "results": [r.to_dict() for r in results],
+            "generated": datetime.now().isoformat(),
+        }
+        self._dirty = True
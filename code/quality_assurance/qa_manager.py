@@ -4,19 +4,133 @@ QA Manager
 Orchestrates all quality assurance components and generates comprehensive reports.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime
+import multiprocessing
+import pickle
+import time
 import yaml
 import logging
 
-from .base import QAReport, ValidationResult, ValidationStatus, CriticalQAError
+from .base import (
+    QAReport, ValidationResult, ValidationStatus, CriticalQAError, ValidationTimeoutError
+)
 from .reproducibility_validator import ReproducibilityValidator
 from .citation_verifier import CitationVerifier
 from .statistical_validator import StatisticalValidator
+from .code_index import CodeIndex
+from .file_index import ProjectSnapshot
+from .qa_cache import QAResultCache, DEFAULT_QA_CACHE_DIR
 
 logger = logging.getLogger(__name__)
 
+# (attribute, display name, result category, executor) in report order.
+# Citation checks are network-bound and run in threads; statistical checks
+# scan notebooks and scripts and run in a separate process.
+VALIDATORS = [
+    ("reproducibility", "Reproducibility Validator", "reproducibility", "thread"),
+    ("citations", "Citation Verifier", "citation", "thread"),
+    ("statistics", "Statistical Validator", "statistical", "process"),
+]
+
+DEFAULT_VALIDATOR_TIMEOUTS = {
+    "reproducibility": 300,
+    "citations": 900,
+    "statistics": 300,
+}
+
+
+def _timed_validate(
+    validator,
+    track_inputs: bool = False
+) -> Tuple[List[ValidationResult], float, Optional[Dict]]:
+    """Run a validator and return results, wall time and inputs (picklable)."""
+    start = time.perf_counter()
+    results = validator.validate()
+    elapsed = time.perf_counter() - start
+    return list(results), elapsed, validator.input_manifest() if track_inputs else None
+
+
+def _timed_validate_in_process(
+    validator,
+    track_inputs: bool = False
+) -> Tuple[Tuple[List[ValidationResult], float, Optional[Dict]], Dict]:
+    """
+    Run a validator in a worker process.
+
+    Returns:
+        (_timed_validate outcome, contents the worker's snapshot copy read
+        that were not loaded before it started)
+    """
+    snapshot = validator.snapshot
+    known = set(snapshot.loaded()) if snapshot is not None else set()
+    outcome = _timed_validate(validator, track_inputs)
+    reads = {} if snapshot is None else {
+        path: content for path, content in snapshot.loaded().items() if path not in known
+    }
+    return outcome, reads
+
+
+def _process_main(conn, validator, track_inputs: bool):
+    """Entry point of a validator process: send the outcome or the error back."""
+    try:
+        message = (True, _timed_validate_in_process(validator, track_inputs))
+    except Exception as e:
+        message = (False, e)
+    try:
+        conn.send(message)
+    except Exception:
+        # The exception itself could not be pickled
+        conn.send((False, RuntimeError(f"{type(message[1]).__name__}: {message[1]}")))
+    finally:
+        conn.close()
+
+
+class _ValidatorProcess:
+    """
+    Validator running in its own process.
+
+    Exposes the ``result(timeout)`` part of the Future interface. Unlike a
+    pool worker, the process can be terminated when the validator times out.
+    """
+
+    def __init__(self, validator, track_inputs: bool = False):
+        context = multiprocessing.get_context()
+        self._conn, child_conn = context.Pipe(duplex=False)
+        self.process = context.Process(
+            target=_process_main, args=(child_conn, validator, track_inputs), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def result(self, timeout: Optional[float] = None):
+        """Wait for the outcome; raises FuturesTimeoutError if it is not ready in time."""
+        if not self._conn.poll(timeout):
+            raise FuturesTimeoutError()
+        try:
+            ok, value = self._conn.recv()
+        except EOFError:
+            self.process.join()
+            raise RuntimeError(
+                f"validator process exited with code {self.process.exitcode}"
+            ) from None
+        finally:
+            self._conn.close()
+        self.process.join()
+        if not ok:
+            raise value
+        return value
+
+    def terminate(self):
+        """Stop the process if it is still running."""
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self._conn.close()
+
 
 class QAManager:
     """
@@ -55,6 +169,19 @@ class QAManager:
             self.config.get("statistics", {})
         )
 
+        # File index for the current run (rebuilt by run_validators)
+        self.snapshot: Optional[ProjectSnapshot] = None
+
+        # AST index shared across runs (opened by the first run)
+        self.code_index: Optional[CodeIndex] = None
+
+    def _cache_dir(self) -> Path:
+        """Directory for QA caches (``qa_manager.cache_dir``)."""
+        cache_dir = Path(self.config.get("qa_manager", {}).get("cache_dir", DEFAULT_QA_CACHE_DIR))
+        if not cache_dir.is_absolute():
+            cache_dir = self.project_root / cache_dir
+        return cache_dir
+
     def _load_config(self, config_file: Optional[Path]) -> Dict:
         """Load configuration from YAML file or use defaults."""
         if config_file and config_file.exists():
@@ -93,80 +220,250 @@ class QAManager:
                 "block_on_critical": True,
                 "report_format": "markdown",
                 "report_dir": "qa_reports",
+                "parallel": True,
+                "validator_timeouts": dict(DEFAULT_VALIDATOR_TIMEOUTS),
             }
         }
 
-    def run_full_qa(self, phase: Optional[str] = None) -> QAReport:
+    def run_validators(
+        self,
+        names: List[str],
+        incremental: bool = False
+    ) -> Tuple[List[ValidationResult], Dict[str, float]]:
         """
-        Run all QA checks.
+        Run the named validators concurrently.
+
+        The project tree is indexed once into a ProjectSnapshot shared by all
+        validators for this run; Python sources are parsed through a
+        CodeIndex persisted under ``qa_manager.cache_dir``, so unchanged
+        files are not re-parsed. I/O-bound validators run in a thread pool
+        and CPU-bound ones each in their own process; the files a process validator
+        reads (READ_PATTERNS) are loaded into the snapshot before it starts,
+        so each file is still read once per run. Each validator gets its own timeout
+        (``qa_manager.validator_timeouts``); one that exceeds it is reported
+        as a ValidationTimeoutError result. A timed-out process is
+        terminated; threads cannot be cancelled, so a timed-out validator
+        in a thread finishes in the background and its results are dropped. Results are returned in
+        VALIDATORS order regardless of completion order.
+
+        In incremental mode, a validator whose version, config section and
+        input files are unchanged since its last successful run is served
+        from the QA result cache instead of being re-run.
 
         Args:
-            phase: Research phase (optional)
+            names: Validator attribute names (e.g. ["citations", "statistics"])
+            incremental: Reuse cached results for unchanged validators
 
         Returns:
-            Comprehensive QA report
+            (results, wall time in seconds per validator display name)
         """
-        logger.info(f"Running full QA suite{f' for phase: {phase}' if phase else ''}")
+        manager_cfg = self.config.get("qa_manager", {})
+        timeouts = {**DEFAULT_VALIDATOR_TIMEOUTS, **manager_cfg.get("validator_timeouts", {})}
+        specs = [spec for spec in VALIDATORS if spec[0] in names]
+
+        self.snapshot = ProjectSnapshot(self.project_root)
+        if self.code_index is None:
+            self.code_index = CodeIndex(
+                self._cache_dir() / "code_index.sqlite"
+                if manager_cfg.get("persist_code_index", True) else None
+            )
+        for attr, _, _, _ in specs:
+            getattr(self, attr).snapshot = self.snapshot
+            getattr(self, attr).code_index = self.code_index
 
-        all_results = []
+        cache = None
+        if incremental:
+            cache = QAResultCache(self._cache_dir(), self.project_root)
 
-        # Run reproducibility checks
-        logger.info("Running reproducibility validation...")
+        outcomes: Dict[str, Tuple[List[ValidationResult], float]] = {}
         try:
-            repro_results = self.reproducibility.validate()
-            all_results.extend(repro_results)
-            logger.info(f"Reproducibility: {len(repro_results)} checks completed")
-        except Exception as e:
-            logger.error(f"Reproducibility validation error: {e}")
-            all_results.append(
-                ValidationResult(
-                    check_name="Reproducibility Validator",
-                    status=ValidationStatus.ERROR,
-                    message=f"Validator crashed: {str(e)}",
-                    category="reproducibility"
-                )
-            )
+            pending = []
+            for spec in specs:
+                attr, label = spec[0], spec[1]
+                validator = getattr(self, attr)
+                start = time.perf_counter()
+                cached = cache.lookup(attr, validator, self.config.get(attr, {}), self.snapshot) \
+                    if cache else None
+                if cached is None:
+                    pending.append(spec)
+                    continue
+                validator.results = cached
+                outcomes[attr] = (cached, time.perf_counter() - start)
+                logger.info(f"{label}: {len(cached)} checks served from cache")
+
+            for attr, (results, elapsed, inputs) in self._execute_validators(
+                pending, manager_cfg, timeouts, track_inputs=cache is not None
+            ).items():
+                outcomes[attr] = (results, elapsed)
+                if cache and inputs is not None:
+                    cache.store(attr, getattr(self, attr), self.config.get(attr, {}), inputs, results)
+        finally:
+            for attr, _, _, _ in specs:
+                getattr(self, attr).snapshot = None
+            if cache:
+                cache.save()
+
+        all_results: List[ValidationResult] = []
+        timings: Dict[str, float] = {}
+        for attr, label, _, _ in specs:
+            results, elapsed = outcomes[attr]
+            all_results.extend(results)
+            timings[label] = round(elapsed, 3)
+        return all_results, timings
+
+    def _execute_validators(
+        self,
+        specs: List[Tuple[str, str, str, str]],
+        manager_cfg: Dict,
+        timeouts: Dict[str, float],
+        track_inputs: bool = False
+    ) -> Dict[str, Tuple[List[ValidationResult], float, Optional[Dict]]]:
+        """
+        Execute validator specs.
+
+        Returns:
+            Mapping of attribute name to (results, wall time, inputs); inputs
+            is None when the validator crashed or timed out, or when
+            track_inputs is False
+        """
+        outcomes = {}
+
+        if not manager_cfg.get("parallel", True):
+            for attr, label, category, _ in specs:
+                logger.info(f"Running {label}...")
+                start = time.perf_counter()
+                try:
+                    outcomes[attr] = _timed_validate(getattr(self, attr), track_inputs)
+                except Exception as e:
+                    outcomes[attr] = (
+                        self._crash_result(label, category, e), time.perf_counter() - start, None
+                    )
+            return outcomes
+
+        in_process = {
+            attr for attr, _, _, executor in specs
+            if executor == "process" and self._picklable(getattr(self, attr))
+        }
 
-        # Run citation checks
-        logger.info("Running citation verification...")
+        # Load what process validators read before their snapshot is copied,
+        # so the worker and the validators in threads don't read it again
+        for attr in in_process:
+            validator = getattr(self, attr)
+            if validator.snapshot is not None:
+                validator.snapshot.preload(validator.READ_PATTERNS)
+
+        # Start processes before any worker threads exist
+        futures = {}
+        thread_pool = ThreadPoolExecutor(max_workers=len(specs) - len(in_process)) \
+            if len(specs) > len(in_process) else None
         try:
-            citation_results = self.citations.validate()
-            all_results.extend(citation_results)
-            logger.info(f"Citations: {len(citation_results)} checks completed")
-        except Exception as e:
-            logger.error(f"Citation verification error: {e}")
-            all_results.append(
-                ValidationResult(
-                    check_name="Citation Verifier",
-                    status=ValidationStatus.ERROR,
-                    message=f"Verifier crashed: {str(e)}",
-                    category="citation"
-                )
+            for attr, label, _, _ in sorted(specs, key=lambda spec: spec[0] not in in_process):
+                logger.info(f"Running {label}...")
+                if attr in in_process:
+                    future = _ValidatorProcess(getattr(self, attr), track_inputs)
+                else:
+                    future = thread_pool.submit(_timed_validate, getattr(self, attr), track_inputs)
+                futures[attr] = (future, time.monotonic())
+
+            for attr, label, category, _ in specs:
+                future, started = futures[attr]
+                timeout = float(timeouts.get(attr, DEFAULT_VALIDATOR_TIMEOUTS[attr]))
+                try:
+                    outcome = self._await_validator(future, started + timeout, label, timeout)
+                    if attr in in_process:
+                        # Results were produced in a child process
+                        outcome, reads = outcome
+                        if self.snapshot is not None:
+                            self.snapshot.absorb(reads)
+                        getattr(self, attr).results = outcome[0]
+                    results, elapsed, inputs = outcome
+                    logger.info(f"{label}: {len(results)} checks completed in {elapsed:.2f}s")
+                except ValidationTimeoutError as e:
+                    logger.error(str(e))
+                    results = [
+                        ValidationResult(
+                            check_name=label,
+                            status=ValidationStatus.ERROR,
+                            message=str(e),
+                            details={"timeout_seconds": timeout},
+                            category=category
+                        )
+                    ]
+                    elapsed, inputs = time.monotonic() - started, None
+                except Exception as e:
+                    results = self._crash_result(label, category, e)
+                    elapsed, inputs = time.monotonic() - started, None
+
+                outcomes[attr] = (results, elapsed, inputs)
+        finally:
+            for attr, (future, _) in futures.items():
+                if isinstance(future, _ValidatorProcess):
+                    future.terminate()
+                elif not future.done():
+                    logger.warning(
+                        f"{attr} validator keeps running in the background: "
+                        f"validators in threads cannot be cancelled"
+                    )
+            if thread_pool:
+                thread_pool.shutdown(wait=False, cancel_futures=True)
+
+        return outcomes
+
+    @staticmethod
+    def _await_validator(future, deadline: float, label: str, timeout: float):
+        """Wait for a validator future until its deadline."""
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FuturesTimeoutError:
+            raise ValidationTimeoutError(f"{label} timed out after {timeout:.0f}s") from None
+
+    @staticmethod
+    def _crash_result(label: str, category: str, error: Exception) -> List[ValidationResult]:
+        """Turn a validator exception into a single error result."""
+        logger.error(f"{label} error: {error}")
+        return [
+            ValidationResult(
+                check_name=label,
+                status=ValidationStatus.ERROR,
+                message=f"{label} crashed: {str(error)}",
+                category=category
             )
+        ]
 
-        # Run statistical checks
-        logger.info("Running statistical validation...")
+    @staticmethod
+    def _picklable(validator) -> bool:
+        """Check a validator can be shipped to a worker process."""
         try:
-            stat_results = self.statistics.validate()
-            all_results.extend(stat_results)
-            logger.info(f"Statistics: {len(stat_results)} checks completed")
+            pickle.dumps(validator)
+            return True
         except Exception as e:
-            logger.error(f"Statistical validation error: {e}")
-            all_results.append(
-                ValidationResult(
-                    check_name="Statistical Validator",
-                    status=ValidationStatus.ERROR,
-                    message=f"Validator crashed: {str(e)}",
-                    category="statistical"
-                )
-            )
+            logger.debug(f"{type(validator).__name__} is not picklable, using a thread: {e}")
+            return False
+
+    def run_full_qa(self, phase: Optional[str] = None, incremental: bool = False) -> QAReport:
+        """
+        Run all QA checks.
+
+        Args:
+            phase: Research phase (optional)
+            incremental: Reuse cached results for unchanged validators
+
+        Returns:
+            Comprehensive QA report
+        """
+        logger.info(f"Running full QA suite{f' for phase: {phase}' if phase else ''}")
+
+        all_results, timings = self.run_validators(
+            [spec[0] for spec in VALIDATORS], incremental=incremental
+        )
 
         # Create report
         report = QAReport(
             timestamp=datetime.now(),
             project=str(self.project_root.name),
             phase=phase,
-            results=all_results
+            results=all_results,
+            validator_timings=timings
         )
 
         logger.info(f"QA complete: {report.total_checks} checks, {report.passed} passed, "
@@ -174,12 +471,13 @@ class QAManager:
 
         return report
 
-    def run_phase_qa(self, phase: str) -> QAReport:
+    def run_phase_qa(self, phase: str, incremental: bool = False) -> QAReport:
         """
         Run phase-specific QA checks.
 
         Args:
             phase: Research phase name
+            incremental: Reuse cached results for unchanged validators
 
         Returns:
             QA report for phase
@@ -211,35 +509,14 @@ class QAManager:
 
         logger.info(f"Running QA for phase '{phase}': {', '.join(required)}")
 
-        all_results = []
-
-        # Run only required validators
-        if "reproducibility" in required:
-            try:
-                results = self.reproducibility.validate()
-                all_results.extend(results)
-            except Exception as e:
-                logger.error(f"Reproducibility validation error: {e}")
-
-        if "citations" in required:
-            try:
-                results = self.citations.validate()
-                all_results.extend(results)
-            except Exception as e:
-                logger.error(f"Citation verification error: {e}")
-
-        if "statistics" in required:
-            try:
-                results = self.statistics.validate()
-                all_results.extend(results)
-            except Exception as e:
-                logger.error(f"Statistical validation error: {e}")
+        all_results, timings = self.run_validators(required, incremental=incremental)
 
         report = QAReport(
             timestamp=datetime.now(),
             project=str(self.project_root.name),
             phase=phase,
-            results=all_results
+            results=all_results,
+            validator_timings=timings
         )
 
         return report
@@ -401,6 +678,10 @@ def create_default_config(output_path: Path):
             "block_on_critical": True,
             "report_format": "markdown",  # markdown or json
             "report_dir": "qa_reports",
+            "parallel": True,  # Run validators concurrently
+            "cache_dir": str(DEFAULT_QA_CACHE_DIR),  # Incremental results and code index
+            "persist_code_index": True,  # Keep parsed ASTs across runs
+            "validator_timeouts": dict(DEFAULT_VALIDATOR_TIMEOUTS),  # Seconds
         }
     }
 
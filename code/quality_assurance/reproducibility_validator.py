@@ -5,15 +5,48 @@ Validates research reproducibility through environment, seed, and provenance che
 """
 
 from pathlib import Path
-from typing import List, Optional, Dict, Set
+from typing import List, Optional, Dict
 import re
 import sys
 import logging
 
 from .base import BaseValidator, ValidationResult, ValidationStatus
+from .file_index import ProjectSnapshot
 
 logger = logging.getLogger(__name__)
 
+# Calls that seed a random number generator, resolved through the AST index
+SEED_CALLS = {
+    "random.seed",
+    "numpy.random.seed",
+    "torch.manual_seed",
+    "torch.cuda.manual_seed",
+    "torch.cuda.manual_seed_all",
+    "tensorflow.random.set_seed",
+    "tensorflow.set_random_seed",
+    "transformers.set_seed",
+    "pytorch_lightning.seed_everything",
+    "lightning.seed_everything",
+    "lightning.pytorch.seed_everything",
+}
+
+# Generator constructors that count as seeding when given a seed argument
+SEEDED_CONSTRUCTORS = {
+    "random.Random",
+    "numpy.random.default_rng",
+    "numpy.random.RandomState",
+}
+
+# Text fallback for sources that do not parse
+SEED_PATTERNS = [
+    re.compile(r"random\.seed\(", re.IGNORECASE),
+    re.compile(r"np\.random\.seed\(", re.IGNORECASE),
+    re.compile(r"numpy\.random\.seed\(", re.IGNORECASE),
+    re.compile(r"torch\.manual_seed\(", re.IGNORECASE),
+    re.compile(r"tf\.random\.set_seed\(", re.IGNORECASE),
+    re.compile(r"tensorflow\.random\.set_seed\(", re.IGNORECASE),
+]
+
 
 class ReproducibilityValidator(BaseValidator):
     """
@@ -26,7 +59,14 @@ class ReproducibilityValidator(BaseValidator):
     - Container specifications
     """
 
-    def __init__(self, project_root: Path, config: Optional[Dict] = None):
+    VERSION = "2"
+
+    def __init__(
+        self,
+        project_root: Path,
+        config: Optional[Dict] = None,
+        snapshot: Optional[ProjectSnapshot] = None
+    ):
         """
         Initialize reproducibility validator.
 
@@ -37,8 +77,9 @@ class ReproducibilityValidator(BaseValidator):
                 - require_seed_docs: Require seed documentation
                 - require_docker: Require Dockerfile
                 - check_data_provenance: Check data source documentation
+            snapshot: Shared project file index (optional)
         """
-        super().__init__(project_root, config)
+        super().__init__(project_root, config, snapshot)
 
         cfg = config or {}
         self.require_pinned_deps = cfg.get("require_pinned_deps", True)
@@ -124,9 +165,9 @@ class ReproducibilityValidator(BaseValidator):
         check_name = "Dependency Pinning"
         category = "reproducibility"
 
-        requirements_file = self.project_root / "requirements.txt"
+        requirements = self.read_file("requirements.txt")
 
-        if not requirements_file.exists():
+        if requirements is None:
             self.warn_check(
                 check_name,
                 "requirements.txt not found",
@@ -134,7 +175,6 @@ class ReproducibilityValidator(BaseValidator):
             )
             return
 
-        requirements = requirements_file.read_text()
         lines = [line.strip() for line in requirements.split("\n") if line.strip() and not line.startswith("#")]
 
         unpinned = []
@@ -234,34 +274,27 @@ class ReproducibilityValidator(BaseValidator):
             )
             return
 
-        # Patterns to detect seed setting
-        seed_patterns = [
-            re.compile(r"random\.seed\(", re.IGNORECASE),
-            re.compile(r"np\.random\.seed\(", re.IGNORECASE),
-            re.compile(r"numpy\.random\.seed\(", re.IGNORECASE),
-            re.compile(r"torch\.manual_seed\(", re.IGNORECASE),
-            re.compile(r"tf\.random\.set_seed\(", re.IGNORECASE),
-            re.compile(r"tensorflow\.random\.set_seed\(", re.IGNORECASE),
-        ]
-
-        files_with_seeds: Set[Path] = set()
+        seed_lines: Dict[Path, List[int]] = {}
 
         for py_file in python_files:
             content = self.read_file(py_file, relative=False)
             if not content:
                 continue
 
-            for pattern in seed_patterns:
-                if pattern.search(content):
-                    files_with_seeds.add(py_file.relative_to(self.project_root))
-                    break
+            lines = self.find_seed_calls(content)
+            if lines:
+                seed_lines[py_file.relative_to(self.project_root)] = lines
 
-        if files_with_seeds:
+        if seed_lines:
+            files_with_seeds = sorted(seed_lines)
             self.pass_check(
                 check_name,
                 f"Random seeds set in {len(files_with_seeds)} file(s)",
                 category=category,
-                details={"files": [str(f) for f in sorted(files_with_seeds)]}
+                details={
+                    "files": [str(f) for f in files_with_seeds],
+                    "lines": {str(f): seed_lines[f] for f in files_with_seeds},
+                }
             )
         else:
             self.warn_check(
@@ -271,6 +304,31 @@ class ReproducibilityValidator(BaseValidator):
                 details={"suggestion": "Set seeds for numpy, random, torch, tensorflow"}
             )
 
+    def find_seed_calls(self, content: str) -> List[int]:
+        """
+        Find lines that seed a random number generator.
+
+        Uses the AST index, so commented-out or quoted seed calls do not
+        count; falls back to text patterns if the source does not parse.
+
+        Args:
+            content: Python source
+
+        Returns:
+            Sorted line numbers of seeding calls
+        """
+        module = self.index_code(content)
+        if not module.parsed:
+            return sorted({
+                content.count("\n", 0, match.start()) + 1
+                for pattern in SEED_PATTERNS
+                for match in pattern.finditer(content)
+            })
+
+        calls = module.calls_to(SEED_CALLS)
+        calls += [call for call in module.calls_to(SEEDED_CONSTRUCTORS) if call.nargs]
+        return sorted({call.line for call in calls})
+
     def validate_seed_documentation(self):
         """Check that seed values are documented."""
         check_name = "Random Seed Documentation"
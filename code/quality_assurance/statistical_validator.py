@@ -5,15 +5,132 @@ Validates statistical analyses for rigor, completeness, and proper reporting.
 """
 
 from pathlib import Path
-from typing import List, Optional, Dict, Set
-import re
+from typing import List, Optional, Dict, Set, Tuple
 import ast
 import logging
 
 from .base import BaseValidator, ValidationResult, ValidationStatus
+from .code_index import ModuleIndex
+from .file_index import ProjectSnapshot
+from .notebook_reader import iter_code_cells
+from .pattern_scanner import PatternScanner, ScanHits
 
 logger = logging.getLogger(__name__)
 
+# Pattern families matched (case-insensitively) by the statistical checks
+STATISTICAL_PATTERN_FAMILIES = {
+    "power": [
+        r"power[_\s]*analysis",
+        r"statsmodels\.stats\.power",
+        r"from.*power.*import",
+        r"pwr\.",  # R pwr package
+        r"TTestPower|FTestAnovaPower|NormalIndPower",
+        r"sample[_\s]*size[_\s]*calculation",
+    ],
+    "effect_size": [
+        r"cohen[_\s]*d",
+        r"effect[_\s]*size",
+        r"eta[_\s]*squared",
+        r"omega[_\s]*squared",
+        r"partial[_\s]*eta",
+        r"hedges[_\s]*g",
+        r"glass[_\s]*delta",
+        r"cramer[_\s]*v",
+        r"odds[_\s]*ratio",
+        r"risk[_\s]*ratio",
+        r"correlation[_\s]*coefficient",
+    ],
+    "p_value": [
+        r"p[_\s]*value",
+        r"pval",
+        r"\.pvalue",
+        r"ttest|chi2|anova|mannwhitneyu|wilcoxon|kruskal",
+    ],
+    "p_value_problematic": [
+        r"marginally\s+significant",
+        r"trending\s+toward",
+        r"approached\s+significance",
+        r"almost\s+significant",
+    ],
+    "confidence_interval": [
+        r"confidence[_\s]*interval",
+        r"\bci\b",
+        r"confint",
+        r"conf_int",
+        r"\.conf_int\(",
+    ],
+    "multiple_tests": [
+        r"for\s+\w+\s+in.*:\s*ttest",
+        r"for\s+\w+\s+in.*:\s*chi2",
+        r"for\s+\w+\s+in.*:\s*mannwhitneyu",
+        r"multiple.*test",
+        r"pairwise.*comparison",
+    ],
+    "correction": [
+        r"bonferroni",
+        r"holm",
+        r"benjamini",
+        r"hochberg",
+        r"fdr",
+        r"multipletests",
+        r"p\.adjust",
+    ],
+    "assumption_check": [
+        # Normality tests
+        r"shapiro|normaltest|kstest|anderson",
+        r"qqplot|probplot",
+        # Homogeneity of variance
+        r"levene|bartlett|fligner",
+        # Sphericity
+        r"mauchly",
+        # Independence
+        r"durbin.watson",
+        # General diagnostics
+        r"diagnostic|residual.*plot",
+    ],
+    "parametric_test": [
+        r"ttest_ind|ttest_rel",
+        r"anova|f_oneway",
+        r"pearsonr",
+        r"linregress|OLS|regression",
+    ],
+}
+
+# Compiled once per process; every file is scanned in a single pass
+STATISTICAL_SCANNER = PatternScanner(STATISTICAL_PATTERN_FAMILIES)
+
+_STATS_PACKAGES = ("scipy", "statsmodels", "pingouin")
+
+# Call families resolved through the AST index for code that parses:
+# family -> (top-level packages, function or class names)
+STATISTICAL_CALL_FAMILIES = {
+    "power": (_STATS_PACKAGES, {
+        "TTestPower", "TTestIndPower", "FTestPower", "FTestAnovaPower", "NormalIndPower",
+        "GofChisquarePower", "tt_solve_power", "tt_ind_solve_power", "zt_ind_solve_power",
+        "power_ttest", "power_ttest2n", "power_anova", "power_rm_anova", "power_corr",
+        "power_chi2",
+    }),
+    "hypothesis_test": (_STATS_PACKAGES, {
+        "ttest_ind", "ttest_rel", "ttest_1samp", "chi2_contingency", "chisquare",
+        "mannwhitneyu", "wilcoxon", "kruskal", "f_oneway", "pearsonr", "spearmanr",
+        "fisher_exact", "ttest", "anova", "mwu",
+    }),
+    "pairwise_tests": (_STATS_PACKAGES, {"pairwise_tests", "pairwise_ttests"}),
+    "correction": (_STATS_PACKAGES, {
+        "multipletests", "fdrcorrection", "fdrcorrection_twostage",
+        "false_discovery_control", "multicomp", "pairwise_tukeyhsd", "tukey_hsd",
+    }),
+    "assumption_check": (_STATS_PACKAGES, {
+        "shapiro", "normaltest", "kstest", "anderson", "probplot", "qqplot", "levene",
+        "bartlett", "fligner", "durbin_watson", "het_breuschpagan", "het_white",
+        "normality", "homoscedasticity", "sphericity",
+    }),
+    "parametric_test": (_STATS_PACKAGES, {
+        "ttest_ind", "ttest_rel", "f_oneway", "pearsonr", "linregress", "OLS", "ols",
+        "anova_lm", "ttest", "anova", "rm_anova", "linear_regression",
+    }),
+}
+
 
 class StatisticalValidator(BaseValidator):
     """
@@ -28,7 +145,15 @@ class StatisticalValidator(BaseValidator):
     - Assumption checking
     """
 
-    def __init__(self, project_root: Path, config: Optional[Dict] = None):
+    VERSION = "3"
+    READ_PATTERNS = ("**/*.py", "README.md", "docs/**/*.md")
+
+    def __init__(
+        self,
+        project_root: Path,
+        config: Optional[Dict] = None,
+        snapshot: Optional[ProjectSnapshot] = None
+    ):
         """
         Initialize statistical validator.
 
@@ -41,8 +166,9 @@ class StatisticalValidator(BaseValidator):
                 - require_confidence_intervals: Require CIs
                 - check_multiple_comparisons: Check for corrections
                 - require_assumption_checks: Require assumption testing
+            snapshot: Shared project file index (optional)
         """
-        super().__init__(project_root, config)
+        super().__init__(project_root, config, snapshot)
 
         cfg = config or {}
         self.require_power_analysis = cfg.get("require_power_analysis", True)
@@ -52,6 +178,10 @@ class StatisticalValidator(BaseValidator):
         self.check_multiple_comparisons = cfg.get("check_multiple_comparisons", True)
         self.require_assumption_checks = cfg.get("require_assumption_checks", True)
 
+        # Scan results for the code_contents list currently being validated
+        self._scanned_contents: Optional[List[tuple]] = None
+        self._scan_hits: List[Tuple[str, ScanHits, ModuleIndex]] = []
+
     def validate(self) -> List[ValidationResult]:
         """
         Run all statistical validations.
@@ -104,35 +234,92 @@ class StatisticalValidator(BaseValidator):
         if self.require_assumption_checks:
             self.validate_assumptions(code_contents)
 
+        # Release file contents before results are returned (or pickled)
+        self._scanned_contents, self._scan_hits = None, []
+
         return self.get_results()
 
     # ============================================================================
     # Helper Methods
     # ============================================================================
 
-    def extract_notebook_code(self, nb_file: Path) -> Optional[str]:
-        """Extract code from Jupyter notebook."""
-        import json
+    def scan_code(self, code_contents: List[tuple]) -> List[Tuple[str, ScanHits, ModuleIndex]]:
+        """
+        Scan code for all statistical pattern families.
 
-        try:
-            content = self.read_file(nb_file, relative=False)
-            if not content:
-                return None
+        Each file is scanned and indexed once per code_contents list; the
+        individual checks share the result.
+
+        Args:
+            code_contents: List of (filename, content) tuples
+
+        Returns:
+            List of (filename, ScanHits, ModuleIndex) tuples
+        """
+        if self._scanned_contents is not code_contents:
+            self._scan_hits = [
+                (filename, STATISTICAL_SCANNER.scan(content), self.index_code(content))
+                for filename, content in code_contents
+            ]
+            self._scanned_contents = code_contents
+        return self._scan_hits
+
+    def find_evidence(self, code_contents: List[tuple], family: str) -> Dict[str, List[int]]:
+        """
+        Locate evidence of a pattern family.
+
+        Families in STATISTICAL_CALL_FAMILIES are answered from the AST
+        index for code that parses, so comments and strings do not count;
+        other families, and code that does not parse, use the text scan.
+        "multiple_tests" means hypothesis tests called inside a loop or
+        comprehension, or pairwise test helpers.
+
+        Args:
+            code_contents: List of (filename, content) tuples
+            family: Pattern family name
+
+        Returns:
+            Dict of filename -> line numbers, for files with evidence
+        """
+        evidence = {}
+        for filename, hits, module in self.scan_code(code_contents):
+            if module.parsed and (family in STATISTICAL_CALL_FAMILIES or family == "multiple_tests"):
+                lines = self._call_lines(module, family)
+            else:
+                lines = hits.lines(family)
+            if lines:
+                evidence[filename] = lines
+        return evidence
+
+    @staticmethod
+    def _call_lines(module: ModuleIndex, family: str) -> List[int]:
+        """Line numbers of AST evidence for a family."""
+        if family == "multiple_tests":
+            calls = [c for c in module.calls_named(*STATISTICAL_CALL_FAMILIES["hypothesis_test"])
+                     if c.in_loop]
+            calls += module.calls_named(*STATISTICAL_CALL_FAMILIES["pairwise_tests"])
+        else:
+            calls = module.calls_named(*STATISTICAL_CALL_FAMILIES[family])
 
-            notebook = json.loads(content)
-            cells = notebook.get("cells", [])
+        lines = {call.line for call in calls}
+        if family == "power":
+            lines.update(site.line for site in module.imports_from("statsmodels.stats.power"))
+        return sorted(lines)
 
-            code_cells = []
-            for cell in cells:
-                if cell.get("cell_type") == "code":
-                    source = cell.get("source", [])
-                    if isinstance(source, list):
-                        code_cells.append("".join(source))
-                    else:
-                        code_cells.append(source)
+    def extract_notebook_code(self, nb_file: Path) -> Optional[str]:
+        """
+        Extract code from Jupyter notebook.
 
-            return "\n\n".join(code_cells)
+        The notebook is streamed from disk (see notebook_reader), so cell
+        outputs are neither cached in the snapshot nor held in memory.
+        """
+        fp = self.open_file(nb_file, relative=False)
+        if fp is None:
+            return None
 
+        try:
+            with fp:
+                return "\n\n".join(iter_code_cells(fp))
         except Exception as e:
             logger.error(f"Error extracting code from {nb_file}: {e}")
             return None
@@ -146,32 +333,19 @@ class StatisticalValidator(BaseValidator):
         check_name = "Power Analysis"
         category = "statistical"
 
-        # Patterns for power analysis
-        power_patterns = [
-            re.compile(r"power[_\s]*analysis", re.IGNORECASE),
-            re.compile(r"statsmodels\.stats\.power", re.IGNORECASE),
-            re.compile(r"from.*power.*import", re.IGNORECASE),
-            re.compile(r"pwr\.", re.IGNORECASE),  # R pwr package
-            re.compile(r"TTestPower|FTestAnovaPower|NormalIndPower", re.IGNORECASE),
-            re.compile(r"sample[_\s]*size[_\s]*calculation", re.IGNORECASE),
-        ]
-
-        files_with_power = []
-        for filename, content in code_contents:
-            if any(pattern.search(content) for pattern in power_patterns):
-                files_with_power.append(filename)
+        files_with_power = list(self.find_evidence(code_contents, "power"))
 
         # Also check documentation
         docs_files = self.find_files("docs/**/*.md")
         readme = self.read_file("README.md")
 
         doc_has_power = False
-        if readme and any(pattern.search(readme) for pattern in power_patterns):
+        if readme and STATISTICAL_SCANNER.scan(readme).has("power"):
             doc_has_power = True
 
         for doc_file in docs_files:
             content = self.read_file(doc_file, relative=False)
-            if content and any(pattern.search(content) for pattern in power_patterns):
+            if content and STATISTICAL_SCANNER.scan(content).has("power"):
                 doc_has_power = True
                 break
 
@@ -203,25 +377,7 @@ class StatisticalValidator(BaseValidator):
         check_name = "Effect Size Reporting"
         category = "statistical"
 
-        # Patterns for effect size calculations
-        effect_size_patterns = [
-            re.compile(r"cohen[_\s]*d", re.IGNORECASE),
-            re.compile(r"effect[_\s]*size", re.IGNORECASE),
-            re.compile(r"eta[_\s]*squared", re.IGNORECASE),
-            re.compile(r"omega[_\s]*squared", re.IGNORECASE),
-            re.compile(r"partial[_\s]*eta", re.IGNORECASE),
-            re.compile(r"hedges[_\s]*g", re.IGNORECASE),
-            re.compile(r"glass[_\s]*delta", re.IGNORECASE),
-            re.compile(r"cramer[_\s]*v", re.IGNORECASE),
-            re.compile(r"odds[_\s]*ratio", re.IGNORECASE),
-            re.compile(r"risk[_\s]*ratio", re.IGNORECASE),
-            re.compile(r"correlation[_\s]*coefficient", re.IGNORECASE),
-        ]
-
-        files_with_effect_sizes = []
-        for filename, content in code_contents:
-            if any(pattern.search(content) for pattern in effect_size_patterns):
-                files_with_effect_sizes.append(filename)
+        files_with_effect_sizes = list(self.find_evidence(code_contents, "effect_size"))
 
         if files_with_effect_sizes:
             self.pass_check(
@@ -249,37 +405,20 @@ class StatisticalValidator(BaseValidator):
         check_name = "P-Value Usage"
         category = "statistical"
 
-        # Check for p-value calculations
-        pvalue_patterns = [
-            re.compile(r"p[_\s]*value", re.IGNORECASE),
-            re.compile(r"pval", re.IGNORECASE),
-            re.compile(r"\.pvalue", re.IGNORECASE),
-            re.compile(r"ttest|chi2|anova|mannwhitneyu|wilcoxon|kruskal", re.IGNORECASE),
-        ]
-
-        # Problematic interpretation patterns
-        problematic_patterns = [
-            re.compile(r"marginally\s+significant", re.IGNORECASE),
-            re.compile(r"trending\s+toward", re.IGNORECASE),
-            re.compile(r"approached\s+significance", re.IGNORECASE),
-            re.compile(r"almost\s+significant", re.IGNORECASE),
-        ]
-
         files_with_pvalues = []
         files_with_problems = []
+        problem_locations = {}
 
-        for filename, content in code_contents:
+        for filename, hits, _ in self.scan_code(code_contents):
             # Skip validator files themselves (they contain detection patterns as strings)
             is_validator = "quality_assurance" in filename and filename.endswith("_validator.py")
 
-            has_pvalue = any(pattern.search(content) for pattern in pvalue_patterns)
-            has_problem = any(pattern.search(content) for pattern in problematic_patterns)
-
-            if has_pvalue:
+            if hits.has("p_value"):
                 files_with_pvalues.append(filename)
 
-            if has_problem and not is_validator:
+            if hits.has("p_value_problematic") and not is_validator:
                 files_with_problems.append(filename)
+                problem_locations[filename] = hits.lines("p_value_problematic")
 
         if files_with_problems:
             self.warn_check(
@@ -288,6 +427,7 @@ class StatisticalValidator(BaseValidator):
                 category=category,
                 details={
                     "files": files_with_problems,
+                    "lines": problem_locations,
                     "issue": "Avoid 'marginally significant', 'trending', or similar language",
                     "recommendation": "Report exact p-values and interpret binary (significant/not significant)"
                 }
@@ -315,18 +455,7 @@ class StatisticalValidator(BaseValidator):
         check_name = "Confidence Intervals"
         category = "statistical"
 
-        ci_patterns = [
-            re.compile(r"confidence[_\s]*interval", re.IGNORECASE),
-            re.compile(r"\bci\b", re.IGNORECASE),
-            re.compile(r"confint", re.IGNORECASE),
-            re.compile(r"conf_int", re.IGNORECASE),
-            re.compile(r"\.conf_int\(", re.IGNORECASE),
-        ]
-
-        files_with_cis = []
-        for filename, content in code_contents:
-            if any(pattern.search(content) for pattern in ci_patterns):
-                files_with_cis.append(filename)
+        files_with_cis = list(self.find_evidence(code_contents, "confidence_interval"))
 
         if files_with_cis:
             self.pass_check(
@@ -354,37 +483,9 @@ class StatisticalValidator(BaseValidator):
         check_name = "Multiple Comparison Corrections"
         category = "statistical"
 
-        # Detect multiple comparisons
-        multiple_test_indicators = [
-            re.compile(r"for\s+\w+\s+in.*:\s*ttest", re.IGNORECASE),
-            re.compile(r"for\s+\w+\s+in.*:\s*chi2", re.IGNORECASE),
-            re.compile(r"for\s+\w+\s+in.*:\s*mannwhitneyu", re.IGNORECASE),
-            re.compile(r"multiple.*test", re.IGNORECASE),
-            re.compile(r"pairwise.*comparison", re.IGNORECASE),
-        ]
-
-        # Correction methods
-        correction_patterns = [
-            re.compile(r"bonferroni", re.IGNORECASE),
-            re.compile(r"holm", re.IGNORECASE),
-            re.compile(r"benjamini", re.IGNORECASE),
-            re.compile(r"hochberg", re.IGNORECASE),
-            re.compile(r"fdr", re.IGNORECASE),
-            re.compile(r"multipletests", re.IGNORECASE),
-            re.compile(r"p\.adjust", re.IGNORECASE),
-        ]
-
-        files_with_multiple = []
-        files_with_correction = []
-
-        for filename, content in code_contents:
-            has_multiple = any(pattern.search(content) for pattern in multiple_test_indicators)
-            has_correction = any(pattern.search(content) for pattern in correction_patterns)
-
-            if has_multiple:
-                files_with_multiple.append(filename)
-            if has_correction:
-                files_with_correction.append(filename)
+        multiple = self.find_evidence(code_contents, "multiple_tests")
+        files_with_multiple = list(multiple)
+        files_with_correction = list(self.find_evidence(code_contents, "correction"))
 
         if not files_with_multiple:
             self.skip_check(
@@ -409,6 +510,7 @@ class StatisticalValidator(BaseValidator):
                 category=category,
                 details={
                     "files": files_with_multiple,
+                    "lines": multiple,
                     "recommendation": "Apply Bonferroni, Holm, or FDR correction for multiple comparisons"
                 }
             )
@@ -422,44 +524,9 @@ class StatisticalValidator(BaseValidator):
         check_name = "Statistical Assumptions"
         category = "statistical"
 
-        # Assumption test patterns
-        assumption_patterns = [
-            # Normality tests
-            re.compile(r"shapiro|normaltest|kstest|anderson", re.IGNORECASE),
-            re.compile(r"qqplot|probplot", re.IGNORECASE),
-
-            # Homogeneity of variance
-            re.compile(r"levene|bartlett|fligner", re.IGNORECASE),
-
-            # Sphericity
-            re.compile(r"mauchly", re.IGNORECASE),
-
-            # Independence
-            re.compile(r"durbin.watson", re.IGNORECASE),
-
-            # General diagnostics
-            re.compile(r"diagnostic|residual.*plot", re.IGNORECASE),
-        ]
-
-        # Parametric tests that require assumptions
-        parametric_tests = [
-            re.compile(r"ttest_ind|ttest_rel", re.IGNORECASE),
-            re.compile(r"anova|f_oneway", re.IGNORECASE),
-            re.compile(r"pearsonr", re.IGNORECASE),
-            re.compile(r"linregress|OLS|regression", re.IGNORECASE),
-        ]
-
-        files_with_parametric = []
-        files_with_assumptions = []
-
-        for filename, content in code_contents:
-            has_parametric = any(pattern.search(content) for pattern in parametric_tests)
-            has_assumptions = any(pattern.search(content) for pattern in assumption_patterns)
-
-            if has_parametric:
-                files_with_parametric.append(filename)
-            if has_assumptions:
-                files_with_assumptions.append(filename)
+        parametric = self.find_evidence(code_contents, "parametric_test")
+        files_with_parametric = list(parametric)
+        files_with_assumptions = list(self.find_evidence(code_contents, "assumption_check"))
 
         if not files_with_parametric:
             self.skip_check(
@@ -484,6 +551,7 @@ class StatisticalValidator(BaseValidator):
                 category=category,
                 details={
                     "files": files_with_parametric,
+                    "lines": parametric,
                     "recommendation": "Check normality, homogeneity of variance, and other assumptions"
                 }
             )
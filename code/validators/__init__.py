@@ -8,10 +8,12 @@ from .base import BaseValidator
 from .finer_validator import FINERValidator
 from .prisma_validator import PRISMAValidator
 from .nih_validator import NIHRigorValidator
+from .cache import ValidationCache
 
 __all__ = [
     "BaseValidator",
     "FINERValidator",
     "PRISMAValidator",
     "NIHRigorValidator",
+    "ValidationCache",
 ]
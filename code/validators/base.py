@@ -6,7 +6,7 @@ Abstract base class for all phase validators.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import sys
 
 # Add parent directory to path
@@ -65,6 +65,28 @@ class BaseValidator(ABC):
         """
         return self.can_exit()
 
+    def input_files(self) -> Optional[List[str]]:
+        """
+        Files, relative to project root, that can_exit() reads.
+
+        Declaring them lets the orchestrator cache exit validation until
+        one of them changes. Return None (the default) if can_exit()
+        depends on anything else, so it always runs.
+
+        Returns:
+            Relative file paths, or None if results cannot be cached
+        """
+        return None
+
+    def cache_config(self) -> dict:
+        """
+        Settings that change can_exit() results for the same input files.
+
+        Returns:
+            JSON-serializable configuration, part of the cache key
+        """
+        return {"validator": type(self).__name__, "input_files": self.input_files()}
+
     def _file_exists(self, filepath: str) -> bool:
         """Check if a file exists relative to project root"""
         path = self.project_root / filepath
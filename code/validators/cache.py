@@ -0,0 +1,163 @@
+"""
+Validation Cache
+
+Caches exit validation results keyed by each validator's declared input
+files and configuration, so repeated status checks cost a few ``stat``
+calls instead of re-reading every document and CSV.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+import copy
+import hashlib
+import json
+import logging
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from workflow_context import ValidationResult, _write_json_atomic
+from validators.base import BaseValidator
+
+logger = logging.getLogger(__name__)
+
+# Bump when validator changes alter results, so cached results are not reused
+CACHE_VERSION = "1"
+
+# Files modified this close to a validation may have changed again within
+# the same mtime tick, so their content is re-hashed instead of trusted
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class ValidationCache:
+    """
+    Cache of ``can_exit()`` results for validators that declare their inputs.
+
+    Each entry stores the size, mtime and SHA-256 of every input file.
+    A lookup stats the files: matching size and mtime is a hit. A file
+    whose mtime changed (or falls too close to the validation time to
+    trust) is re-hashed, and the entry still hits if its content is the
+    same. Missing files are part of the key, so creating one invalidates
+    the entry.
+    """
+
+    def __init__(self, filepath: Optional[Path] = None):
+        """
+        Initialize cache.
+
+        Args:
+            filepath: JSON file to persist entries in (None keeps them in memory)
+        """
+        self.filepath = Path(filepath) if filepath else None
+        self._entries: Optional[Dict[str, dict]] = None
+
+    def can_exit(self, validator: BaseValidator) -> ValidationResult:
+        """
+        Run ``validator.can_exit()``, or return its cached result.
+
+        Args:
+            validator: Validator to run
+
+        Returns:
+            ValidationResult for the current input files
+        """
+        inputs = validator.input_files()
+        if inputs is None:
+            return validator.can_exit()
+
+        key = self._key(validator)
+        entries = self._load()
+        entry = entries.get(key)
+        if entry is not None and self._is_current(validator.project_root, entry):
+            return ValidationResult(**copy.deepcopy(entry["result"]))
+
+        # Signatures are taken before validating: a file changed in between
+        # leaves a stale signature, which only forces a recompute next time
+        validated_at_ns = time.time_ns()
+        files = {path: _signature(validator.project_root / path) for path in inputs}
+        result = validator.can_exit()
+
+        entries[key] = {
+            "validated_at_ns": validated_at_ns,
+            "files": files,
+            "result": result.to_dict()
+        }
+        self._save()
+        return result
+
+    def clear(self):
+        """Drop all cached results"""
+        self._entries = {}
+        self._save()
+
+    def _key(self, validator: BaseValidator) -> str:
+        payload = json.dumps({
+            "version": CACHE_VERSION,
+            "project_root": str(Path(validator.project_root).resolve()),
+            "config": validator.cache_config()
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _is_current(self, project_root: Path, entry: dict) -> bool:
+        """Whether every input file still matches the entry (refreshing trusted mtimes)"""
+        checked_at_ns = time.time_ns()
+        racy_before = entry["validated_at_ns"] - RACY_WINDOW_NS
+        rehashed = False
+
+        for path, stored in entry["files"].items():
+            try:
+                st = (Path(project_root) / path).stat()
+            except FileNotFoundError:
+                if stored is None:
+                    continue
+                return False
+            if stored is None or st.st_size != stored[0]:
+                return False
+            if st.st_mtime_ns == stored[1] and st.st_mtime_ns < racy_before:
+                continue
+
+            current = _signature(Path(project_root) / path)
+            if current is None or current[2] != stored[2]:
+                return False
+            entry["files"][path] = current
+            rehashed = True
+
+        if rehashed:
+            # Content confirmed as of this check, so the new mtimes can be trusted
+            entry["validated_at_ns"] = checked_at_ns
+            self._save()
+        return True
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            self._entries = {}
+            if self.filepath is not None and self.filepath.exists():
+                try:
+                    with open(self.filepath, 'r') as f:
+                        data = json.load(f)
+                    if data.get("version") == CACHE_VERSION:
+                        self._entries = data.get("entries", {})
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable validation cache {self.filepath}: {e}")
+        return self._entries
+
+    def _save(self):
+        if self.filepath is None:
+            return
+        try:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            _write_json_atomic(self.filepath, {"version": CACHE_VERSION, "entries": self._entries})
+        except OSError as e:
+            logger.warning(f"Cannot write validation cache {self.filepath}: {e}")
+
+
+def _signature(path: Path) -> Optional[List]:
+    """[size, mtime_ns, sha256] of a file, or None if it does not exist"""
+    try:
+        st = path.stat()
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+    return [st.st_size, st.st_mtime_ns, digest]
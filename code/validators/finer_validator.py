@@ -30,6 +30,10 @@ class FINERValidator(BaseValidator):
         super().__init__(context)
         self.problem_statement_path = "docs/problem_statement.md"
 
+    def input_files(self) -> list:
+        """Problem statement is the only input"""
+        return [self.problem_statement_path]
+
     def can_enter(self) -> ValidationResult:
         """
         Problem formulation is always the first phase - no entry requirements.
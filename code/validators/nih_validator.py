@@ -31,6 +31,11 @@ class NIHRigorValidator(BaseValidator):
             "docs/power_analysis.md",
             "code/randomization.py"
         ]
+        self.preregistration_path = "data/preregistration.md"
+
+    def input_files(self) -> list:
+        """Required files plus the optional pre-registration"""
+        return self.required_files + [self.preregistration_path]
 
     def can_enter(self) -> ValidationResult:
         """
@@ -84,8 +89,7 @@ class NIHRigorValidator(BaseValidator):
             checks["random_seed"] = False
 
         # Check pre-registration
-        prereg_file = "data/preregistration.md"
-        if self._file_exists(prereg_file):
+        if self._file_exists(self.preregistration_path):
             checks["preregistration"] = True
         else:
             warnings.append("Pre-registration document recommended")
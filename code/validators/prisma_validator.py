@@ -28,6 +28,11 @@ class PRISMAValidator(BaseValidator):
             "data/literature/included_studies.csv",
             "results/prisma_flow_diagram.md"
         ]
+        self.risk_of_bias_path = "results/risk_of_bias_assessment.csv"
+
+    def input_files(self) -> list:
+        """Required files plus the optional risk of bias assessment"""
+        return self.required_files + [self.risk_of_bias_path]
 
     def can_enter(self) -> ValidationResult:
         """
@@ -81,8 +86,7 @@ class PRISMAValidator(BaseValidator):
             checks["minimum_studies"] = False
 
         # Check for risk of bias assessment
-        rob_file = "results/risk_of_bias_assessment.csv"
-        if self._file_exists(rob_file):
+        if self._file_exists(self.risk_of_bias_path):
             checks["risk_of_bias"] = True
         else:
             warnings.append("Risk of bias assessment not found (recommended)")
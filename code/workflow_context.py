@@ -11,8 +11,15 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import json
+import os
 import uuid
 
+# Journal events kept before the next save writes a fresh snapshot
+COMPACT_EVERY = 500
+
+# Backups kept by create_backup (oldest are removed first)
+BACKUP_RETENTION = 20
+
 
 class Mode(str, Enum):
     """Research workflow operation mode"""
@@ -90,6 +97,11 @@ class WorkflowContext:
     # File paths
     project_root: Path = field(default_factory=lambda: Path.cwd())
 
+    # Journals of the state files this context was loaded from or saved to
+    _journals: Dict[Path, "WorkflowJournal"] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def update_timestamp(self):
         """Update the last modified timestamp"""
         self.updated_at = datetime.now().isoformat()
@@ -163,35 +175,30 @@ class WorkflowContext:
         phases = list(ResearchPhase)
         return phases.index(self.current_phase)
 
-    def to_dict(self) -> dict:
-        """Convert context to dictionary for serialization"""
-        data = {
+    def state_fields(self) -> dict:
+        """Serialize top-level fields (everything but phase history and audit trail)"""
+        return {
             "workflow_id": self.workflow_id,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
             "mode": self.mode.value,
             "current_phase": self.current_phase.value,
-            "phase_history": [
-                {
-                    "phase": record.phase.value,
-                    "entered_at": record.entered_at,
-                    "exited_at": record.exited_at,
-                    "validation_score": record.validation_score,
-                    "outputs": record.outputs,
-                    "agent_used": record.agent_used,
-                    "notes": record.notes
-                }
-                for record in self.phase_history
-            ],
             "research_question": self.research_question,
             "domain": self.domain,
             "resources": self.resources,
             "validation_results": {
                 k: v.to_dict() for k, v in self.validation_results.items()
             },
-            "audit_trail": self.audit_trail,
             "project_root": str(self.project_root)
         }
+
+    def to_dict(self) -> dict:
+        """Convert context to dictionary for serialization"""
+        data = self.state_fields()
+        data["phase_history"] = [
+            _phase_record_to_dict(record) for record in self.phase_history
+        ]
+        data["audit_trail"] = self.audit_trail
         return data
 
     @classmethod
@@ -220,25 +227,218 @@ class WorkflowContext:
         return cls(**data)
 
     def save(self, filepath: Optional[Path] = None):
-        """Save context to JSON file"""
+        """
+        Save context to its state file.
+
+        The state file is a snapshot; changes since the last save are
+        appended to a journal next to it (see WorkflowJournal).
+        """
         if filepath is None:
             filepath = self.project_root / ".research_workflow" / "state.json"
+        filepath = Path(filepath)
 
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        journal = self._journals.get(filepath)
+        if journal is None:
+            journal = self._journals[filepath] = WorkflowJournal(filepath)
+        journal.save(self)
 
     @classmethod
     def load(cls, filepath: Path) -> "WorkflowContext":
-        """Load context from JSON file"""
-        with open(filepath, 'r') as f:
+        """Load context from its last snapshot plus the journal tail"""
+        filepath = Path(filepath)
+        journal = WorkflowJournal(filepath)
+        context = cls.from_dict(journal.load())
+        journal.mark_saved(context)
+        context._journals[filepath] = journal
+        return context
+
+
+def _phase_record_to_dict(record: PhaseRecord) -> dict:
+    return {
+        "phase": record.phase.value,
+        "entered_at": record.entered_at,
+        "exited_at": record.exited_at,
+        "validation_score": record.validation_score,
+        "outputs": record.outputs,
+        "agent_used": record.agent_used,
+        "notes": record.notes
+    }
+
+
+def _write_json_atomic(filepath: Path, data: dict):
+    """Write JSON via a temporary file and rename, so readers never see a partial file"""
+    tmp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+
+
+class WorkflowJournal:
+    """
+    Journaled storage for one workflow state file.
+
+    The state file (e.g. ``state.json``) holds a compacted snapshot.
+    Changes made after it are appended to ``<name>.journal.jsonl``,
+    one event per line:
+
+    - ``audit``: a new audit trail entry
+    - ``phase``: a new or updated phase record, by index
+    - ``fields``: changed top-level fields (current phase, validation results, ...)
+
+    A save appends only what changed since the previous save, so its cost
+    does not grow with the audit trail. Once the journal holds
+    ``compact_every`` events, the next save rewrites the snapshot
+    atomically and empties the journal. Events carry sequence numbers and
+    the snapshot records the last one it includes, so a crash between the
+    two steps cannot replay an event twice; a torn final line is ignored.
+    """
+
+    def __init__(self, filepath: Path, compact_every: int = COMPACT_EVERY):
+        """
+        Initialize journal for a state file.
+
+        Args:
+            filepath: Snapshot path
+            compact_every: Journal events kept before the next snapshot
+        """
+        self.filepath = Path(filepath)
+        self.log_path = self.filepath.with_name(f"{self.filepath.stem}.journal.jsonl")
+        self.compact_every = compact_every
+
+        self.seq = 0  # Last event sequence number on disk
+        self.log_events = 0  # Events in the journal after the snapshot
+
+        # What the files hold as of the last save/load (None: nothing written yet)
+        self._fields: Optional[dict] = None
+        self._audit_count = 0
+        self._phase_count = 0
+        self._last_phase: Optional[dict] = None
+
+    def load(self) -> dict:
+        """Read the snapshot and replay the journal tail onto it"""
+        with open(self.filepath, 'r') as f:
             data = json.load(f)
-        return cls.from_dict(data)
 
+        snapshot_seq = data.pop("journal_seq", 0)
+        self.seq = snapshot_seq
+        self.log_events = 0
 
-def create_backup(context: WorkflowContext, backup_dir: Optional[Path] = None):
-    """Create timestamped backup of workflow state"""
+        for event in self._read_log():
+            if event["seq"] <= snapshot_seq:
+                continue
+            self._apply(data, event)
+            self.seq = event["seq"]
+            self.log_events += 1
+
+        return data
+
+    def save(self, context: WorkflowContext):
+        """Append the context's changes since the last save, compacting when due"""
+        fields = json.loads(json.dumps(context.state_fields()))
+
+        rewritten = (
+            len(context.audit_trail) < self._audit_count or
+            len(context.phase_history) < self._phase_count
+        )
+        if self._fields is None or rewritten or self.log_events >= self.compact_every:
+            self.write_snapshot(context)
+        else:
+            events = [
+                {"type": "audit", "entry": entry}
+                for entry in context.audit_trail[self._audit_count:]
+            ]
+
+            # Only the latest phase record is updated in place (on completion)
+            for index in range(max(self._phase_count - 1, 0), len(context.phase_history)):
+                record = _phase_record_to_dict(context.phase_history[index])
+                if index == self._phase_count - 1 and record == self._last_phase:
+                    continue
+                events.append({"type": "phase", "index": index, "record": record})
+
+            changed = {k: v for k, v in fields.items() if self._fields.get(k) != v}
+            if changed:
+                events.append({"type": "fields", "values": changed})
+
+            self._append(events)
+
+        self.mark_saved(context, fields)
+
+    def write_snapshot(self, context: WorkflowContext):
+        """Write the full state atomically and empty the journal"""
+        data = context.to_dict()
+        data["journal_seq"] = self.seq
+        _write_json_atomic(self.filepath, data)
+
+        if self.log_path.exists():
+            self.log_path.write_text("")
+        self.log_events = 0
+
+    def mark_saved(self, context: WorkflowContext, fields: Optional[dict] = None):
+        """Record the context's current state as what is on disk"""
+        if fields is None:
+            fields = json.loads(json.dumps(context.state_fields()))
+        self._fields = fields
+        self._audit_count = len(context.audit_trail)
+        self._phase_count = len(context.phase_history)
+        self._last_phase = (
+            json.loads(json.dumps(_phase_record_to_dict(context.phase_history[-1])))
+            if context.phase_history else None
+        )
+
+    def _append(self, events: List[dict]):
+        if not events:
+            return
+
+        lines = []
+        for event in events:
+            self.seq += 1
+            lines.append(json.dumps({"seq": self.seq, **event}) + "\n")
+
+        with open(self.log_path, 'a') as f:
+            f.write("".join(lines))
+            f.flush()
+            os.fsync(f.fileno())
+        self.log_events += len(events)
+
+    def _read_log(self):
+        if not self.log_path.exists():
+            return
+        with open(self.log_path, 'r') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn write from an interrupted save; nothing after it was acknowledged
+                    return
+
+    @staticmethod
+    def _apply(data: dict, event: dict):
+        if event["type"] == "audit":
+            data.setdefault("audit_trail", []).append(event["entry"])
+        elif event["type"] == "phase":
+            history = data.setdefault("phase_history", [])
+            if event["index"] < len(history):
+                history[event["index"]] = event["record"]
+            else:
+                history.append(event["record"])
+        elif event["type"] == "fields":
+            data.update(event["values"])
+
+
+def create_backup(
+    context: WorkflowContext,
+    backup_dir: Optional[Path] = None,
+    keep: int = BACKUP_RETENTION
+):
+    """
+    Create timestamped backup of workflow state.
+
+    Backups are standalone snapshots; only the newest ``keep`` are kept.
+    """
     if backup_dir is None:
         backup_dir = context.project_root / ".research_workflow" / "backups"
 
@@ -247,5 +447,10 @@ def create_backup(context: WorkflowContext, backup_dir: Optional[Path] = None):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_file = backup_dir / f"state_{timestamp}.json"
 
-    context.save(backup_file)
+    _write_json_atomic(backup_file, context.to_dict())
+
+    # Timestamped names sort chronologically
+    for old_backup in sorted(backup_dir.glob("state_*.json"))[:-keep]:
+        old_backup.unlink()
+
     return backup_file
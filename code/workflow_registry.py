@@ -0,0 +1,390 @@
+"""
+Workflow Registry
+
+Indexes workflow summaries from many project roots into one SQLite
+database, so status queries across projects do not parse state files.
+"""
+
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+import logging
+import os
+import sqlite3
+import sys
+import threading
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from workflow_context import WorkflowContext, WorkflowJournal, ResearchPhase, Mode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY_PATH = Path.home() / ".research_workflow" / "registry.sqlite"
+
+# State file of a project, relative to its root
+STATE_FILE = Path(".research_workflow") / "state.json"
+
+
+@dataclass
+class WorkflowSummary:
+    """Indexed summary of one project's workflow"""
+    project_root: str
+    workflow_id: str
+    research_question: str
+    domain: str
+    mode: Mode
+    current_phase: ResearchPhase
+    phase_entered_at: Optional[str]
+    last_validation_score: Optional[float]
+    completed_phases: int
+    updated_at: str
+
+    @classmethod
+    def from_context(cls, project_root: Path, context: WorkflowContext) -> "WorkflowSummary":
+        """Summarize a loaded workflow context"""
+        current = next(
+            (r for r in reversed(context.phase_history) if r.phase == context.current_phase),
+            None
+        )
+        last_score = next(
+            (r.validation_score for r in reversed(context.phase_history)
+             if r.validation_score is not None),
+            None
+        )
+        return cls(
+            project_root=str(project_root),
+            workflow_id=context.workflow_id,
+            research_question=context.research_question,
+            domain=context.domain,
+            mode=context.mode,
+            current_phase=context.current_phase,
+            phase_entered_at=current.entered_at if current else None,
+            last_validation_score=last_score,
+            completed_phases=sum(
+                1 for phase in ResearchPhase if context.has_completed_phase(phase)
+            ),
+            updated_at=context.updated_at
+        )
+
+
+@dataclass
+class RefreshStats:
+    """What a registry refresh did"""
+    checked: int = 0
+    updated: int = 0
+    removed: int = 0
+    failed: int = 0
+
+
+class WorkflowRegistry:
+    """
+    Registry of research workflows across project roots.
+
+    Each registered root's summary is stored with the size and mtime of
+    its state file and journal. ``refresh`` stats those files and reloads
+    only the projects whose files changed, so keeping hundreds of projects
+    current costs a few hundred ``stat`` calls; queries then run against
+    indexed columns.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize registry.
+
+        Args:
+            db_path: SQLite database (default: ~/.research_workflow/registry.sqlite)
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_REGISTRY_PATH
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_db(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS workflows (
+                    project_root TEXT PRIMARY KEY,
+                    workflow_id TEXT,
+                    research_question TEXT,
+                    domain TEXT,
+                    mode TEXT,
+                    current_phase TEXT,
+                    phase_entered_at TEXT,
+                    last_validation_score REAL,
+                    completed_phases INTEGER,
+                    updated_at TEXT,
+                    file_signature TEXT,  -- size:mtime of state file and journal
+                    error TEXT,
+                    indexed_at TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_workflows_phase ON workflows(current_phase, phase_entered_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_workflows_mode ON workflows(mode)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_workflows_updated ON workflows(updated_at)")
+            conn.commit()
+
+    def register(self, project_root: Union[str, Path]) -> Optional[WorkflowSummary]:
+        """
+        Add a project root and index its current state.
+
+        Args:
+            project_root: Directory containing .research_workflow/state.json
+
+        Returns:
+            The project's summary, or None if it has no readable state yet
+        """
+        root = str(Path(project_root).resolve())
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO workflows (project_root, indexed_at) VALUES (?, ?)",
+                (root, datetime.now().isoformat())
+            )
+            conn.commit()
+        self.refresh([root])
+        return self.get(root)
+
+    def register_tree(self, search_root: Union[str, Path]) -> int:
+        """
+        Register every project found under a directory.
+
+        Args:
+            search_root: Directory to search for .research_workflow/state.json
+
+        Returns:
+            Number of project roots registered
+        """
+        roots = []
+        for dirpath, dirnames, _filenames in os.walk(search_root):
+            if ".research_workflow" in dirnames:
+                if (Path(dirpath) / STATE_FILE).is_file():
+                    roots.append(dirpath)
+            # Never descend into workflow state or hidden directories
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+
+        for root in roots:
+            self.register(root)
+        return len(roots)
+
+    def unregister(self, project_root: Union[str, Path]):
+        """Remove a project root from the registry"""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "DELETE FROM workflows WHERE project_root = ?",
+                (str(Path(project_root).resolve()),)
+            )
+            conn.commit()
+
+    def refresh(self, project_roots: Optional[Iterable[str]] = None) -> RefreshStats:
+        """
+        Re-index projects whose state files changed since they were indexed.
+
+        Args:
+            project_roots: Registered roots to check (default: all)
+
+        Returns:
+            RefreshStats
+        """
+        with closing(self._connect()) as conn:
+            if project_roots is None:
+                rows = conn.execute("SELECT project_root, file_signature FROM workflows").fetchall()
+            else:
+                roots = list(project_roots)
+                rows = conn.execute(
+                    f"SELECT project_root, file_signature FROM workflows "
+                    f"WHERE project_root IN ({', '.join('?' * len(roots))})",
+                    roots
+                ).fetchall()
+
+            stats = RefreshStats()
+            for root, indexed_signature in rows:
+                stats.checked += 1
+                state_path = Path(root) / STATE_FILE
+                signature = _file_signature(state_path)
+                if signature == indexed_signature:
+                    continue
+
+                if signature is None:
+                    # State removed; keep the root registered but drop its summary
+                    self._store(conn, root, None, None, "state file missing")
+                    stats.removed += 1
+                    continue
+
+                try:
+                    context = WorkflowContext.load(state_path)
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    logger.warning(f"Cannot index workflow at {root}: {e}")
+                    self._store(conn, root, None, signature, str(e))
+                    stats.failed += 1
+                    continue
+
+                self._store(conn, root, WorkflowSummary.from_context(Path(root), context), signature, None)
+                stats.updated += 1
+
+            conn.commit()
+        return stats
+
+    def watch(self, interval: float = 5.0, stop: Optional[threading.Event] = None):
+        """
+        Refresh repeatedly until ``stop`` is set.
+
+        Args:
+            interval: Seconds between refreshes
+            stop: Event that ends the loop (None runs until interrupted)
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            stats = self.refresh()
+            if stats.updated or stats.removed or stats.failed:
+                logger.info(
+                    f"Registry refresh: {stats.updated} updated, "
+                    f"{stats.removed} removed, {stats.failed} failed"
+                )
+            stop.wait(interval)
+
+    def get(self, project_root: Union[str, Path]) -> Optional[WorkflowSummary]:
+        """Get the indexed summary of one project"""
+        results = self._select(
+            "WHERE project_root = ? AND workflow_id IS NOT NULL",
+            [str(Path(project_root).resolve())]
+        )
+        return results[0] if results else None
+
+    def query(
+        self,
+        phase: Optional[ResearchPhase] = None,
+        mode: Optional[Mode] = None,
+        updated_before: Optional[datetime] = None,
+        entered_before: Optional[datetime] = None,
+        max_score: Optional[float] = None
+    ) -> List[WorkflowSummary]:
+        """
+        Find indexed projects, least recently updated first.
+
+        Args:
+            phase: Only projects currently in this phase
+            mode: Only projects in this mode
+            updated_before: Only projects not updated since this time
+            entered_before: Only projects that entered their current phase before this time
+            max_score: Only projects whose last validation score is at most this
+
+        Returns:
+            Matching summaries
+        """
+        clauses, params = ["workflow_id IS NOT NULL"], []
+        if phase is not None:
+            clauses.append("current_phase = ?")
+            params.append(ResearchPhase(phase).value)
+        if mode is not None:
+            clauses.append("mode = ?")
+            params.append(Mode(mode).value)
+        if updated_before is not None:
+            clauses.append("updated_at < ?")
+            params.append(updated_before.isoformat())
+        if entered_before is not None:
+            clauses.append("phase_entered_at < ?")
+            params.append(entered_before.isoformat())
+        if max_score is not None:
+            clauses.append("last_validation_score <= ?")
+            params.append(max_score)
+
+        return self._select(f"WHERE {' AND '.join(clauses)} ORDER BY updated_at", params)
+
+    def phase_counts(self) -> dict:
+        """Number of indexed projects in each phase"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("""
+                SELECT current_phase, COUNT(*) FROM workflows
+                WHERE workflow_id IS NOT NULL GROUP BY current_phase
+            """).fetchall()
+        return dict(rows)
+
+    def _select(self, where: str, params: list) -> List[WorkflowSummary]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(f"""
+                SELECT project_root, workflow_id, research_question, domain, mode,
+                       current_phase, phase_entered_at, last_validation_score,
+                       completed_phases, updated_at
+                FROM workflows {where}
+            """, params).fetchall()
+        return [
+            WorkflowSummary(
+                project_root=row[0],
+                workflow_id=row[1],
+                research_question=row[2],
+                domain=row[3],
+                mode=Mode(row[4]),
+                current_phase=ResearchPhase(row[5]),
+                phase_entered_at=row[6],
+                last_validation_score=row[7],
+                completed_phases=row[8],
+                updated_at=row[9]
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _store(
+        conn: sqlite3.Connection,
+        root: str,
+        summary: Optional[WorkflowSummary],
+        signature: Optional[str],
+        error: Optional[str]
+    ):
+        values = (None,) * 9
+        if summary is not None:
+            values = (
+                summary.workflow_id, summary.research_question, summary.domain,
+                summary.mode.value, summary.current_phase.value, summary.phase_entered_at,
+                summary.last_validation_score, summary.completed_phases, summary.updated_at
+            )
+        conn.execute("""
+            UPDATE workflows SET
+                workflow_id = ?, research_question = ?, domain = ?, mode = ?,
+                current_phase = ?, phase_entered_at = ?, last_validation_score = ?,
+                completed_phases = ?, updated_at = ?,
+                file_signature = ?, error = ?, indexed_at = ?
+            WHERE project_root = ?
+        """, (*values, signature, error, datetime.now().isoformat(), root))
+
+
+def _file_signature(state_path: Path) -> Optional[str]:
+    """Size and mtime of a state file and its journal (None if the state file is missing)"""
+    parts = []
+    for path in (state_path, WorkflowJournal(state_path).log_path):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            if path == state_path:
+                return None
+            parts.append("-")
+            continue
+        parts.append(f"{st.st_size}:{st.st_mtime_ns}")
+    return "|".join(parts)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Index research workflows across projects")
+    parser.add_argument("roots", nargs="*", help="Directories to search for projects")
+    parser.add_argument("--db", help="Registry database path")
+    parser.add_argument("--phase", help="Only list projects in this phase")
+    args = parser.parse_args()
+
+    registry = WorkflowRegistry(Path(args.db) if args.db else None)
+    for search_root in args.roots:
+        print(f"Registered {registry.register_tree(search_root)} project(s) under {search_root}")
+
+    stats = registry.refresh()
+    print(f"Checked {stats.checked}, re-indexed {stats.updated}")
+
+    phase = ResearchPhase(args.phase) if args.phase else None
+    for summary in registry.query(phase=phase):
+        score = "-" if summary.last_validation_score is None else f"{summary.last_validation_score:.2f}"
+        print(f"  {summary.current_phase.value:22} {score:>5}  {summary.updated_at}  {summary.project_root}")
@@ -20,7 +20,8 @@ MCP Configuration:
           "command": "python",
           "args": ["/path/to/mcp-servers/citation-management.py"],
           "env": {
-            "OPENCITATIONS_TOKEN": "optional_api_token"
+            "OPENCITATIONS_TOKEN": "optional_api_token",
+            "CITATION_CACHE_PATH": "/path/to/project/.research_workflow/doi_cache.sqlite"
           }
         }
       }
@@ -31,6 +32,11 @@ import os
 import sys
 import time
 import re
+import json
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
 from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
 import logging
@@ -43,12 +49,6 @@ except ImportError:
     sys.exit(1)
 
 # Citation APIs
-try:
-    from habanero import Crossref
-except ImportError:
-    print("ERROR: habanero not installed. Run: pip install habanero", file=sys.stderr)
-    sys.exit(1)
-
 try:
     import bibtexparser
     from bibtexparser.bwriter import BibTexWriter
@@ -77,12 +77,226 @@ mcp = FastMCP("citation-management")
 OPENCITATIONS_TOKEN = os.getenv("OPENCITATIONS_TOKEN")
 OPENCITATIONS_BASE_URL = "https://opencitations.net/index/api/v1"
 
-# Crossref client
-crossref = Crossref()
+# Crossref REST API
+CROSSREF_BASE_URL = "https://api.crossref.org/works"
+CROSSREF_MAILTO = os.getenv("CROSSREF_MAILTO")
 
 # Rate limiting
 RATE_LIMIT_DELAY = 1.0  # 1 second between API calls (polite)
 
+# Persistent DOI metadata store, shared with the QA CitationVerifier
+DOI_CACHE_PATH = Path(os.getenv(
+    "CITATION_CACHE_PATH",
+    str(Path(".research_workflow") / "doi_cache.sqlite")
+)).expanduser()
+DOI_CACHE_ENABLED = os.getenv("CITATION_CACHE_DISABLED", "").lower() not in ("1", "true", "yes")
+RETRACTION_TTL = float(os.getenv("CITATION_RETRACTION_TTL", str(7 * 24 * 3600)))  # 7 days
+NOT_FOUND_TTL = 24 * 3600  # Retry unresolvable DOIs daily
+
+# ============================================
+# DOI METADATA STORE
+# ============================================
+
+DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/",
+                "http://dx.doi.org/", "doi:")
+
+
+def clean_doi(doi: str) -> str:
+    """Strip resolver prefixes from a DOI"""
+    doi = doi.strip()
+    for prefix in DOI_PREFIXES:
+        if doi.lower().startswith(prefix):
+            return doi[len(prefix):]
+    return doi
+
+
+def normalize_doi(doi: str) -> str:
+    """DOI store key; must match normalize_doi in code/quality_assurance/doi_store.py"""
+    return clean_doi(doi).lower()
+
+
+class DOIMetadataStore:
+    """
+    SQLite store of Crossref work records with per-field freshness
+
+    Bibliographic metadata never expires. Retraction status is trusted for
+    RETRACTION_TTL seconds after the record was fetched or revalidated;
+    stale records are revalidated with If-None-Match/If-Modified-Since.
+    The schema matches code/quality_assurance/doi_store.py so both the QA
+    system and this server read and write the same file.
+    """
+
+    def __init__(self, path: Path, retraction_ttl: float = RETRACTION_TTL,
+                 not_found_ttl: float = NOT_FOUND_TTL, enabled: bool = True):
+        self.path = Path(path)
+        self.retraction_ttl = retraction_ttl
+        self.not_found_ttl = not_found_ttl
+        self.enabled = enabled
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS doi_metadata (
+                    doi TEXT PRIMARY KEY,
+                    valid INTEGER NOT NULL,
+                    metadata TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    metadata_fetched_at REAL NOT NULL,
+                    retraction_checked_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def get(self, doi: str) -> Optional[dict]:
+        """Return the stored record for a DOI with freshness flags, or None"""
+        if not self.enabled:
+            return None
+
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    """
+                    SELECT valid, metadata, etag, last_modified,
+                           metadata_fetched_at, retraction_checked_at
+                    FROM doi_metadata WHERE doi = ?
+                    """,
+                    (normalize_doi(doi),)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"DOI store read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        valid, metadata, etag, last_modified, fetched_at, checked_at = row
+        now = time.time()
+        return {
+            "valid": bool(valid),
+            "metadata": json.loads(metadata) if metadata else None,
+            "etag": etag,
+            "last_modified": last_modified,
+            "metadata_fresh": bool(valid) or now - fetched_at < self.not_found_ttl,
+            "retraction_fresh": now - checked_at < self.retraction_ttl,
+        }
+
+    def put(self, doi: str, valid: bool, metadata: Optional[dict] = None,
+            etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store a freshly fetched Crossref record"""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO doi_metadata
+                        (doi, valid, metadata, etag, last_modified,
+                         metadata_fetched_at, retraction_checked_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (normalize_doi(doi), int(valid),
+                     json.dumps(metadata) if metadata is not None else None,
+                     etag, last_modified, now, now)
+                )
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"DOI store write failed: {e}")
+
+    def mark_revalidated(self, doi: str) -> None:
+        """Record that a conditional request found the record unchanged"""
+        if not self.enabled:
+            return
+
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    "UPDATE doi_metadata SET retraction_checked_at = ? WHERE doi = ?",
+                    (time.time(), normalize_doi(doi))
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"DOI store write failed: {e}")
+
+
+doi_store = DOIMetadataStore(DOI_CACHE_PATH, enabled=DOI_CACHE_ENABLED)
+
+crossref_session = requests.Session()
+if CROSSREF_MAILTO:
+    crossref_session.headers["User-Agent"] = f"ResearchCitationManagement/1.0 (mailto:{CROSSREF_MAILTO})"
+
+_request_lock = threading.Lock()
+_last_request_at = 0.0
+
+
+def _throttle() -> None:
+    """Space outgoing Crossref requests RATE_LIMIT_DELAY apart"""
+    global _last_request_at
+    with _request_lock:
+        wait = _last_request_at + RATE_LIMIT_DELAY - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_request_at = time.monotonic()
+
+
+def fetch_crossref_work(doi_clean: str, need_retraction: bool = False) -> Optional[dict]:
+    """
+    Get the Crossref work record for a DOI, using the DOI store when fresh
+
+    Args:
+        doi_clean: DOI without resolver prefix
+        need_retraction: Require an up-to-date retraction status; stale
+            records are revalidated with a conditional request
+
+    Returns:
+        Crossref "message" dict, or None if the DOI does not exist
+
+    Raises:
+        requests.RequestException: On network errors or unexpected HTTP status
+    """
+    record = doi_store.get(doi_clean)
+    if record and record["metadata_fresh"] and (
+        record["retraction_fresh"] or not need_retraction or not record["valid"]
+    ):
+        logger.debug(f"DOI store hit: {doi_clean}")
+        return record["metadata"] if record["valid"] else None
+
+    headers = {}
+    if record and record["valid"]:
+        if record["etag"]:
+            headers["If-None-Match"] = record["etag"]
+        if record["last_modified"]:
+            headers["If-Modified-Since"] = record["last_modified"]
+
+    _throttle()
+    response = crossref_session.get(f"{CROSSREF_BASE_URL}/{doi_clean}", headers=headers, timeout=10)
+
+    if response.status_code == 304 and record:
+        doi_store.mark_revalidated(doi_clean)
+        return record["metadata"]
+
+    if response.status_code == 404:
+        doi_store.put(doi_clean, False)
+        return None
+
+    response.raise_for_status()
+    work = response.json().get("message", {})
+    doi_store.put(
+        doi_clean, True, work,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified")
+    )
+    return work
+
 # ============================================
 # CROSSREF API
 # ============================================
@@ -98,16 +312,15 @@ def verify_doi(doi: str) -> dict:
         Dictionary with verification status and metadata
     """
     # Clean DOI
-    doi_clean = doi.replace("https://doi.org/", "").replace("http://doi.org/", "")
+    doi_clean = clean_doi(doi)
 
     logger.info(f"Verifying DOI: {doi_clean}")
 
     try:
-        # Query Crossref
-        result = crossref.works(ids=doi_clean)
+        # Query Crossref (or the DOI store)
+        work = fetch_crossref_work(doi_clean)
 
-        if result and "message" in result:
-            work = result["message"]
+        if work is not None:
 
             # Extract key fields
             title = work.get("title", [""])[0] if work.get("title") else ""
@@ -153,15 +366,14 @@ def check_retraction(doi: str) -> dict:
     Returns:
         Dictionary with retraction status
     """
-    doi_clean = doi.replace("https://doi.org/", "").replace("http://doi.org/", "")
+    doi_clean = clean_doi(doi)
 
     logger.info(f"Checking retraction status: {doi_clean}")
 
     try:
-        result = crossref.works(ids=doi_clean)
+        work = fetch_crossref_work(doi_clean, need_retraction=True)
 
-        if result and "message" in result:
-            work = result["message"]
+        if work is not None:
             # Check for retraction notice
             retracted = False
             retraction_doi = None
@@ -455,11 +667,8 @@ def verify_citations(doi_list: List[str]) -> dict:
 
     results = []
 
-    for i, doi in enumerate(doi_list):
-        # Rate limiting
-        if i > 0:
-            time.sleep(RATE_LIMIT_DELAY)
-
+    # Rate limiting happens per Crossref request; stored DOIs are not delayed
+    for doi in doi_list:
         result = verify_doi(doi)
         results.append(result)
 
@@ -489,11 +698,7 @@ def check_retractions(doi_list: List[str]) -> dict:
     results = []
     retracted_papers = []
 
-    for i, doi in enumerate(doi_list):
-        # Rate limiting
-        if i > 0:
-            time.sleep(RATE_LIMIT_DELAY)
-
+    for doi in doi_list:
         result = check_retraction(doi)
         results.append(result)
 
@@ -617,9 +822,7 @@ def get_citation_metadata(doi: str) -> dict:
     # Get OpenCitations data
     opencitations_data = get_citations_opencitations(doi)
 
-    time.sleep(RATE_LIMIT_DELAY)
-
-    # Get retraction status
+    # Get retraction status (reuses the Crossref record fetched above when fresh)
     retraction_data = check_retraction(doi)
 
     return {
@@ -637,6 +840,7 @@ def get_citation_metadata(doi: str) -> dict:
 if __name__ == "__main__":
     logger.info("Starting Citation Management MCP Server")
     logger.info(f"OpenCitations token: {'Set' if OPENCITATIONS_TOKEN else 'Not set (using public API)'}")
+    logger.info(f"DOI store: {DOI_CACHE_PATH if DOI_CACHE_ENABLED else 'Disabled'}")
 
     # Run MCP server
     mcp.run()
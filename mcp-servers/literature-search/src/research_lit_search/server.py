@@ -30,12 +30,27 @@ MCP Configuration (~/.claude/claude_desktop_config.json):
 """
 
 import os
+import re
 import sys
+import json
+import zlib
+import random
 import time
+import sqlite3
 import hashlib
+import functools
+import secrets
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from itertools import islice
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+import xml.etree.ElementTree as ET
+from urllib.error import HTTPError
+from typing import Iterator, List, Dict, Optional, Tuple
+from dataclasses import dataclass, asdict, fields
 import logging
 
 # MCP Framework
@@ -92,8 +107,24 @@ Entrez.email = PUBMED_EMAIL
 if PUBMED_API_KEY:
     Entrez.api_key = PUBMED_API_KEY
 
-# Rate limiting
-RATE_LIMIT_DELAY = 0.34  # ~3 requests/second (conservative)
+# NCBI allows 3 requests/second without an API key, 10 with one
+PUBMED_REQUESTS_PER_SECOND = 10 if PUBMED_API_KEY else 3
+
+# Records per efetch request from the history server (NCBI-friendly: <= 500)
+PUBMED_BATCH_SIZE = max(1, min(int(os.getenv("PUBMED_BATCH_SIZE", "200")), 500))
+
+# Per-database time budget (seconds) for multi-database searches
+SOURCE_TIMEOUT = float(os.getenv("LITERATURE_SOURCE_TIMEOUT", "60"))
+
+# On-disk response cache (set LITERATURE_CACHE_DISABLED=1 to turn off)
+CACHE_PATH = Path(os.getenv(
+    "LITERATURE_CACHE_PATH",
+    Path.home() / ".cache" / "research-literature-search" / "responses.sqlite"
+))
+CACHE_ENABLED = os.getenv("LITERATURE_CACHE_DISABLED", "").lower() not in ("1", "true", "yes")
+CACHE_TTL = float(os.getenv("LITERATURE_CACHE_TTL", str(7 * 24 * 3600)))  # 7 days
+CITATION_CACHE_TTL = float(os.getenv("LITERATURE_CITATION_CACHE_TTL", str(24 * 3600)))  # 1 day
+CACHE_MAX_BYTES = int(float(os.getenv("LITERATURE_CACHE_MAX_MB", "256")) * 1024 * 1024)
 
 # ============================================
 # DATA STRUCTURES
@@ -126,12 +157,255 @@ class Paper:
     open_access: Optional[bool] = None
 
 
+# ============================================
+# RESPONSE CACHE
+# ============================================
+
+class ResponseCache:
+    """
+    Content-addressed SQLite cache for API responses
+
+    Entries are keyed on a hash of (source, normalized request) and expire
+    after a per-entry TTL. When the payload total exceeds max_bytes, the
+    least recently used entries are evicted.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = CACHE_MAX_BYTES,
+                 enabled: bool = True):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_lru ON responses(last_access)")
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    @staticmethod
+    def make_key(source: str, *parts) -> str:
+        """Build a cache key from a source name and request parameters"""
+        normalized = [
+            " ".join(part.split()) if isinstance(part, str) else part
+            for part in parts
+        ]
+        raw = json.dumps([source, *normalized], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """Return the cached payload for key, or None if missing or expired"""
+        if not self.enabled:
+            return None
+
+        try:
+            now = time.time()
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT payload, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or row[1] <= now:
+                    if row is not None:
+                        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                        conn.commit()
+                    self.misses += 1
+                    return None
+
+                conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+                conn.commit()
+                self.hits += 1
+                return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Cache read failed: {e}")
+            self.misses += 1
+            return None
+
+    def put(self, key: str, source: str, value, ttl: float = CACHE_TTL) -> None:
+        """Store a JSON-serializable payload under key"""
+        if not self.enabled:
+            return
+
+        try:
+            payload = json.dumps(value, default=str)
+            now = time.time()
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO responses
+                        (key, source, payload, size, created_at, expires_at, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, source, payload, len(payload), now, now + ttl, now)
+                )
+                self._evict(conn)
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Cache write failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired entries, then least recently used ones until under max_bytes"""
+        conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        stale_keys = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access"):
+            stale_keys.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+        logger.info(f"Cache: evicted {len(stale_keys)} least recently used entries")
+
+    def stats(self) -> dict:
+        """Hit/miss counters for this process plus on-disk totals"""
+        stats = {
+            "enabled": self.enabled,
+            "path": str(self.path),
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": 0,
+            "size_bytes": 0,
+            "max_bytes": self.max_bytes,
+            "by_source": {}
+        }
+        if not self.enabled:
+            return stats
+
+        try:
+            with closing(self._connect()) as conn:
+                for source, count, size in conn.execute(
+                    "SELECT source, COUNT(*), SUM(size) FROM responses GROUP BY source"
+                ):
+                    stats["by_source"][source] = count
+                    stats["entries"] += count
+                    stats["size_bytes"] += size
+        except sqlite3.Error as e:
+            stats["error"] = str(e)
+        return stats
+
+    def clear(self) -> int:
+        """Remove all entries, returning how many were deleted"""
+        with closing(self._connect()) as conn:
+            deleted = conn.execute("DELETE FROM responses").rowcount
+            conn.commit()
+        return deleted
+
+
+response_cache = ResponseCache(CACHE_PATH, enabled=CACHE_ENABLED)
+
+
+def cached_search(source: str):
+    """
+    Cache a search back-end's results in response_cache
+
+    The wrapped function gains a use_cache keyword (default True). Failed
+    searches are never cached, so a transient outage is retried next time.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(query: str, date_range: Optional[Tuple[str, str]] = None,
+                    max_results: int = 100, raise_errors: bool = False,
+                    use_cache: bool = True) -> List[Paper]:
+            key = ResponseCache.make_key(
+                source, query, list(date_range) if date_range else None, max_results
+            )
+            if use_cache:
+                cached = response_cache.get(key)
+                if cached is not None:
+                    logger.info(f"{source}: {len(cached)} results served from cache")
+                    return [Paper(**paper) for paper in cached]
+
+            try:
+                papers = func(query, date_range, max_results, raise_errors=True)
+            except Exception:
+                if raise_errors:
+                    raise
+                return []
+
+            response_cache.put(key, source, [asdict(paper) for paper in papers])
+            return papers
+        return wrapper
+    return decorator
+
+
 # ============================================
 # OPENALEX SEARCH
 # ============================================
 
+def openalex_filters(date_range: Optional[Tuple[str, str]]) -> dict:
+    """Build OpenAlex filter arguments for an optional date range"""
+    filters = {}
+    if date_range:
+        start_date, end_date = date_range
+        filters["from_publication_date"] = start_date
+        filters["to_publication_date"] = end_date
+    return filters
+
+
+def openalex_work_to_paper(work: dict) -> Paper:
+    """Convert an OpenAlex work record to a Paper"""
+    # Extract authors
+    authors = []
+    if work.get("authorships"):
+        authors = [
+            auth.get("author", {}).get("display_name", "Unknown")
+            for auth in work["authorships"]
+        ]
+
+    # Extract DOI
+    doi = None
+    if work.get("doi"):
+        doi = work["doi"].replace("https://doi.org/", "")
+
+    # Cross-database IDs (used for deduplication against PubMed)
+    ids = work.get("ids") or {}
+    pmid = ids.get("pmid", "").rstrip("/").rsplit("/", 1)[-1] or None
+    pmcid = ids.get("pmcid", "").rstrip("/").rsplit("/", 1)[-1] or None
+
+    return Paper(
+        id=work["id"],
+        title=work.get("title", "No title"),
+        authors=authors,
+        year=work.get("publication_year"),
+        abstract=work.get("abstract"),
+        doi=doi,
+        url=work.get("id", ""),
+        source="openalex",
+        publication_date=work.get("publication_date"),
+        journal=work.get("primary_location", {}).get("source", {}).get("display_name"),
+        citation_count=work.get("cited_by_count", 0),
+        pdf_url=work.get("primary_location", {}).get("pdf_url"),
+        openalex_id=work["id"],
+        pmid=pmid,
+        pmcid=pmcid,
+        open_access=work.get("open_access", {}).get("is_oa", False)
+    )
+
+
+@cached_search("openalex")
 def search_openalex(query: str, date_range: Optional[Tuple[str, str]] = None,
-                   max_results: int = 100) -> List[Paper]:
+                   max_results: int = 100, raise_errors: bool = False) -> List[Paper]:
     """
     Search OpenAlex (comprehensive academic database)
 
@@ -139,6 +413,7 @@ def search_openalex(query: str, date_range: Optional[Tuple[str, str]] = None,
         query: Search query string
         date_range: Optional tuple ("YYYY-MM-DD", "YYYY-MM-DD")
         max_results: Maximum number of results (default 100)
+        raise_errors: Re-raise API errors instead of returning an empty list
 
     Returns:
         List of Paper objects
@@ -146,70 +421,83 @@ def search_openalex(query: str, date_range: Optional[Tuple[str, str]] = None,
     logger.info(f"Searching OpenAlex: {query}")
 
     try:
-        # Build filter
-        filters = {}
-        if date_range:
-            start_date, end_date = date_range
-            filters["from_publication_date"] = start_date
-            filters["to_publication_date"] = end_date
-
         # Search OpenAlex
         # Note: OpenAlex uses Works.search() for full-text search
-        results = Works().search(query).filter(**filters).get()[:max_results]
-
-        papers = []
-        for work in results:
-            # Extract authors
-            authors = []
-            if work.get("authorships"):
-                authors = [
-                    auth.get("author", {}).get("display_name", "Unknown")
-                    for auth in work["authorships"]
-                ]
-
-            # Extract publication date
-            pub_date = work.get("publication_date")
-            year = work.get("publication_year")
-
-            # Extract DOI
-            doi = None
-            if work.get("doi"):
-                doi = work["doi"].replace("https://doi.org/", "")
-
-            # Build Paper object
-            paper = Paper(
-                id=work["id"],
-                title=work.get("title", "No title"),
-                authors=authors,
-                year=year,
-                abstract=work.get("abstract"),
-                doi=doi,
-                url=work.get("id", ""),
-                source="openalex",
-                publication_date=pub_date,
-                journal=work.get("primary_location", {}).get("source", {}).get("display_name"),
-                citation_count=work.get("cited_by_count", 0),
-                pdf_url=work.get("primary_location", {}).get("pdf_url"),
-                openalex_id=work["id"],
-                open_access=work.get("open_access", {}).get("is_oa", False)
-            )
+        results = Works().search(query).filter(**openalex_filters(date_range)).get()[:max_results]
 
-            papers.append(paper)
+        papers = [openalex_work_to_paper(work) for work in results]
 
         logger.info(f"OpenAlex: Found {len(papers)} results")
         return papers
 
     except Exception as e:
         logger.error(f"OpenAlex search failed: {e}")
+        if raise_errors:
+            raise
         return []
 
 
+def iter_openalex_pages(query: str, date_range: Optional[Tuple[str, str]] = None,
+                        page_size: int = 50,
+                        max_results: Optional[int] = None) -> Iterator[List[Paper]]:
+    """
+    Yield OpenAlex results one page at a time using cursor paging
+
+    Args:
+        query: Search query string
+        date_range: Optional tuple ("YYYY-MM-DD", "YYYY-MM-DD")
+        page_size: Results per page (OpenAlex allows at most 200)
+        max_results: Stop after this many results (None for all)
+
+    Yields:
+        Lists of Paper objects
+    """
+    pager = Works().search(query).filter(**openalex_filters(date_range)).paginate(
+        method="cursor", per_page=min(page_size, 200), n_max=max_results
+    )
+    for page in pager:
+        yield [openalex_work_to_paper(work) for work in page]
+
+
 # ============================================
 # ARXIV SEARCH
 # ============================================
 
+def arxiv_result_to_paper(result) -> Paper:
+    """Convert an arxiv.Result to a Paper"""
+    # Extract arXiv ID
+    arxiv_id = result.entry_id.split("/")[-1]
+
+    return Paper(
+        id=f"arxiv:{arxiv_id}",
+        title=result.title,
+        authors=[author.name for author in result.authors],
+        year=result.published.year,
+        abstract=result.summary,
+        doi=result.doi,
+        url=result.entry_id,
+        source="arxiv",
+        publication_date=result.published.strftime("%Y-%m-%d"),
+        journal="arXiv",
+        citation_count=None,  # arXiv doesn't provide citation counts
+        pdf_url=result.pdf_url,
+        arxiv_id=arxiv_id,
+        publication_type="preprint",
+        open_access=True  # All arXiv papers are open access
+    )
+
+
+def arxiv_in_date_range(result, date_range: Optional[Tuple[str, str]]) -> bool:
+    """arXiv has no date filter, so check publication dates client-side"""
+    if not date_range:
+        return True
+    start_date, end_date = date_range
+    return start_date <= result.published.strftime("%Y-%m-%d") <= end_date
+
+
+@cached_search("arxiv")
 def search_arxiv(query: str, date_range: Optional[Tuple[str, str]] = None,
-                max_results: int = 100) -> List[Paper]:
+                max_results: int = 100, raise_errors: bool = False) -> List[Paper]:
     """
     Search arXiv (physics, CS, math preprints)
 
@@ -217,6 +505,7 @@ def search_arxiv(query: str, date_range: Optional[Tuple[str, str]] = None,
         query: Search query string
         date_range: Optional tuple ("YYYY-MM-DD", "YYYY-MM-DD") - not directly supported
         max_results: Maximum number of results (default 100)
+        raise_errors: Re-raise API errors instead of returning an empty list
 
     Returns:
         List of Paper objects
@@ -235,55 +524,282 @@ def search_arxiv(query: str, date_range: Optional[Tuple[str, str]] = None,
             sort_order=arxiv.SortOrder.Descending
         )
 
-        papers = []
-        for result in client.results(search):
-            # Filter by date if specified
-            if date_range:
-                start_date, end_date = date_range
-                pub_date = result.published.strftime("%Y-%m-%d")
-                if not (start_date <= pub_date <= end_date):
-                    continue
-
-            # Extract authors
-            authors = [author.name for author in result.authors]
-
-            # Extract arXiv ID
-            arxiv_id = result.entry_id.split("/")[-1]
-
-            paper = Paper(
-                id=f"arxiv:{arxiv_id}",
-                title=result.title,
-                authors=authors,
-                year=result.published.year,
-                abstract=result.summary,
-                doi=result.doi,
-                url=result.entry_id,
-                source="arxiv",
-                publication_date=result.published.strftime("%Y-%m-%d"),
-                journal="arXiv",
-                citation_count=None,  # arXiv doesn't provide citation counts
-                pdf_url=result.pdf_url,
-                arxiv_id=arxiv_id,
-                publication_type="preprint",
-                open_access=True  # All arXiv papers are open access
-            )
-
-            papers.append(paper)
+        papers = [
+            arxiv_result_to_paper(result)
+            for result in client.results(search)
+            if arxiv_in_date_range(result, date_range)
+        ]
 
         logger.info(f"arXiv: Found {len(papers)} results")
         return papers
 
     except Exception as e:
         logger.error(f"arXiv search failed: {e}")
+        if raise_errors:
+            raise
         return []
 
 
+def iter_arxiv_pages(query: str, date_range: Optional[Tuple[str, str]] = None,
+                     page_size: int = 50,
+                     max_results: Optional[int] = None) -> Iterator[List[Paper]]:
+    """
+    Yield arXiv results one page at a time
+
+    The arxiv client fetches lazily, so only one API page is held in
+    memory at a time.
+
+    Args:
+        query: Search query string
+        date_range: Optional tuple ("YYYY-MM-DD", "YYYY-MM-DD")
+        page_size: Results per page
+        max_results: Stop after this many results (None for all)
+
+    Yields:
+        Lists of Paper objects
+    """
+    client = arxiv.Client(page_size=max(page_size, 100), delay_seconds=3.0)
+    search = arxiv.Search(
+        query=query,
+        max_results=max_results,
+        sort_by=arxiv.SortCriterion.SubmittedDate,
+        sort_order=arxiv.SortOrder.Descending
+    )
+    results = (
+        arxiv_result_to_paper(result)
+        for result in client.results(search)
+        if arxiv_in_date_range(result, date_range)
+    )
+    while True:
+        page = list(islice(results, page_size))
+        if not page:
+            return
+        yield page
+
+
 # ============================================
 # PUBMED SEARCH
 # ============================================
 
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter
+
+    acquire() blocks until a token is available. The rate backs off when
+    the server signals overload (slow_down) and recovers gradually on
+    successful requests (speed_up), never exceeding the configured rate.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, min_rate: float = 0.5):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+    def slow_down(self) -> None:
+        """Halve the request rate after a 429 or 5xx response"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+        logger.warning(f"Rate limited; reducing to {self.rate:.2f} requests/second")
+
+    def speed_up(self) -> None:
+        """Recover 10% of the request rate after a successful request"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate * 1.1)
+
+
+def pubmed_search_term(query: str, date_range: Optional[Tuple[str, str]] = None) -> str:
+    """Add an optional publication date range to a PubMed query"""
+    if not date_range:
+        return query
+    start_date, end_date = date_range
+    # Convert to PubMed date format
+    start = start_date.replace("-", "/")
+    end = end_date.replace("-", "/")
+    return query + f' AND ("{start}"[Date - Publication] : "{end}"[Date - Publication])'
+
+
+def _element_text(elem: Optional[ET.Element]) -> Optional[str]:
+    """Full text of an element including inline markup (<i>, <sup>, ...)"""
+    if elem is None:
+        return None
+    text = "".join(elem.itertext()).strip()
+    return text or None
+
+
+def _element_year(date_elem: Optional[ET.Element]) -> Optional[int]:
+    """Year from a PubMed date element (Year or leading digits of MedlineDate)"""
+    if date_elem is None:
+        return None
+    year = date_elem.findtext("Year") or (date_elem.findtext("MedlineDate") or "")[:4]
+    return int(year) if year.isdigit() else None
+
+
+def pubmed_element_to_paper(article: ET.Element) -> Paper:
+    """Convert a <PubmedArticle> XML element to a Paper"""
+    medline = article.find("MedlineCitation")
+    article_data = medline.find("Article")
+
+    # Title
+    title = _element_text(article_data.find("ArticleTitle")) or "No title"
+
+    # Authors
+    authors = []
+    for author in article_data.iterfind("AuthorList/Author"):
+        last_name = author.findtext("LastName")
+        fore_name = author.findtext("ForeName")
+        if last_name and fore_name:
+            authors.append(f"{fore_name} {last_name}")
+        elif author.findtext("CollectiveName"):
+            authors.append(_element_text(author.find("CollectiveName")))
+
+    # Abstract
+    abstract_texts = [
+        _element_text(text) for text in article_data.iterfind("Abstract/AbstractText")
+    ]
+    abstract = " ".join(text for text in abstract_texts if text) or None
+
+    # Publication date
+    pub_date = None
+    article_date = article_data.find("ArticleDate")
+    year = _element_year(article_date)
+    if year:
+        month = (article_date.findtext("Month") or "01").zfill(2)
+        day = (article_date.findtext("Day") or "01").zfill(2)
+        pub_date = f"{year}-{month}-{day}"
+    else:
+        year = _element_year(article_data.find("Journal/JournalIssue/PubDate"))
+
+    # IDs
+    pmid = medline.findtext("PMID")
+
+    doi = None
+    for eloc in article_data.iterfind("ELocationID"):
+        if eloc.get("EIdType") == "doi":
+            doi = eloc.text
+            break
+
+    pmcid = None
+    for aid in article.iterfind("PubmedData/ArticleIdList/ArticleId"):
+        if aid.get("IdType") == "pmc":
+            pmcid = aid.text
+            break
+
+    return Paper(
+        id=f"pubmed:{pmid}",
+        title=title,
+        authors=authors,
+        year=year,
+        abstract=abstract,
+        doi=doi,
+        url=f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+        source="pubmed",
+        publication_date=pub_date,
+        journal=article_data.findtext("Journal/Title"),
+        citation_count=None,  # PubMed doesn't provide citation counts directly
+        pdf_url=f"https://www.ncbi.nlm.nih.gov/pmc/articles/{pmcid}/pdf/" if pmcid else None,
+        pmid=pmid,
+        pmcid=pmcid,
+        publication_type=article_data.findtext("PublicationTypeList/PublicationType")
+    )
+
+
+class PubMedClient:
+    """
+    E-utilities client using the NCBI history server
+
+    esearch stores the result set on NCBI's servers (usehistory=y); records
+    are then pulled with efetch in large batches by WebEnv/query_key and
+    parsed incrementally, one <PubmedArticle> at a time.
+    """
+
+    MAX_RETRIES = 4
+
+    def __init__(self, limiter: TokenBucket, batch_size: int = PUBMED_BATCH_SIZE):
+        self.limiter = limiter
+        self.batch_size = batch_size
+
+    def _call(self, func, **kwargs):
+        """Rate-limited E-utilities call with backoff on 429/5xx"""
+        for attempt in range(self.MAX_RETRIES):
+            self.limiter.acquire()
+            try:
+                handle = func(**kwargs)
+            except HTTPError as e:
+                if (e.code == 429 or e.code >= 500) and attempt < self.MAX_RETRIES - 1:
+                    self.limiter.slow_down()
+                    time.sleep(2 ** attempt)
+                    continue
+                raise
+            self.limiter.speed_up()
+            return handle
+
+    def search(self, term: str) -> Tuple[int, str, str]:
+        """
+        Run esearch and keep the result set on the history server
+
+        Returns:
+            Tuple of (total count, WebEnv, query_key)
+        """
+        handle = self._call(Entrez.esearch, db="pubmed", term=term,
+                            usehistory="y", retmax=0)
+        try:
+            record = Entrez.read(handle)
+        finally:
+            handle.close()
+        return int(record["Count"]), record["WebEnv"], record["QueryKey"]
+
+    def iter_papers(self, webenv: str, query_key: str, count: int,
+                    start: int = 0) -> Iterator[Paper]:
+        """Stream Papers for records [start, start + count) of a stored result set"""
+        end = start + count
+        for batch_start in range(start, end, self.batch_size):
+            handle = self._call(
+                Entrez.efetch, db="pubmed", WebEnv=webenv, query_key=query_key,
+                retstart=batch_start, retmax=min(self.batch_size, end - batch_start),
+                rettype="medline", retmode="xml"
+            )
+            try:
+                yield from self._parse_articles(handle)
+            finally:
+                handle.close()
+
+    @staticmethod
+    def _parse_articles(handle) -> Iterator[Paper]:
+        """Incrementally parse an efetch XML response"""
+        for _, elem in ET.iterparse(handle, events=("end",)):
+            if elem.tag != "PubmedArticle":
+                continue
+            try:
+                yield pubmed_element_to_paper(elem)
+            except Exception as e:
+                logger.error(f"Failed to parse PubMed article: {e}")
+            finally:
+                elem.clear()
+
+
+pubmed_client = PubMedClient(TokenBucket(PUBMED_REQUESTS_PER_SECOND))
+
+
+@cached_search("pubmed")
 def search_pubmed(query: str, date_range: Optional[Tuple[str, str]] = None,
-                 max_results: int = 100) -> List[Paper]:
+                 max_results: int = 100, raise_errors: bool = False) -> List[Paper]:
     """
     Search PubMed (biomedical literature)
 
@@ -291,6 +807,7 @@ def search_pubmed(query: str, date_range: Optional[Tuple[str, str]] = None,
         query: Search query string (supports PubMed syntax)
         date_range: Optional tuple ("YYYY-MM-DD", "YYYY-MM-DD")
         max_results: Maximum number of results (default 100)
+        raise_errors: Re-raise API errors instead of returning an empty list
 
     Returns:
         List of Paper objects
@@ -298,194 +815,462 @@ def search_pubmed(query: str, date_range: Optional[Tuple[str, str]] = None,
     logger.info(f"Searching PubMed: {query}")
 
     try:
-        # Add date range to query if specified
-        search_query = query
-        if date_range:
-            start_date, end_date = date_range
-            # Convert to PubMed date format
-            start = start_date.replace("-", "/")
-            end = end_date.replace("-", "/")
-            search_query += f' AND ("{start}"[Date - Publication] : "{end}"[Date - Publication])'
-
-        # Search PubMed for IDs
-        handle = Entrez.esearch(db="pubmed", term=search_query, retmax=max_results)
-        record = Entrez.read(handle)
-        handle.close()
-
-        id_list = record["IdList"]
-
-        if not id_list:
+        count, webenv, query_key = pubmed_client.search(pubmed_search_term(query, date_range))
+
+        if count == 0:
             logger.info("PubMed: No results found")
             return []
 
-        # Fetch details for IDs (in batches to respect rate limits)
-        papers = []
-        batch_size = 20
-
-        for i in range(0, len(id_list), batch_size):
-            batch_ids = id_list[i:i+batch_size]
-
-            # Rate limiting
-            if i > 0:
-                time.sleep(RATE_LIMIT_DELAY)
-
-            # Fetch summaries
-            handle = Entrez.efetch(db="pubmed", id=",".join(batch_ids),
-                                  rettype="medline", retmode="xml")
-            records = Entrez.read(handle)
-            handle.close()
-
-            for article in records["PubmedArticle"]:
-                try:
-                    # Extract fields
-                    medline = article["MedlineCitation"]
-                    article_data = medline["Article"]
-
-                    # Title
-                    title = article_data.get("ArticleTitle", "No title")
-
-                    # Authors
-                    authors = []
-                    if "AuthorList" in article_data:
-                        for author in article_data["AuthorList"]:
-                            if "LastName" in author and "ForeName" in author:
-                                authors.append(f"{author['ForeName']} {author['LastName']}")
-                            elif "CollectiveName" in author:
-                                authors.append(author["CollectiveName"])
-
-                    # Abstract
-                    abstract = None
-                    if "Abstract" in article_data:
-                        abstract_texts = article_data["Abstract"].get("AbstractText", [])
-                        if abstract_texts:
-                            abstract = " ".join([str(text) for text in abstract_texts])
-
-                    # Publication date
-                    pub_date = None
-                    year = None
-                    if "ArticleDate" in article_data:
-                        date_parts = article_data["ArticleDate"][0]
-                        year = int(date_parts.get("Year", 0))
-                        month = date_parts.get("Month", "01").zfill(2)
-                        day = date_parts.get("Day", "01").zfill(2)
-                        pub_date = f"{year}-{month}-{day}"
-                    elif "PubDate" in article_data["Journal"]["JournalIssue"]:
-                        date_parts = article_data["Journal"]["JournalIssue"]["PubDate"]
-                        year = int(date_parts.get("Year", 0))
-
-                    # Journal
-                    journal = article_data.get("Journal", {}).get("Title")
-
-                    # IDs
-                    pmid = str(medline["PMID"])
-
-                    # DOI
-                    doi = None
-                    if "ELocationID" in article_data:
-                        for eloc in article_data["ELocationID"]:
-                            if eloc.attributes.get("EIdType") == "doi":
-                                doi = str(eloc)
-                                break
-
-                    # PMC ID
-                    pmcid = None
-                    if "PubmedData" in article:
-                        article_ids = article["PubmedData"].get("ArticleIdList", [])
-                        for aid in article_ids:
-                            if aid.attributes.get("IdType") == "pmc":
-                                pmcid = str(aid)
-                                break
-
-                    paper = Paper(
-                        id=f"pubmed:{pmid}",
-                        title=title,
-                        authors=authors,
-                        year=year,
-                        abstract=abstract,
-                        doi=doi,
-                        url=f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
-                        source="pubmed",
-                        publication_date=pub_date,
-                        journal=journal,
-                        citation_count=None,  # PubMed doesn't provide citation counts directly
-                        pdf_url=f"https://www.ncbi.nlm.nih.gov/pmc/articles/{pmcid}/pdf/" if pmcid else None,
-                        pmid=pmid,
-                        pmcid=pmcid,
-                        publication_type=article_data.get("PublicationTypeList", [{}])[0].get("PublicationType") if article_data.get("PublicationTypeList") else None
-                    )
-
-                    papers.append(paper)
-
-                except Exception as e:
-                    logger.error(f"Failed to parse PubMed article: {e}")
-                    continue
+        # Fetch details in large batches from the history server
+        papers = list(pubmed_client.iter_papers(webenv, query_key, min(count, max_results)))
 
         logger.info(f"PubMed: Found {len(papers)} results")
         return papers
 
     except Exception as e:
         logger.error(f"PubMed search failed: {e}")
+        if raise_errors:
+            raise
         return []
 
 
+def iter_pubmed_pages(query: str, date_range: Optional[Tuple[str, str]] = None,
+                      page_size: int = 50,
+                      max_results: Optional[int] = None) -> Iterator[List[Paper]]:
+    """
+    Yield PubMed results one page at a time from the history server
+
+    Args:
+        query: Search query string (supports PubMed syntax)
+        date_range: Optional tuple ("YYYY-MM-DD", "YYYY-MM-DD")
+        page_size: Results per page
+        max_results: Stop after this many results (None for all)
+
+    Yields:
+        Lists of Paper objects
+    """
+    count, webenv, query_key = pubmed_client.search(pubmed_search_term(query, date_range))
+    if max_results is not None:
+        count = min(count, max_results)
+
+    papers = pubmed_client.iter_papers(webenv, query_key, count)
+    while True:
+        page = list(islice(papers, page_size))
+        if not page:
+            return
+        yield page
+
+
 # ============================================
-# DEDUPLICATION
+# FAN-OUT SEARCH
 # ============================================
 
-def deduplicate_papers(papers: List[Paper]) -> List[Paper]:
+# Canonical database order (results are merged in this order so that
+# deduplication keeps the same "first occurrence" regardless of timing)
+SEARCH_BACKENDS = {
+    "openalex": search_openalex,
+    "arxiv": search_arxiv,
+    "pubmed": search_pubmed,
+}
+
+
+def fan_out_search(query: str, databases: List[str],
+                   date_range: Optional[Tuple[str, str]] = None,
+                   max_results: int = 100,
+                   timeout: Optional[float] = None,
+                   use_cache: bool = True) -> Tuple[List[Paper], Dict[str, dict]]:
     """
-    Deduplicate papers based on DOI, title similarity, or IDs
+    Search several databases concurrently with a shared time budget
 
-    Deduplication strategy:
-    1. Exact DOI match (highest priority)
-    2. Cross-database ID match (PMID in OpenAlex, etc.)
-    3. Title similarity (fuzzy matching)
+    Each database runs in its own worker thread. Databases that have not
+    answered when the budget expires are reported as timed out and their
+    results are dropped; results from the others are still returned.
 
     Args:
-        papers: List of Paper objects from multiple sources
+        query: Search query string
+        databases: Database names (keys of SEARCH_BACKENDS)
+        date_range: Optional tuple ("YYYY-MM-DD", "YYYY-MM-DD")
+        max_results: Maximum number of results per database
+        timeout: Time budget in seconds per database (default SOURCE_TIMEOUT)
+        use_cache: Serve repeated requests from the response cache
 
     Returns:
-        Deduplicated list of Papers (keeps first occurrence)
+        Tuple of (papers in canonical database order, per-source metadata).
+        Metadata per source: {"status": "ok"|"error"|"timeout",
+        "results": int, "elapsed_seconds": float, "error": Optional[str]}
     """
-    logger.info(f"Deduplicating {len(papers)} papers")
-
-    seen_dois = set()
-    seen_titles = set()
-    unique_papers = []
-
-    for paper in papers:
-        # Check DOI
-        if paper.doi and paper.doi in seen_dois:
-            logger.debug(f"Duplicate DOI: {paper.doi}")
+    budget = SOURCE_TIMEOUT if timeout is None else timeout
+    sources = [name for name in SEARCH_BACKENDS if name in databases]
+    if not sources:
+        return [], {}
+
+    started: Dict[str, float] = {}
+    elapsed: Dict[str, float] = {}
+
+    def run(name: str) -> List[Paper]:
+        started[name] = time.monotonic()
+        try:
+            return SEARCH_BACKENDS[name](query, date_range, max_results,
+                                         raise_errors=True, use_cache=use_cache)
+        finally:
+            elapsed[name] = time.monotonic() - started[name]
+
+    executor = ThreadPoolExecutor(max_workers=len(sources),
+                                  thread_name_prefix="literature-search")
+    try:
+        futures = {name: executor.submit(run, name) for name in sources}
+        wait(futures.values(), timeout=budget)
+    finally:
+        # Don't block on slow databases; their threads finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    papers: List[Paper] = []
+    source_stats: Dict[str, dict] = {}
+
+    for name in sources:
+        future = futures[name]
+        if not future.done():
+            logger.warning(f"{name}: no response within {budget:.1f}s, skipping")
+            source_stats[name] = {
+                "status": "timeout",
+                "results": 0,
+                "elapsed_seconds": round(budget, 3),
+                "error": f"Timed out after {budget:.1f}s"
+            }
             continue
 
-        # Check title (normalized)
-        normalized_title = normalize_title(paper.title)
-        if normalized_title in seen_titles:
-            logger.debug(f"Duplicate title: {paper.title}")
+        error = future.exception()
+        if error is not None:
+            source_stats[name] = {
+                "status": "error",
+                "results": 0,
+                "elapsed_seconds": round(elapsed.get(name, 0.0), 3),
+                "error": str(error)
+            }
             continue
 
-        # Keep this paper
-        unique_papers.append(paper)
+        results = future.result()
+        papers.extend(results)
+        source_stats[name] = {
+            "status": "ok",
+            "results": len(results),
+            "elapsed_seconds": round(elapsed.get(name, 0.0), 3),
+            "error": None
+        }
 
-        if paper.doi:
-            seen_dois.add(paper.doi)
-        seen_titles.add(normalized_title)
+    return papers, source_stats
 
-    logger.info(f"After deduplication: {len(unique_papers)} unique papers")
-    return unique_papers
+
+# ============================================
+# DEDUPLICATION
+# ============================================
+
+# MinHash LSH parameters: 8 bands x 4 rows catches title pairs with word
+# Jaccard similarity >= 0.8 with ~98% probability while keeping candidate
+# sets small, so indexing stays near-linear in the number of papers.
+MINHASH_BANDS = 8
+MINHASH_ROWS = 4
+# Each "permutation" XORs a fixed random mask into the token hashes
+_MINHASH_MASKS = [
+    random.Random(20240101 + i).getrandbits(32) for i in range(MINHASH_BANDS * MINHASH_ROWS)
+]
 
 
 def normalize_title(title: str) -> str:
     """Normalize title for comparison"""
     # Remove punctuation, lowercase, remove extra whitespace
-    import re
-    title = title.lower()
+    title = (title or "").lower()
     title = re.sub(r'[^\w\s]', '', title)
     title = re.sub(r'\s+', ' ', title).strip()
     return title
 
 
+def normalize_identifiers(paper: Paper) -> Dict[str, str]:
+    """Canonical cross-database identifiers for a paper"""
+    ids = {}
+    if paper.doi:
+        doi = paper.doi.strip().lower()
+        for prefix in ("https://doi.org/", "http://doi.org/", "doi:"):
+            if doi.startswith(prefix):
+                doi = doi[len(prefix):]
+        ids["doi"] = doi
+    if paper.pmid:
+        ids["pmid"] = str(paper.pmid).strip()
+    if paper.arxiv_id:
+        ids["arxiv_id"] = re.sub(r'v\d+$', '', paper.arxiv_id.strip().lower())
+    if paper.openalex_id:
+        ids["openalex_id"] = paper.openalex_id.rstrip("/").rsplit("/", 1)[-1].upper()
+    return ids
+
+
+def first_author_surname(paper: Paper) -> Optional[str]:
+    """Lowercased surname of the first author (names are "Given Family")"""
+    if not paper.authors:
+        return None
+    parts = normalize_title(paper.authors[0]).split()
+    return parts[-1] if parts else None
+
+
+def minhash_signature(tokens: set) -> List[int]:
+    """MinHash signature of a token set"""
+    hashes = [zlib.crc32(token.encode("utf-8")) for token in tokens]
+    return [min([h ^ mask for h in hashes]) for mask in _MINHASH_MASKS]
+
+
+class PaperDeduplicator:
+    """
+    Incremental near-duplicate index
+
+    Papers can be added one at a time (e.g. page by page from a stream);
+    each paper is checked against everything seen so far, in order:
+
+    1. Cross-database IDs (DOI, PMID, arXiv ID, OpenAlex ID)
+    2. Exact normalized title, regardless of authors and year (author
+       names and years are formatted inconsistently across sources)
+    3. Fuzzy title: candidates come from MinHash LSH buckets over title
+       words and from a (first-author surname, year) block, and are
+       accepted when word Jaccard similarity >= title_threshold. Fuzzy
+       candidates with conflicting years (more than one apart) or
+       first-author surnames are rejected.
+
+    Every lookup is a hash probe, so adding n papers is near-linear.
+    """
+
+    def __init__(self, title_threshold: float = 0.8):
+        self.title_threshold = title_threshold
+        self.duplicates = 0
+        self.clusters: List[dict] = []
+        self._id_index: Dict[Tuple[str, str], int] = {}
+        self._title_index: Dict[str, int] = {}
+        self._lsh_buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        self._author_year_blocks: Dict[Tuple[str, int], List[int]] = {}
+        # Per kept paper: (title tokens, first-author surname, year)
+        self._features: List[Tuple[set, Optional[str], Optional[int]]] = []
+
+    def add(self, paper: Paper) -> bool:
+        """Record paper and return True if it is new, False if a duplicate"""
+        ids = normalize_identifiers(paper)
+        title = normalize_title(paper.title)
+        tokens = set(title.split())
+        surname = first_author_surname(paper)
+        lsh_keys = None
+
+        match = self._match_ids(ids)
+        if match is None and title:
+            lsh_keys = self._lsh_keys(tokens)
+            match = self._match_title(title, tokens, lsh_keys, surname, paper.year)
+
+        if match is not None:
+            cluster_id, reason, score = match
+            self._register_ids(ids, cluster_id)
+            self.clusters[cluster_id]["duplicates"].append({
+                "id": paper.id,
+                "source": paper.source,
+                "title": paper.title,
+                "match": reason,
+                "score": round(score, 3)
+            })
+            self.duplicates += 1
+            logger.debug(f"Duplicate ({reason}): {paper.title}")
+            return False
+
+        cluster_id = len(self.clusters)
+        self.clusters.append({
+            "kept": {"id": paper.id, "source": paper.source, "title": paper.title},
+            "duplicates": []
+        })
+        self._features.append((tokens, surname, paper.year))
+        self._register_ids(ids, cluster_id)
+        if title:
+            self._title_index.setdefault(title, cluster_id)
+            for key in lsh_keys or self._lsh_keys(tokens):
+                self._lsh_buckets.setdefault(key, []).append(cluster_id)
+        if surname and paper.year:
+            self._author_year_blocks.setdefault((surname, paper.year), []).append(cluster_id)
+        return True
+
+    def duplicate_clusters(self) -> List[dict]:
+        """Clusters that absorbed at least one duplicate"""
+        return [cluster for cluster in self.clusters if cluster["duplicates"]]
+
+    def _register_ids(self, ids: Dict[str, str], cluster_id: int) -> None:
+        for id_type, value in ids.items():
+            self._id_index.setdefault((id_type, value), cluster_id)
+
+    def _match_ids(self, ids: Dict[str, str]) -> Optional[Tuple[int, str, float]]:
+        for id_type, value in ids.items():
+            cluster_id = self._id_index.get((id_type, value))
+            if cluster_id is not None:
+                return cluster_id, id_type, 1.0
+        return None
+
+    def _match_title(self, title: str, tokens: set, lsh_keys: list, surname: Optional[str],
+                     year: Optional[int]) -> Optional[Tuple[int, str, float]]:
+        cluster_id = self._title_index.get(title)
+        if cluster_id is not None:
+            return cluster_id, "title_exact", 1.0
+
+        candidates = set()
+        for key in lsh_keys:
+            candidates.update(self._lsh_buckets.get(key, ()))
+        if surname and year:
+            candidates.update(self._author_year_blocks.get((surname, year), ()))
+
+        best = None
+        for cluster_id in sorted(candidates):
+            if not self._compatible(cluster_id, surname, year):
+                continue
+            other_tokens = self._features[cluster_id][0]
+            score = len(tokens & other_tokens) / len(tokens | other_tokens)
+            if score >= self.title_threshold and (best is None or score > best[2]):
+                best = (cluster_id, "title_fuzzy", score)
+        return best
+
+    def _compatible(self, cluster_id: int, surname: Optional[str], year: Optional[int]) -> bool:
+        _, other_surname, other_year = self._features[cluster_id]
+        if surname and other_surname and surname != other_surname:
+            return False
+        if year and other_year and abs(year - other_year) > 1:
+            return False
+        return True
+
+    @staticmethod
+    def _lsh_keys(tokens: set) -> List[Tuple[int, Tuple[int, ...]]]:
+        if not tokens:
+            return []
+        signature = minhash_signature(tokens)
+        return [
+            (band, tuple(signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS]))
+            for band in range(MINHASH_BANDS)
+        ]
+
+
+def deduplicate_papers(papers: List[Paper],
+                       title_threshold: float = 0.8) -> Tuple[List[Paper], List[dict]]:
+    """
+    Deduplicate papers based on DOI, title similarity, or IDs
+
+    Deduplication strategy:
+    1. Cross-database ID match (DOI, PMID, arXiv ID, OpenAlex ID)
+    2. Exact normalized title
+    3. Fuzzy title match (MinHash LSH, constrained by author and year)
+
+    Args:
+        papers: List of Paper objects from multiple sources
+        title_threshold: Minimum title word Jaccard similarity for fuzzy matches
+
+    Returns:
+        Tuple of (deduplicated Papers keeping first occurrence,
+        duplicate clusters: [{"kept": {...}, "duplicates": [{..., "match", "score"}]}])
+    """
+    logger.info(f"Deduplicating {len(papers)} papers")
+
+    deduplicator = PaperDeduplicator(title_threshold)
+    unique_papers = [paper for paper in papers if deduplicator.add(paper)]
+
+    logger.info(f"After deduplication: {len(unique_papers)} unique papers")
+    return unique_papers, deduplicator.duplicate_clusters()
+
+
+# ============================================
+# STREAMING SEARCH
+# ============================================
+
+PAGE_ITERATORS = {
+    "openalex": iter_openalex_pages,
+    "arxiv": iter_arxiv_pages,
+    "pubmed": iter_pubmed_pages,
+}
+
+# Open streams are kept in memory between calls; idle ones expire
+STREAM_SESSION_TTL = 30 * 60  # seconds
+MAX_STREAM_SESSIONS = 32
+
+
+def stream_unique_papers(query: str, databases: List[str],
+                         date_range: Optional[Tuple[str, str]],
+                         page_size: int,
+                         max_results_per_db: Optional[int],
+                         deduplicator: PaperDeduplicator,
+                         source_stats: Dict[str, dict]) -> Iterator[Paper]:
+    """
+    Lazily merge pages from several databases into one deduplicated stream
+
+    Databases are read round-robin, one page at a time, so no database
+    has to be exhausted before results from the others appear. A database
+    that fails is dropped from the rotation and its error recorded in
+    source_stats; the remaining databases keep streaming.
+    """
+    pagers = OrderedDict(
+        (name, PAGE_ITERATORS[name](query, date_range, page_size, max_results_per_db))
+        for name in PAGE_ITERATORS if name in databases
+    )
+    for name in pagers:
+        source_stats[name] = {"status": "streaming", "results": 0, "error": None}
+
+    while pagers:
+        for name in list(pagers):
+            try:
+                page = next(pagers[name])
+            except StopIteration:
+                source_stats[name]["status"] = "exhausted"
+                del pagers[name]
+                continue
+            except Exception as e:
+                logger.error(f"{name} stream failed: {e}")
+                source_stats[name].update(status="error", error=str(e))
+                del pagers[name]
+                continue
+
+            source_stats[name]["results"] += len(page)
+            for paper in page:
+                if deduplicator.add(paper):
+                    yield paper
+
+
+@dataclass
+class StreamSession:
+    """Server-side state behind a continuation token"""
+    query: str
+    databases: List[str]
+    date_range: Optional[List[str]]
+    page_size: int
+    papers: Iterator[Paper]
+    deduplicator: PaperDeduplicator
+    source_stats: Dict[str, dict]
+    returned: int = 0
+    pages: int = 0
+    last_access: float = 0.0
+
+
+_stream_sessions: "OrderedDict[str, StreamSession]" = OrderedDict()
+_stream_lock = threading.Lock()
+
+
+def _store_stream_session(session: StreamSession) -> str:
+    """Register a session and return its continuation token"""
+    token = secrets.token_urlsafe(16)
+    now = time.monotonic()
+    session.last_access = now
+    with _stream_lock:
+        for key in [key for key, s in _stream_sessions.items()
+                    if now - s.last_access > STREAM_SESSION_TTL]:
+            del _stream_sessions[key]
+        while len(_stream_sessions) >= MAX_STREAM_SESSIONS:
+            _stream_sessions.popitem(last=False)
+        _stream_sessions[token] = session
+    return token
+
+
+def _take_stream_session(token: str) -> Optional[StreamSession]:
+    """Remove and return the session for token (None if unknown or expired)"""
+    with _stream_lock:
+        session = _stream_sessions.pop(token, None)
+    if session and time.monotonic() - session.last_access > STREAM_SESSION_TTL:
+        return None
+    return session
+
+
 # ============================================
 # MCP TOOLS
 # ============================================
@@ -493,15 +1278,23 @@ def normalize_title(title: str) -> str:
 @mcp.tool()
 def search_literature(query: str, databases: List[str],
                      date_range: Optional[List[str]] = None,
-                     max_results_per_db: int = 100) -> dict:
+                     max_results_per_db: int = 100,
+                     timeout_per_db: Optional[float] = None,
+                     use_cache: bool = True) -> dict:
     """
     Search academic literature across multiple databases
 
+    Databases are queried concurrently. A database that does not answer
+    within the time budget is skipped and reported in "source_stats".
+
     Args:
         query: Search query string (boolean operators supported for most databases)
         databases: List of databases to search. Options: ["openalex", "arxiv", "pubmed", "all"]
         date_range: Optional date range ["YYYY-MM-DD", "YYYY-MM-DD"] (start, end)
         max_results_per_db: Maximum results per database (default 100)
+        timeout_per_db: Time budget in seconds per database (default: LITERATURE_SOURCE_TIMEOUT env, 60)
+        use_cache: Reuse cached responses for identical requests (default True).
+            Set False to force fresh results from every database.
 
     Returns:
         Dictionary with results:
@@ -510,6 +1303,9 @@ def search_literature(query: str, databases: List[str],
             "databases_searched": List[str],
             "total_results": int,
             "unique_results": int,
+            "partial": bool,  # True if any database failed or timed out
+            "source_stats": Dict[str, dict],  # status, results, elapsed_seconds, error
+            "duplicate_clusters": List[dict],  # kept paper + removed duplicates with match reason
             "papers": List[dict]  # Paper objects as dicts
         }
 
@@ -532,23 +1328,14 @@ def search_literature(query: str, databases: List[str],
     if "all" in databases:
         databases = ["openalex", "arxiv", "pubmed"]
 
-    # Search each database
-    all_papers = []
-
-    if "openalex" in databases:
-        papers = search_openalex(query, date_tuple, max_results_per_db)
-        all_papers.extend(papers)
-
-    if "arxiv" in databases:
-        papers = search_arxiv(query, date_tuple, max_results_per_db)
-        all_papers.extend(papers)
-
-    if "pubmed" in databases:
-        papers = search_pubmed(query, date_tuple, max_results_per_db)
-        all_papers.extend(papers)
+    # Search all requested databases concurrently
+    all_papers, source_stats = fan_out_search(
+        query, databases, date_tuple, max_results_per_db,
+        timeout=timeout_per_db, use_cache=use_cache
+    )
 
     # Deduplicate
-    unique_papers = deduplicate_papers(all_papers)
+    unique_papers, duplicate_clusters = deduplicate_papers(all_papers)
 
     # Convert to dicts for JSON serialization
     papers_dict = [asdict(paper) for paper in unique_papers]
@@ -560,18 +1347,162 @@ def search_literature(query: str, databases: List[str],
         "total_results": len(all_papers),
         "unique_results": len(unique_papers),
         "duplicates_removed": len(all_papers) - len(unique_papers),
+        "partial": any(stats["status"] != "ok" for stats in source_stats.values()),
+        "source_stats": source_stats,
+        "duplicate_clusters": duplicate_clusters,
         "papers": papers_dict
     }
 
 
 @mcp.tool()
-def get_paper_metadata(identifier: str, id_type: str = "doi") -> dict:
+def find_duplicates(papers: List[dict], title_threshold: float = 0.8) -> dict:
+    """
+    Deduplicate a merged set of paper records and report duplicate clusters
+
+    Use this for records merged from several searches or exports. Records
+    use the Paper fields returned by search_literature; missing fields are
+    treated as unknown.
+
+    Args:
+        papers: Paper records (dicts) in priority order; the first record of
+            each cluster is kept
+        title_threshold: Minimum title word Jaccard similarity for fuzzy matches (default 0.8)
+
+    Returns:
+        Dictionary with:
+        {
+            "total_records": int,
+            "unique_records": int,
+            "duplicates_removed": int,
+            "matches_by_type": Dict[str, int],  # doi, pmid, arxiv_id, openalex_id, title_exact, title_fuzzy
+            "duplicate_clusters": List[dict],
+            "papers": List[dict]  # unique records
+        }
+    """
+    field_names = [f.name for f in fields(Paper)]
+    records = []
+    for index, record in enumerate(papers):
+        values = {name: record.get(name) for name in field_names}
+        values["id"] = values["id"] or f"record:{index}"
+        values["title"] = values["title"] or ""
+        values["authors"] = values["authors"] or []
+        values["url"] = values["url"] or ""
+        values["source"] = values["source"] or "unknown"
+        records.append(Paper(**values))
+
+    unique_papers, clusters = deduplicate_papers(records, title_threshold)
+
+    matches_by_type: Dict[str, int] = {}
+    for cluster in clusters:
+        for duplicate in cluster["duplicates"]:
+            matches_by_type[duplicate["match"]] = matches_by_type.get(duplicate["match"], 0) + 1
+
+    return {
+        "total_records": len(records),
+        "unique_records": len(unique_papers),
+        "duplicates_removed": len(records) - len(unique_papers),
+        "matches_by_type": matches_by_type,
+        "duplicate_clusters": clusters,
+        "papers": [asdict(paper) for paper in unique_papers]
+    }
+
+
+@mcp.tool()
+def search_literature_stream(query: str = "", databases: Optional[List[str]] = None,
+                             date_range: Optional[List[str]] = None,
+                             page_size: int = 50,
+                             max_results_per_db: Optional[int] = None,
+                             continuation_token: Optional[str] = None) -> dict:
+    """
+    Search academic literature one page at a time
+
+    Unlike search_literature, results are fetched lazily and deduplicated
+    incrementally, so the first page is returned as soon as it is available
+    and large result sets never have to be held in memory at once. Pass the
+    returned continuation_token back (other arguments are then ignored) to
+    fetch the next page. Tokens expire after 30 minutes of inactivity.
+
+    Args:
+        query: Search query string (first call only)
+        databases: Databases to search. Options: ["openalex", "arxiv", "pubmed", "all"]
+        date_range: Optional date range ["YYYY-MM-DD", "YYYY-MM-DD"] (start, end)
+        page_size: Unique papers per page (default 50)
+        max_results_per_db: Optional cap on results read from each database
+        continuation_token: Token from a previous page
+
+    Returns:
+        Dictionary with one page of results:
+        {
+            "query": str,
+            "page": int,
+            "papers": List[dict],
+            "returned_so_far": int,
+            "duplicates_removed_so_far": int,
+            "source_stats": Dict[str, dict],  # status: streaming|exhausted|error
+            "continuation_token": Optional[str]  # None when the stream is finished
+        }
+
+    Example:
+        first = search_literature_stream("CRISPR off-target", ["pubmed", "openalex"])
+        more = search_literature_stream(continuation_token=first["continuation_token"])
+    """
+    if continuation_token:
+        session = _take_stream_session(continuation_token)
+        if session is None:
+            return {"error": "Unknown or expired continuation_token; start a new search"}
+    else:
+        if not query or not databases:
+            return {"error": "query and databases are required to start a search"}
+        if "all" in databases:
+            databases = list(PAGE_ITERATORS)
+        if page_size < 1:
+            return {"error": "page_size must be at least 1"}
+
+        date_tuple = tuple(date_range) if date_range and len(date_range) == 2 else None
+        deduplicator = PaperDeduplicator()
+        source_stats: Dict[str, dict] = {}
+        session = StreamSession(
+            query=query,
+            databases=databases,
+            date_range=date_range,
+            page_size=page_size,
+            papers=stream_unique_papers(query, databases, date_tuple, page_size,
+                                        max_results_per_db, deduplicator, source_stats),
+            deduplicator=deduplicator,
+            source_stats=source_stats
+        )
+
+    logger.info(f"Stream page {session.pages + 1}: {session.query} in {session.databases}")
+
+    page = list(islice(session.papers, session.page_size))
+    session.pages += 1
+    session.returned += len(page)
+
+    finished = len(page) < session.page_size
+    token = None if finished else _store_stream_session(session)
+
+    return {
+        "query": session.query,
+        "databases_searched": session.databases,
+        "date_range": session.date_range,
+        "page": session.pages,
+        "papers": [asdict(paper) for paper in page],
+        "returned_so_far": session.returned,
+        "duplicates_removed_so_far": session.deduplicator.duplicates,
+        "source_stats": session.source_stats,
+        "continuation_token": token
+    }
+
+
+@mcp.tool()
+def get_paper_metadata(identifier: str, id_type: str = "doi", use_cache: bool = True) -> dict:
     """
     Fetch detailed metadata for a specific paper
 
     Args:
         identifier: Paper identifier (DOI, PMID, arXiv ID, OpenAlex ID)
         id_type: Type of identifier. Options: ["doi", "pmid", "arxiv_id", "openalex_id"]
+        use_cache: Reuse a cached response if available (default True)
 
     Returns:
         Paper metadata as dict
@@ -579,6 +1510,20 @@ def get_paper_metadata(identifier: str, id_type: str = "doi") -> dict:
     Example:
         get_paper_metadata("10.1038/s41586-021-03819-2", "doi")
     """
+    key = ResponseCache.make_key("metadata", id_type, identifier.strip())
+    if use_cache:
+        cached = response_cache.get(key)
+        if cached is not None:
+            return cached
+
+    result = fetch_paper_metadata(identifier, id_type, use_cache=use_cache)
+    if "error" not in result:
+        response_cache.put(key, "metadata", result)
+    return result
+
+
+def fetch_paper_metadata(identifier: str, id_type: str = "doi", use_cache: bool = True) -> dict:
+    """Fetch paper metadata from the source database (see get_paper_metadata)"""
     logger.info(f"Fetching metadata for {id_type}: {identifier}")
 
     try:
@@ -609,7 +1554,7 @@ def get_paper_metadata(identifier: str, id_type: str = "doi") -> dict:
 
         elif id_type == "pmid":
             # Fetch from PubMed
-            papers = search_pubmed(f"{identifier}[PMID]", max_results=1)
+            papers = search_pubmed(f"{identifier}[PMID]", max_results=1, use_cache=use_cache)
             if papers:
                 return asdict(papers[0])
 
@@ -670,30 +1615,60 @@ def get_paper_metadata(identifier: str, id_type: str = "doi") -> dict:
 
 
 @mcp.tool()
-def get_citation_count(doi: str) -> dict:
+def get_citation_count(doi: str, use_cache: bool = True) -> dict:
     """
     Get citation count for a paper (from OpenAlex)
 
+    Citation counts change over time, so cached counts expire after
+    LITERATURE_CITATION_CACHE_TTL seconds (default 1 day).
+
     Args:
         doi: Paper DOI
+        use_cache: Reuse a cached count if still fresh (default True)
 
     Returns:
         Dictionary with citation count and citing papers
     """
+    key = ResponseCache.make_key("citations", doi.strip().lower())
+    if use_cache:
+        cached = response_cache.get(key)
+        if cached is not None:
+            return cached
+
     try:
         works = Works().filter(doi=doi).get()
         if works:
             work = works[0]
-            return {
+            result = {
                 "doi": doi,
                 "citation_count": work.get("cited_by_count", 0),
                 "openalex_url": work.get("id", "")
             }
+            response_cache.put(key, "citations", result, ttl=CITATION_CACHE_TTL)
+            return result
         return {"error": "Paper not found"}
     except Exception as e:
         return {"error": str(e)}
 
 
+@mcp.tool()
+def get_cache_stats(clear: bool = False) -> dict:
+    """
+    Report response cache statistics, optionally clearing the cache
+
+    Args:
+        clear: Delete all cached responses after collecting stats
+
+    Returns:
+        Dictionary with hit/miss counters (this server process),
+        entry count and size on disk, and entries per source
+    """
+    stats = response_cache.stats()
+    if clear and response_cache.enabled:
+        stats["cleared"] = response_cache.clear()
+    return stats
+
+
 # ============================================
 # MAIN
 # ============================================
@@ -703,6 +1678,7 @@ if __name__ == "__main__":
     logger.info(f"OpenAlex email: {OPENALEX_EMAIL}")
     logger.info(f"PubMed email: {PUBMED_EMAIL}")
     logger.info(f"PubMed API key: {'Set' if PUBMED_API_KEY else 'Not set (using default rate limits)'}")
+    logger.info(f"Response cache: {CACHE_PATH if CACHE_ENABLED else 'Disabled'}")
 
     # Run MCP server
     mcp.run()
@@ -36,7 +36,9 @@ MCP Configuration:
 import os
 import sys
 import json
-from typing import List, Dict, Optional
+import base64
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import logging
 
@@ -49,8 +51,8 @@ except ImportError:
 
 # Database
 try:
-    import psycopg2
-    from psycopg2.extras import RealDictCursor, Json
+    from psycopg2.extras import RealDictCursor, Json, execute_values
+    from psycopg2.pool import ThreadedConnectionPool
     from psycopg2 import sql
 except ImportError:
     print("ERROR: psycopg2 not installed. Run: pip install psycopg2-binary", file=sys.stderr)
@@ -78,18 +80,52 @@ DB_CONFIG = {
     "password": os.getenv("DB_PASSWORD", ""),
 }
 
+# Connection pool size (shared by all tools)
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+
+# Rows per staging-table merge in store_literature
+STORE_BATCH_SIZE = 5000
+
 # ============================================
 # DATABASE CONNECTION
 # ============================================
 
-def get_connection():
-    """Get database connection"""
+_pool: Optional[ThreadedConnectionPool] = None
+
+
+def get_pool() -> ThreadedConnectionPool:
+    """Get the shared connection pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        try:
+            _pool = ThreadedConnectionPool(DB_POOL_MIN, DB_POOL_MAX, **DB_CONFIG)
+        except Exception as e:
+            logger.error(f"Database connection failed: {e}")
+            raise
+    return _pool
+
+
+@contextmanager
+def db_cursor(cursor_factory=None):
+    """
+    Borrow a pooled connection and yield a cursor
+
+    Commits when the block succeeds, rolls back if it raises, and always
+    returns the connection to the pool (discarding it if it was closed).
+    """
+    pool = get_pool()
+    conn = pool.getconn()
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
-        return conn
-    except Exception as e:
-        logger.error(f"Database connection failed: {e}")
+        with conn.cursor(cursor_factory=cursor_factory) as cursor:
+            yield cursor
+        conn.commit()
+    except Exception:
+        if not conn.closed:
+            conn.rollback()
         raise
+    finally:
+        pool.putconn(conn, close=bool(conn.closed))
 
 
 # ============================================
@@ -127,8 +163,19 @@ def initialize_schema():
     CREATE INDEX IF NOT EXISTS idx_literature_doi ON literature(doi);
     CREATE INDEX IF NOT EXISTS idx_literature_stage ON literature(stage);
     CREATE INDEX IF NOT EXISTS idx_literature_year ON literature(year);
-    CREATE INDEX IF NOT EXISTS idx_literature_title_fts ON literature USING gin(to_tsvector('english', title));
-    CREATE INDEX IF NOT EXISTS idx_literature_abstract_fts ON literature USING gin(to_tsvector('english', COALESCE(abstract, '')));
+
+    -- Weighted full-text search vector (title = A, abstract = B), kept up to
+    -- date by PostgreSQL (generated column, PostgreSQL 12+)
+    ALTER TABLE literature ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', COALESCE(title, '')), 'A') ||
+            setweight(to_tsvector('english', COALESCE(abstract, '')), 'B')
+        ) STORED;
+    CREATE INDEX IF NOT EXISTS idx_literature_search_vector ON literature USING gin(search_vector);
+
+    -- Superseded by idx_literature_search_vector (no query used these)
+    DROP INDEX IF EXISTS idx_literature_title_fts;
+    DROP INDEX IF EXISTS idx_literature_abstract_fts;
 
     -- Extracted data table (systematic review data extraction)
     CREATE TABLE IF NOT EXISTS extracted_data (
@@ -167,12 +214,8 @@ def initialize_schema():
     """
 
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(schema_sql)
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with db_cursor() as cursor:
+            cursor.execute(schema_sql)
         logger.info("Database schema initialized successfully")
     except Exception as e:
         logger.error(f"Schema initialization failed: {e}")
@@ -183,11 +226,106 @@ def initialize_schema():
 # MCP TOOLS
 # ============================================
 
+LITERATURE_COLUMNS = (
+    "study_id", "title", "authors", "year", "abstract", "doi", "url",
+    "source", "publication_date", "journal", "citation_count", "pdf_url", "metadata"
+)
+
+LITERATURE_UPSERT_SQL = """
+    INSERT INTO literature (
+        study_id, title, authors, year, abstract, doi, url,
+        source, publication_date, journal, citation_count, pdf_url, metadata, stage
+    )
+    {source}
+    ON CONFLICT (study_id) DO UPDATE SET
+        title = EXCLUDED.title,
+        authors = EXCLUDED.authors,
+        year = EXCLUDED.year,
+        abstract = EXCLUDED.abstract,
+        doi = EXCLUDED.doi,
+        url = EXCLUDED.url,
+        source = EXCLUDED.source,
+        publication_date = EXCLUDED.publication_date,
+        journal = EXCLUDED.journal,
+        citation_count = EXCLUDED.citation_count,
+        pdf_url = EXCLUDED.pdf_url,
+        metadata = EXCLUDED.metadata,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING (xmax = 0) AS inserted
+"""
+
+
+def literature_row(paper: Dict) -> Tuple:
+    """Map a paper dict (from literature-search MCP server) to a literature row"""
+    # Generate study_id if not present
+    study_id = paper.get("id", f"{paper['source']}:{paper.get('doi', paper['title'][:50])}")
+    return (
+        study_id,
+        paper.get("title"),
+        paper.get("authors"),
+        paper.get("year"),
+        paper.get("abstract"),
+        paper.get("doi"),
+        paper.get("url"),
+        paper.get("source"),
+        paper.get("publication_date"),
+        paper.get("journal"),
+        paper.get("citation_count"),
+        paper.get("pdf_url"),
+        Json(paper)  # Store full paper data as JSONB
+    )
+
+
+def merge_literature_batch(cursor, rows: List[Tuple]) -> int:
+    """
+    Upsert rows through a staging table in one statement
+
+    Rows are bulk-loaded with execute_values into a temporary table, then
+    merged into literature with a single INSERT ... SELECT ... ON CONFLICT.
+
+    Returns:
+        Number of newly inserted rows (the rest were updates)
+    """
+    cursor.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS literature_staging (
+            study_id VARCHAR(255),
+            title TEXT,
+            authors TEXT[],
+            year INTEGER,
+            abstract TEXT,
+            doi VARCHAR(255),
+            url TEXT,
+            source VARCHAR(50),
+            publication_date DATE,
+            journal TEXT,
+            citation_count INTEGER,
+            pdf_url TEXT,
+            metadata JSONB
+        ) ON COMMIT DELETE ROWS
+    """)
+    cursor.execute("TRUNCATE literature_staging")
+    execute_values(
+        cursor,
+        f"INSERT INTO literature_staging ({', '.join(LITERATURE_COLUMNS)}) VALUES %s",
+        rows,
+        page_size=1000
+    )
+    cursor.execute(LITERATURE_UPSERT_SQL.format(source=f"""
+        SELECT {', '.join(LITERATURE_COLUMNS)}, 'identified'
+        FROM literature_staging
+    """))
+    return sum(1 for (inserted,) in cursor.fetchall() if inserted)
+
+
 @mcp.tool()
 def store_literature(papers: List[Dict]) -> dict:
     """
     Store literature search results in database
 
+    Papers are merged in bulk (STORE_BATCH_SIZE rows per statement). If a
+    batch fails, that batch is retried row by row so that only the bad rows
+    are reported as errors.
+
     Args:
         papers: List of paper dictionaries (from literature-search MCP server)
 
@@ -196,69 +334,57 @@ def store_literature(papers: List[Dict]) -> dict:
     """
     logger.info(f"Storing {len(papers)} papers")
 
-    conn = get_connection()
-    cursor = conn.cursor()
-
     inserted = 0
     updated = 0
     errors = []
 
+    # Build rows; a study_id repeated within the call keeps its last version
+    # (earlier copies count as updates, as if stored one after another)
+    rows_by_id: Dict[str, Tuple] = {}
     for paper in papers:
         try:
-            # Generate study_id if not present
-            study_id = paper.get("id", f"{paper['source']}:{paper.get('doi', paper['title'][:50])}")
-
-            # Insert or update
-            cursor.execute("""
-                INSERT INTO literature (
-                    study_id, title, authors, year, abstract, doi, url,
-                    source, publication_date, journal, citation_count, pdf_url, metadata, stage
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'identified')
-                ON CONFLICT (study_id) DO UPDATE SET
-                    title = EXCLUDED.title,
-                    authors = EXCLUDED.authors,
-                    year = EXCLUDED.year,
-                    abstract = EXCLUDED.abstract,
-                    doi = EXCLUDED.doi,
-                    url = EXCLUDED.url,
-                    source = EXCLUDED.source,
-                    publication_date = EXCLUDED.publication_date,
-                    journal = EXCLUDED.journal,
-                    citation_count = EXCLUDED.citation_count,
-                    pdf_url = EXCLUDED.pdf_url,
-                    metadata = EXCLUDED.metadata,
-                    updated_at = CURRENT_TIMESTAMP
-                RETURNING (xmax = 0) AS inserted
-            """, (
-                study_id,
-                paper.get("title"),
-                paper.get("authors"),
-                paper.get("year"),
-                paper.get("abstract"),
-                paper.get("doi"),
-                paper.get("url"),
-                paper.get("source"),
-                paper.get("publication_date"),
-                paper.get("journal"),
-                paper.get("citation_count"),
-                paper.get("pdf_url"),
-                Json(paper)  # Store full paper data as JSONB
-            ))
-
-            result = cursor.fetchone()
-            if result and result[0]:
-                inserted += 1
-            else:
-                updated += 1
-
+            row = literature_row(paper)
         except Exception as e:
-            errors.append({"study_id": study_id, "error": str(e)})
-            logger.error(f"Failed to store paper {study_id}: {e}")
-
-    conn.commit()
-    cursor.close()
-    conn.close()
+            errors.append({"study_id": paper.get("id"), "error": f"Invalid paper record: {e}"})
+            continue
+        if row[0] in rows_by_id:
+            updated += 1
+        rows_by_id[row[0]] = row
+    rows = list(rows_by_id.values())
+
+    with db_cursor() as cursor:
+        for start in range(0, len(rows), STORE_BATCH_SIZE):
+            batch = rows[start:start + STORE_BATCH_SIZE]
+            cursor.execute("SAVEPOINT store_batch")
+            try:
+                batch_inserted = merge_literature_batch(cursor, batch)
+                cursor.execute("RELEASE SAVEPOINT store_batch")
+                inserted += batch_inserted
+                updated += len(batch) - batch_inserted
+                continue
+            except Exception as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT store_batch")
+                logger.warning(f"Bulk merge failed ({e}); retrying {len(batch)} rows individually")
+
+            for row in batch:
+                cursor.execute("SAVEPOINT store_row")
+                try:
+                    cursor.execute(
+                        LITERATURE_UPSERT_SQL.format(
+                            source="VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'identified')"
+                        ),
+                        row
+                    )
+                    row_inserted = cursor.fetchone()[0]
+                    cursor.execute("RELEASE SAVEPOINT store_row")
+                    if row_inserted:
+                        inserted += 1
+                    else:
+                        updated += 1
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO SAVEPOINT store_row")
+                    errors.append({"study_id": row[0], "error": str(e)})
+                    logger.error(f"Failed to store paper {row[0]}: {e}")
 
     return {
         "total_processed": len(papers),
@@ -269,12 +395,31 @@ def store_literature(papers: List[Dict]) -> dict:
     }
 
 
+def encode_cursor(rank: float, row_id: int) -> str:
+    """Opaque keyset cursor for the row after which the next page starts"""
+    raw = json.dumps({"rank": rank, "id": row_id}).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, int]:
+    """Inverse of encode_cursor (raises ValueError on malformed input)"""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return float(data["rank"]), int(data["id"])
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+
 @mcp.tool()
 def query_literature(search_query: str, filters: Optional[Dict] = None,
-                    limit: int = 100) -> dict:
+                    limit: int = 100, after: Optional[str] = None) -> dict:
     """
     Search literature database with full-text search and filters
 
+    Results are ordered by relevance (ts_rank_cd over the weighted title and
+    abstract vector). Use the returned next_cursor as `after` to fetch the
+    next page; keyset pagination keeps page latency flat however deep you go.
+
     Args:
         search_query: Full-text search query (searches title and abstract)
         filters: Optional filters dict. Supported keys:
@@ -283,19 +428,16 @@ def query_literature(search_query: str, filters: Optional[Dict] = None,
                  - stage: str (identified, screened, eligible, included, excluded)
                  - source: str (openalex, arxiv, pubmed)
         limit: Maximum results (default 100)
+        after: Cursor from a previous page's next_cursor
 
     Returns:
-        Dictionary with search results
+        Dictionary with search results, including "next_cursor"
+        (None on the last page)
     """
     logger.info(f"Querying literature: {search_query}")
 
-    conn = get_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-
     # Build query
-    where_clauses = [
-        "to_tsvector('english', title || ' ' || COALESCE(abstract, '')) @@ plainto_tsquery('english', %s)"
-    ]
+    where_clauses = ["search_vector @@ query"]
     params = [search_query]
 
     if filters:
@@ -315,33 +457,47 @@ def query_literature(search_query: str, filters: Optional[Dict] = None,
             where_clauses.append("source = %s")
             params.append(filters["source"])
 
+    if after:
+        try:
+            after_rank, after_id = decode_cursor(after)
+        except ValueError as e:
+            return {"error": str(e)}
+        where_clauses.append("(ts_rank_cd(search_vector, query)::float8, id) < (%s, %s)")
+        params.extend([after_rank, after_id])
+
     where_sql = " AND ".join(where_clauses)
     params.append(limit)
 
     query = f"""
-        SELECT study_id, title, authors, year, abstract, doi, url,
+        SELECT id, study_id, title, authors, year, abstract, doi, url,
                source, publication_date, journal, citation_count,
-               pdf_url, stage, exclusion_reason
-        FROM literature
+               pdf_url, stage, exclusion_reason,
+               ts_rank_cd(search_vector, query)::float8 AS rank
+        FROM literature, plainto_tsquery('english', %s) AS query
         WHERE {where_sql}
-        ORDER BY year DESC, citation_count DESC NULLS LAST
+        ORDER BY rank DESC, id DESC
         LIMIT %s
     """
 
-    cursor.execute(query, params)
-    results = cursor.fetchall()
-
-    cursor.close()
-    conn.close()
+    with db_cursor(RealDictCursor) as cursor:
+        cursor.execute(query, params)
+        results = cursor.fetchall()
 
     # Convert to list of dicts
     papers = [dict(row) for row in results]
 
+    next_cursor = None
+    if papers and len(papers) == limit:
+        next_cursor = encode_cursor(papers[-1]["rank"], papers[-1]["id"])
+    for paper in papers:
+        del paper["id"]
+
     return {
         "query": search_query,
         "filters": filters,
         "result_count": len(papers),
-        "papers": papers
+        "papers": papers,
+        "next_cursor": next_cursor
     }
 
 
@@ -359,21 +515,15 @@ def store_extraction(study_id: str, extracted_data: Dict) -> dict:
     """
     logger.info(f"Storing extraction for: {study_id}")
 
-    conn = get_connection()
-    cursor = conn.cursor()
-
     try:
-        cursor.execute("""
-            INSERT INTO extracted_data (study_id, data)
-            VALUES (%s, %s)
-            ON CONFLICT (study_id) DO UPDATE
-            SET data = EXCLUDED.data,
-                extracted_at = CURRENT_TIMESTAMP
-        """, (study_id, Json(extracted_data)))
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with db_cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO extracted_data (study_id, data)
+                VALUES (%s, %s)
+                ON CONFLICT (study_id) DO UPDATE
+                SET data = EXCLUDED.data,
+                    extracted_at = CURRENT_TIMESTAMP
+            """, (study_id, Json(extracted_data)))
 
         return {"status": "success", "study_id": study_id}
 
@@ -395,36 +545,31 @@ def get_prisma_counts(project_name: str = "default") -> dict:
     """
     logger.info(f"Fetching PRISMA counts for: {project_name}")
 
-    conn = get_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-    # Get actual counts from literature table
-    cursor.execute("""
-        SELECT
-            COUNT(*) FILTER (WHERE stage = 'identified') as identified,
-            COUNT(*) FILTER (WHERE stage = 'screened') as screened,
-            COUNT(*) FILTER (WHERE stage = 'eligible') as eligible,
-            COUNT(*) FILTER (WHERE stage = 'included') as included,
-            COUNT(*) FILTER (WHERE stage = 'excluded') as excluded
-        FROM literature
-    """)
-
-    result = cursor.fetchone()
-
-    # Get exclusion reasons breakdown
-    cursor.execute("""
-        SELECT exclusion_reason, COUNT(*) as count
-        FROM literature
-        WHERE stage = 'excluded' AND exclusion_reason IS NOT NULL
-        GROUP BY exclusion_reason
-        ORDER BY count DESC
-    """)
-
-    exclusion_reasons = {row["exclusion_reason"]: row["count"]
-                        for row in cursor.fetchall()}
+    with db_cursor(RealDictCursor) as cursor:
+        # Get actual counts from literature table
+        cursor.execute("""
+            SELECT
+                COUNT(*) FILTER (WHERE stage = 'identified') as identified,
+                COUNT(*) FILTER (WHERE stage = 'screened') as screened,
+                COUNT(*) FILTER (WHERE stage = 'eligible') as eligible,
+                COUNT(*) FILTER (WHERE stage = 'included') as included,
+                COUNT(*) FILTER (WHERE stage = 'excluded') as excluded
+            FROM literature
+        """)
+
+        result = cursor.fetchone()
+
+        # Get exclusion reasons breakdown
+        cursor.execute("""
+            SELECT exclusion_reason, COUNT(*) as count
+            FROM literature
+            WHERE stage = 'excluded' AND exclusion_reason IS NOT NULL
+            GROUP BY exclusion_reason
+            ORDER BY count DESC
+        """)
 
-    cursor.close()
-    conn.close()
+        exclusion_reasons = {row["exclusion_reason"]: row["count"]
+                            for row in cursor.fetchall()}
 
     counts = dict(result)
     counts["exclusion_reasons"] = exclusion_reasons
@@ -457,24 +602,19 @@ def update_study_stage(study_id: str, new_stage: str,
     if new_stage not in valid_stages:
         return {"status": "error", "error": f"Invalid stage. Must be one of: {valid_stages}"}
 
-    conn = get_connection()
-    cursor = conn.cursor()
-
     try:
-        cursor.execute("""
-            UPDATE literature
-            SET stage = %s,
-                exclusion_reason = %s,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE study_id = %s
-        """, (new_stage, exclusion_reason, study_id))
-
-        if cursor.rowcount == 0:
-            return {"status": "error", "error": "Study not found"}
+        with db_cursor() as cursor:
+            cursor.execute("""
+                UPDATE literature
+                SET stage = %s,
+                    exclusion_reason = %s,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE study_id = %s
+            """, (new_stage, exclusion_reason, study_id))
+            updated_rows = cursor.rowcount
 
-        conn.commit()
-        cursor.close()
-        conn.close()
+        if updated_rows == 0:
+            return {"status": "error", "error": "Study not found"}
 
         return {"status": "success", "study_id": study_id, "new_stage": new_stage}
 
@@ -488,47 +628,42 @@ def get_database_stats() -> dict:
     """Get database statistics"""
     logger.info("Fetching database statistics")
 
-    conn = get_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-    # Count by source
-    cursor.execute("""
-        SELECT source, COUNT(*) as count
-        FROM literature
-        GROUP BY source
-        ORDER BY count DESC
-    """)
-    by_source = {row["source"]: row["count"] for row in cursor.fetchall()}
-
-    # Count by stage
-    cursor.execute("""
-        SELECT stage, COUNT(*) as count
-        FROM literature
-        GROUP BY stage
-        ORDER BY count DESC
-    """)
-    by_stage = {row["stage"]: row["count"] for row in cursor.fetchall()}
-
-    # Count by year
-    cursor.execute("""
-        SELECT year, COUNT(*) as count
-        FROM literature
-        WHERE year IS NOT NULL
-        GROUP BY year
-        ORDER BY year DESC
-        LIMIT 10
-    """)
-    by_year = {row["year"]: row["count"] for row in cursor.fetchall()}
-
-    # Total counts
-    cursor.execute("SELECT COUNT(*) as total FROM literature")
-    total_papers = cursor.fetchone()["total"]
-
-    cursor.execute("SELECT COUNT(*) as total FROM extracted_data")
-    total_extractions = cursor.fetchone()["total"]
-
-    cursor.close()
-    conn.close()
+    with db_cursor(RealDictCursor) as cursor:
+        # Count by source
+        cursor.execute("""
+            SELECT source, COUNT(*) as count
+            FROM literature
+            GROUP BY source
+            ORDER BY count DESC
+        """)
+        by_source = {row["source"]: row["count"] for row in cursor.fetchall()}
+
+        # Count by stage
+        cursor.execute("""
+            SELECT stage, COUNT(*) as count
+            FROM literature
+            GROUP BY stage
+            ORDER BY count DESC
+        """)
+        by_stage = {row["stage"]: row["count"] for row in cursor.fetchall()}
+
+        # Count by year
+        cursor.execute("""
+            SELECT year, COUNT(*) as count
+            FROM literature
+            WHERE year IS NOT NULL
+            GROUP BY year
+            ORDER BY year DESC
+            LIMIT 10
+        """)
+        by_year = {row["year"]: row["count"] for row in cursor.fetchall()}
+
+        # Total counts
+        cursor.execute("SELECT COUNT(*) as total FROM literature")
+        total_papers = cursor.fetchone()["total"]
+
+        cursor.execute("SELECT COUNT(*) as total FROM extracted_data")
+        total_extractions = cursor.fetchone()["total"]
 
     return {
         "total_papers": total_papers,
@@ -549,10 +684,10 @@ def startup():
     logger.info(f"Database: {DB_CONFIG['database']} at {DB_CONFIG['host']}:{DB_CONFIG['port']}")
 
     try:
-        # Test connection
-        conn = get_connection()
-        conn.close()
-        logger.info("Database connection successful")
+        # Test connection (creates the shared pool)
+        with db_cursor() as cursor:
+            cursor.execute("SELECT 1")
+        logger.info(f"Database connection successful (pool size {DB_POOL_MIN}-{DB_POOL_MAX})")
 
         # Initialize schema
         initialize_schema()
@@ -4,6 +4,7 @@ AI-Generated Text Detection Library
 Provides tools for detecting LLM-generated text patterns in academic writing.
 """
 
+from .batch import BatchChecker
 from .detector import AITextDetector
 from .models import DetectionResult, TextSegment, Suggestion
 from .suggestions import SuggestionGenerator
@@ -13,6 +14,7 @@ __version__ = "1.0.0"
 
 __all__ = [
     "AITextDetector",
+    "BatchChecker",
     "DetectionResult",
     "TextSegment",
     "Suggestion",
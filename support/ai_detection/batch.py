@@ -0,0 +1,196 @@
+"""Parallel AI-check over many files with a content-hash cache."""
+
+import hashlib
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .config import AICheckConfig, default_config
+from .detector import AITextDetector
+from .models import DetectionResult
+from .tracker import AICheckTracker
+
+
+# Bump when detector changes alter results, so cached results are not reused
+CACHE_VERSION = "1"
+
+# Detector of the current worker process (set by _init_worker)
+_worker_detector: Optional[AITextDetector] = None
+
+
+def _init_worker(config: AICheckConfig):
+    global _worker_detector
+    _worker_detector = AITextDetector(config)
+
+
+def _analyze_in_worker(text: str, file_path: str) -> DetectionResult:
+    return _worker_detector.analyze(text, file_path)
+
+
+def config_key(config: AICheckConfig) -> str:
+    """Fingerprint of everything in a configuration that affects results."""
+    payload = json.dumps({
+        "version": CACHE_VERSION,
+        "weights": config.weights,
+        "thresholds": config.thresholds,
+        "ai_words": {category: sorted(words) for category, words in config.ai_words.items()},
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def status_for(confidence: float, config: AICheckConfig) -> str:
+    """Classify a confidence score as "high", "medium" or "low"."""
+    if confidence >= config.thresholds["block_threshold"]:
+        return "high"
+    if confidence >= config.thresholds["warn_threshold"]:
+        return "medium"
+    return "low"
+
+
+class BatchChecker:
+    """
+    Check many files across a process pool.
+
+    Files whose content was already analyzed with the same configuration
+    are answered from the tracker database without re-analysis.
+    """
+
+    def __init__(self, config: AICheckConfig = None, tracker: Optional[AICheckTracker] = None,
+                 jobs: Optional[int] = None, use_cache: bool = True, track: bool = False):
+        """
+        Initialize batch checker.
+
+        Args:
+            config: AI-check configuration
+            tracker: Tracker whose database holds the result cache
+            jobs: Worker processes (default: CPU count)
+            use_cache: Reuse results for unchanged file contents
+            track: Log freshly analyzed results to the tracker's history
+        """
+        self.config = config or default_config
+        self.tracker = tracker
+        self.jobs = jobs or os.cpu_count() or 1
+        self.use_cache = use_cache and tracker is not None
+        self.track = track and tracker is not None
+        self.config_key = config_key(self.config)
+
+    def run(self, files: Iterable[Path]) -> Iterator[dict]:
+        """
+        Check files, yielding one record per file as soon as it is ready.
+
+        Cached results come first; fresh results follow in completion
+        order. Records are ``DetectionResult.to_dict()`` output plus
+        ``content_hash`` and ``cached``.
+
+        Args:
+            files: Files to check
+
+        Yields:
+            Result records
+        """
+        pending = []
+        for file_path in files:
+            data = Path(file_path).read_bytes()
+            content_hash = hashlib.sha256(data).hexdigest()
+            pending.append((str(file_path), content_hash, data))
+
+        cached = {}
+        if self.use_cache:
+            cached = self.tracker.get_cached_results((h for _, h, _ in pending), self.config_key)
+
+        to_analyze = []
+        for file_path, content_hash, data in pending:
+            if content_hash in cached:
+                yield self._record(cached[content_hash], file_path, content_hash, cached=True)
+            else:
+                to_analyze.append((file_path, content_hash, data.decode("utf-8", errors="replace")))
+        del pending
+
+        fresh = []
+        try:
+            for result, content_hash in self._analyze(to_analyze):
+                result_dict = result.to_dict()
+                fresh.append((content_hash, result_dict))
+                if self.track:
+                    self.tracker.log_detection(result)
+                yield self._record(result_dict, result.file_path, content_hash, cached=False)
+        finally:
+            # Keep whatever finished, even if the caller stops early
+            if self.use_cache and fresh:
+                self.tracker.cache_results(self.config_key, fresh)
+
+    def _analyze(self, to_analyze: List[Tuple[str, str, str]]) -> Iterator[Tuple[DetectionResult, str]]:
+        """Yield (DetectionResult, content_hash), in a pool when worthwhile."""
+        if self.jobs == 1 or len(to_analyze) < 2:
+            detector = AITextDetector(self.config)
+            for file_path, content_hash, text in to_analyze:
+                yield detector.analyze(text, file_path), content_hash
+            return
+
+        workers = min(self.jobs, len(to_analyze))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.config,)) as pool:
+            futures = {
+                pool.submit(_analyze_in_worker, text, file_path): content_hash
+                for file_path, content_hash, text in to_analyze
+            }
+            for future in as_completed(futures):
+                yield future.result(), futures[future]
+
+    @staticmethod
+    def _record(result: dict, file_path: str, content_hash: str, cached: bool) -> dict:
+        # A cached result may come from another file with the same content
+        return {**result, "file_path": file_path, "content_hash": content_hash, "cached": cached}
+
+
+def aggregate_report(records: List[dict], config: AICheckConfig = None) -> dict:
+    """
+    Summarize per-file records into one report.
+
+    Args:
+        records: Records yielded by BatchChecker.run
+        config: Configuration supplying the status thresholds
+
+    Returns:
+        Report dict with totals, status counts and files by confidence
+    """
+    config = config or default_config
+    total_words = sum(r["statistics"]["total_words"] for r in records)
+    ai_words: Counter = Counter()
+    for record in records:
+        ai_words.update(record["ai_words_found"])
+
+    files = sorted(
+        (
+            {
+                "file_path": r["file_path"],
+                "overall_confidence": r["overall_confidence"],
+                "status": status_for(r["overall_confidence"], config),
+                "total_words": r["statistics"]["total_words"],
+                "flagged_sections": len(r["flagged_sections"]),
+                "cached": r["cached"],
+            }
+            for r in records
+        ),
+        key=lambda f: (-f["overall_confidence"], f["file_path"]),
+    )
+    status_counts: Dict[str, int] = Counter(f["status"] for f in files)
+
+    return {
+        "files_checked": len(records),
+        "files_analyzed": sum(1 for r in records if not r["cached"]),
+        "files_cached": sum(1 for r in records if r["cached"]),
+        "total_words": total_words,
+        # Word-weighted, so short files do not dominate
+        "overall_confidence": (
+            sum(r["overall_confidence"] * r["statistics"]["total_words"] for r in records) / total_words
+            if total_words else 0.0
+        ),
+        "status_counts": {status: status_counts.get(status, 0) for status in ("high", "medium", "low")},
+        "ai_words_found": dict(ai_words.most_common(20)),
+        "ai_words_per_1000": sum(ai_words.values()) / total_words * 1000 if total_words else 0.0,
+        "files": files,
+    }
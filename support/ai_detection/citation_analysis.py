@@ -5,11 +5,13 @@ Analyzes citation usage patterns to detect AI-generated text.
 AI models exhibit distinct citation patterns different from human academics.
 """
 
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass
 import re
 from collections import Counter
 
+from .tokenization import TokenizedDocument
+
 
 @dataclass
 class CitationResult:
@@ -73,24 +75,26 @@ class CitationAnalyzer:
         # Context window around citations (words before/after)
         self.context_window = 10
     
-    def analyze(self, text: str) -> CitationResult:
+    def analyze(self, text: str, tokenized: Optional[TokenizedDocument] = None) -> CitationResult:
         """
         Analyze citation patterns in text.
         
         Args:
             text: Academic text to analyze
+            tokenized: Tokenization of text shared with other analyzers
             
         Returns:
             CitationResult with detailed metrics
         """
+        tokenized = tokenized or TokenizedDocument(text)
+        
         # Find all citations
-        citations, positions, contexts = self._find_citations(text)
+        citations, positions, contexts = self._find_citations(tokenized)
         
         if not citations:
             return self._empty_result()
         
-        words = text.split()
-        total_words = len(words)
+        total_words = len(tokenized.tokens)
         
         # Calculate metrics
         total_citations = len(citations)
@@ -131,7 +135,7 @@ class CitationAnalyzer:
             citation_contexts=contexts[:10]  # First 10 for review
         )
     
-    def _find_citations(self, text: str) -> Tuple[List[str], List[int], List[str]]:
+    def _find_citations(self, tokenized: TokenizedDocument) -> Tuple[List[str], List[int], List[str]]:
         """
         Find all citations in text.
         
@@ -145,7 +149,8 @@ class CitationAnalyzer:
         positions = []
         contexts = []
         
-        words = text.split()
+        text = tokenized.text
+        words = tokenized.tokens
         
         # Search for each pattern
         for pattern in self.citation_patterns:
@@ -153,9 +158,8 @@ class CitationAnalyzer:
                 citation_text = match.group()
                 citations.append(citation_text)
                 
-                # Calculate word position
-                char_position = match.start()
-                word_position = len(text[:char_position].split())
+                # Calculate word position (tokens started before the citation)
+                word_position = tokenized.token_index(match.start())
                 positions.append(word_position)
                 
                 # Extract context
@@ -5,12 +5,13 @@ Analyzes readability metrics and complexity variance to detect AI-generated text
 AI tends to maintain uniform complexity, while human writing varies naturally.
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
-import re
 import math
 from collections import Counter
 
+from .tokenization import TokenizedDocument, TokenSentence
+
 
 @dataclass
 class ComplexityResult:
@@ -41,32 +42,35 @@ class ComplexityAnalyzer:
         self.low_variance_threshold = 2.0  # Variance < 2.0 is suspiciously uniform
         self.ideal_variance_range = (3.0, 8.0)  # Typical human variance
         
-    def analyze(self, text: str) -> ComplexityResult:
+    def analyze(self, text: str, tokenized: Optional[TokenizedDocument] = None) -> ComplexityResult:
         """
         Analyze text complexity and uniformity.
         
         Args:
             text: Text to analyze
+            tokenized: Tokenization of text shared with other analyzers
             
         Returns:
             ComplexityResult with detailed metrics
         """
+        tokenized = tokenized or TokenizedDocument(text)
+        
         # Split into sentences
-        sentences = self._split_sentences(text)
+        sentences = tokenized.token_sentences
         
         if not sentences:
             return self._empty_result()
         
         # Calculate metrics for each sentence
-        sentence_complexities = [self._sentence_complexity(s) for s in sentences]
+        sentence_complexities = [self._sentence_complexity(s.words, s.syllables) for s in sentences]
         
         # Calculate readability metrics
-        flesch_kincaid = self._flesch_kincaid_grade(text, sentences)
-        gunning_fog = self._gunning_fog_index(text, sentences)
-        readability = self._flesch_reading_ease(text, sentences)
+        flesch_kincaid = self._flesch_kincaid_grade(tokenized, sentences)
+        gunning_fog = self._gunning_fog_index(tokenized, sentences)
+        readability = self._flesch_reading_ease(tokenized, sentences)
         
         # Calculate average lengths
-        words = text.split()
+        words = tokenized.tokens
         avg_sentence_length = len(words) / len(sentences) if sentences else 0
         avg_word_length = sum(len(w) for w in words) / len(words) if words else 0
         
@@ -93,22 +97,7 @@ class ComplexityAnalyzer:
             sentence_complexities=sentence_complexities
         )
     
-    def _split_sentences(self, text: str) -> List[str]:
-        """
-        Split text into sentences.
-        
-        Handles common abbreviations and edge cases.
-        """
-        # Simple sentence splitting (improved version would use NLTK)
-        # This handles basic cases: periods, exclamation marks, question marks
-        sentences = re.split(r'[.!?]+\s+', text)
-        
-        # Remove empty sentences
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        return sentences
-    
-    def _sentence_complexity(self, sentence: str) -> float:
+    def _sentence_complexity(self, words: List[str], syllable_counts: List[int]) -> float:
         """
         Calculate complexity score for a single sentence.
         
@@ -121,8 +110,6 @@ class ComplexityAnalyzer:
         Returns:
             Complexity score (0-100+)
         """
-        words = sentence.split()
-        
         if not words:
             return 0.0
         
@@ -133,10 +120,10 @@ class ComplexityAnalyzer:
         avg_word_len = sum(len(w) for w in words) / len(words)
         
         # Syllable count (approximation)
-        syllables = sum(self._count_syllables(w) for w in words)
+        syllables = sum(syllable_counts)
         
         # Clause count (approximation using commas and conjunctions)
-        clauses = sentence.count(',') + sentence.count(';') + 1
+        clauses = sum(w.count(',') + w.count(';') for w in words) + 1
         
         # Combine factors
         complexity = (
@@ -148,34 +135,7 @@ class ComplexityAnalyzer:
         
         return complexity
     
-    def _count_syllables(self, word: str) -> int:
-        """
-        Approximate syllable count for a word.
-        
-        Uses simple vowel-counting heuristic.
-        """
-        word = word.lower()
-        count = 0
-        vowels = 'aeiouy'
-        previous_was_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                count += 1
-            previous_was_vowel = is_vowel
-        
-        # Adjust for silent e
-        if word.endswith('e'):
-            count -= 1
-        
-        # Every word has at least one syllable
-        if count == 0:
-            count = 1
-        
-        return count
-    
-    def _flesch_kincaid_grade(self, text: str, sentences: List[str]) -> float:
+    def _flesch_kincaid_grade(self, tokenized: TokenizedDocument, sentences: List[TokenSentence]) -> float:
         """
         Calculate Flesch-Kincaid Grade Level.
         
@@ -184,14 +144,14 @@ class ComplexityAnalyzer:
         Returns:
             Grade level (e.g., 12.0 = 12th grade reading level)
         """
-        words = text.split()
+        words = tokenized.tokens
         
         if not words or not sentences:
             return 0.0
         
         total_sentences = len(sentences)
         total_words = len(words)
-        total_syllables = sum(self._count_syllables(w) for w in words)
+        total_syllables = sum(tokenized.syllable_counts)
         
         if total_sentences == 0 or total_words == 0:
             return 0.0
@@ -204,7 +164,7 @@ class ComplexityAnalyzer:
         
         return max(0.0, grade)  # Can't be negative
     
-    def _gunning_fog_index(self, text: str, sentences: List[str]) -> float:
+    def _gunning_fog_index(self, tokenized: TokenizedDocument, sentences: List[TokenSentence]) -> float:
         """
         Calculate Gunning Fog Index.
         
@@ -214,14 +174,14 @@ class ComplexityAnalyzer:
         Returns:
             Fog index (e.g., 12.0 = 12th grade reading level)
         """
-        words = text.split()
+        words = tokenized.tokens
         
         if not words or not sentences:
             return 0.0
         
         total_sentences = len(sentences)
         total_words = len(words)
-        complex_words = sum(1 for w in words if self._count_syllables(w) >= 3)
+        complex_words = sum(1 for count in tokenized.syllable_counts if count >= 3)
         
         if total_sentences == 0 or total_words == 0:
             return 0.0
@@ -233,7 +193,7 @@ class ComplexityAnalyzer:
         
         return fog
     
-    def _flesch_reading_ease(self, text: str, sentences: List[str]) -> float:
+    def _flesch_reading_ease(self, tokenized: TokenizedDocument, sentences: List[TokenSentence]) -> float:
         """
         Calculate Flesch Reading Ease score.
         
@@ -242,14 +202,14 @@ class ComplexityAnalyzer:
         Returns:
             Score 0-100 (higher = easier to read)
         """
-        words = text.split()
+        words = tokenized.tokens
         
         if not words or not sentences:
             return 0.0
         
         total_sentences = len(sentences)
         total_words = len(words)
-        total_syllables = sum(self._count_syllables(w) for w in words)
+        total_syllables = sum(tokenized.syllable_counts)
         
         if total_sentences == 0 or total_words == 0:
             return 0.0
@@ -4,6 +4,8 @@ import yaml
 from pathlib import Path
 from typing import Dict, List
 
+from .word_matcher import AIWordMatcher
+
 
 # Default AI-typical words
 AI_WORDS = {
@@ -66,6 +68,10 @@ class AICheckConfig:
         self.thresholds = DEFAULT_THRESHOLDS.copy()
         self.ai_words = AI_WORDS.copy()
         
+        # Compiled matcher and the vocabulary it was built from
+        self._matcher = None
+        self._matcher_words = None
+        
         if config_path and Path(config_path).exists():
             self.load_from_file(config_path)
     
@@ -104,6 +110,19 @@ class AICheckConfig:
             all_words.extend(category_words)
         return list(set(all_words))
     
+    def get_ai_word_matcher(self) -> AIWordMatcher:
+        """
+        Get a matcher that counts all AI-typical words in one pass.
+        
+        Compiled once and cached; rebuilt only if the vocabulary changes.
+        """
+        words = self.get_all_ai_words()
+        key = frozenset(words)
+        if self._matcher is None or self._matcher_words != key:
+            self._matcher = AIWordMatcher(words)
+            self._matcher_words = key
+        return self._matcher
+    
     def get_word_weight(self, word: str) -> float:
         """Get weight for a specific AI word."""
         word_lower = word.lower()
@@ -23,6 +23,7 @@ from .detector import AITextDetector
 from .language_model import LanguageModel, LanguageModelResult
 from .complexity import ComplexityAnalyzer, ComplexityResult
 from .citation_analysis import CitationAnalyzer, CitationResult
+from .tokenization import TokenizedDocument
 
 
 class EnhancedAITextDetector:
@@ -68,11 +69,14 @@ class EnhancedAITextDetector:
         Returns:
             Dictionary with all detection results and overall assessment
         """
+        # Tokenize once; every detection method reads the same spans
+        tokenized = TokenizedDocument(text)
+        
         # Run all detection methods
-        base_result = self.base_detector.analyze(text, file_path)
-        language_result = self.language_model.analyze(text)
-        complexity_result = self.complexity_analyzer.analyze(text)
-        citation_result = self.citation_analyzer.analyze(text)
+        base_result = self.base_detector.analyze(text, file_path, tokenized)
+        language_result = self.language_model.analyze(text, tokenized)
+        complexity_result = self.complexity_analyzer.analyze(text, tokenized)
+        citation_result = self.citation_analyzer.analyze(text, tokenized)
         
         # Calculate enhanced overall confidence
         enhanced_confidence = self._calculate_enhanced_confidence(
@@ -122,7 +126,7 @@ class EnhancedAITextDetector:
                 "punctuation_score": base_result.punctuation_score,
                 "ai_words_found": dict(base_result.ai_words_found),
                 "ai_words_per_1000": (sum(base_result.ai_words_found.values()) / 
-                                     max(1, len(text.split())) * 1000)
+                                     max(1, len(tokenized.tokens)) * 1000)
             },
             
             "language_model": {
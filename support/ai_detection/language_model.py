@@ -5,11 +5,12 @@ Detects AI-generated text using n-gram analysis and statistical anomaly detectio
 Compares text against corpus of human academic writing.
 """
 
-from typing import Dict, List, Tuple, Counter as CounterType
+from typing import Dict, List, Optional, Tuple, Counter as CounterType
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 import math
-import re
+
+from .tokenization import TokenizedDocument
 
 
 @dataclass
@@ -105,18 +106,19 @@ class LanguageModel:
         }
         return common_trigrams
     
-    def analyze(self, text: str) -> LanguageModelResult:
+    def analyze(self, text: str, tokenized: Optional[TokenizedDocument] = None) -> LanguageModelResult:
         """
         Analyze text using n-gram language modeling.
         
         Args:
             text: Text to analyze
+            tokenized: Tokenization of text shared with other analyzers
             
         Returns:
             LanguageModelResult with scores and detected anomalies
         """
-        # Tokenize
-        words = self._tokenize(text)
+        # Tokenize (lowercased, punctuation removed except sentence boundaries)
+        words = (tokenized or TokenizedDocument(text)).normalized_words
         
         if len(words) < 3:
             return LanguageModelResult(
@@ -161,23 +163,6 @@ class LanguageModel:
             repetitive_phrases=repetitive_phrases[:10]  # Top 10
         )
     
-    def _tokenize(self, text: str) -> List[str]:
-        """
-        Tokenize text into words.
-        
-        Lowercases and removes punctuation (except sentence boundaries).
-        """
-        # Remove special characters but keep sentence boundaries
-        text = re.sub(r'[^\w\s\.\!\?]', ' ', text.lower())
-        
-        # Split on whitespace
-        words = text.split()
-        
-        # Remove empty strings
-        words = [w for w in words if w and w not in {'.', '!', '?'}]
-        
-        return words
-    
     def _analyze_bigrams(self, words: List[str]) -> Tuple[float, List[Tuple[str, str, float]]]:
         """
         Analyze bigram patterns.
@@ -193,12 +178,14 @@ class LanguageModel:
         unusual_bigrams = []
         total_unusual = 0
         
+        bigram_counts = Counter(bigrams)
+        
         for bigram in bigrams:
             # Get expected probability
             expected_prob = self.bigram_baseline.get(bigram, 0.01)  # Default: 1%
             
             # Count this bigram in text
-            bigram_count = bigrams.count(bigram)
+            bigram_count = bigram_counts[bigram]
             observed_prob = bigram_count / len(bigrams)
             
             # Check if unusual (much more or much less frequent than expected)
@@ -237,12 +224,14 @@ class LanguageModel:
         unusual_trigrams = []
         total_unusual = 0
         
+        trigram_counts = Counter(trigrams)
+        
         for trigram in trigrams:
             # Get expected probability
             expected_prob = self.trigram_baseline.get(trigram, 0.001)  # Default: 0.1%
             
             # Count this trigram in text
-            trigram_count = trigrams.count(trigram)
+            trigram_count = trigram_counts[trigram]
             observed_prob = trigram_count / len(trigrams)
             
             # Check if unusual
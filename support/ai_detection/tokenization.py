@@ -0,0 +1,222 @@
+"""
+Shared Tokenization for AI Text Detection
+
+Tokenizes a document once - token spans, line offsets, paragraph and
+sentence boundaries, syllable counts - so every analyzer works from the
+same spans instead of re-splitting the text with its own regexes.
+"""
+
+from bisect import bisect_left
+from functools import cached_property
+from typing import List, NamedTuple, Tuple
+import re
+
+
+TOKEN_PATTERN = re.compile(r'\S+')  # Same tokens as str.split()
+WORD_PATTERN = re.compile(r'\w+')  # Same spans as \b\w+\b
+SENTENCE_BOUNDARY = re.compile(r'[.!?]+')
+NON_WORD = re.compile(r'[^\w\s\.\!\?]')
+
+TERMINAL_PUNCTUATION = '.!?'
+
+
+def count_syllables(word: str) -> int:
+    """
+    Approximate syllable count for a word.
+
+    Uses simple vowel-counting heuristic.
+    """
+    word = word.lower()
+    count = 0
+    vowels = 'aeiouy'
+    previous_was_vowel = False
+
+    for char in word:
+        is_vowel = char in vowels
+        if is_vowel and not previous_was_vowel:
+            count += 1
+        previous_was_vowel = is_vowel
+
+    # Adjust for silent e
+    if word.endswith('e'):
+        count -= 1
+
+    # Every word has at least one syllable
+    if count == 0:
+        count = 1
+
+    return count
+
+
+class Sentence(NamedTuple):
+    """A sentence as character offsets into the document."""
+    start: int
+    end: int  # exclusive
+    word_count: int
+
+
+class ParagraphSpan(NamedTuple):
+    """A blank-line separated block and the sentences inside it."""
+    start_line: int  # 0-based, inclusive
+    end_line: int  # 0-based, exclusive
+    start: int  # character offset
+    end: int  # character offset, exclusive
+    first_sentence: int  # index into TokenizedDocument.sentences
+    last_sentence: int  # exclusive
+
+
+class TokenSentence(NamedTuple):
+    """A sentence as whitespace tokens, for readability metrics."""
+    words: List[str]
+    syllables: List[int]
+
+
+class TokenizedDocument:
+    """
+    A document tokenized once for all analyzers.
+
+    Two sentence definitions are kept, because the analyzers were
+    calibrated against them:
+
+    - ``sentences``: split at any run of ``.!?`` and never spanning a
+      paragraph (style metrics in AITextDetector)
+    - ``token_sentences``: split where ``.!?`` ends a whitespace token,
+      across paragraphs (readability metrics in ComplexityAnalyzer)
+
+    Whitespace tokens match ``text.split()``, so word positions and counts
+    agree with the analyzers' previous per-call tokenization.
+    """
+
+    def __init__(self, text: str):
+        """
+        Tokenize text.
+
+        Args:
+            text: Text to tokenize
+        """
+        self.text = text
+
+        # Whitespace tokens and their character offsets
+        self.tokens: List[str] = []
+        self.token_starts: List[int] = []
+        for match in TOKEN_PATTERN.finditer(text):
+            self.tokens.append(match.group())
+            self.token_starts.append(match.start())
+
+        # Offset of each line ('\n' separated)
+        self.line_starts: List[int] = [0]
+        position = text.find('\n')
+        while position != -1:
+            self.line_starts.append(position + 1)
+            position = text.find('\n', position + 1)
+
+        self._word_starts = [match.start() for match in WORD_PATTERN.finditer(text)]
+        self._boundaries = [(match.start(), match.end()) for match in SENTENCE_BOUNDARY.finditer(text)]
+
+        self.sentences: List[Sentence] = []
+        self.paragraphs: List[ParagraphSpan] = []
+        for start_line, end_line in self._paragraph_lines():
+            start = self.line_starts[start_line]
+            end = self.line_starts[end_line] - 1 if end_line < len(self.line_starts) else len(text)
+            first_sentence = len(self.sentences)
+            self._split_sentences(start, end)
+            self.paragraphs.append(ParagraphSpan(
+                start_line, end_line, start, end, first_sentence, len(self.sentences)
+            ))
+
+    def _paragraph_lines(self) -> List[Tuple[int, int]]:
+        """(start_line, end_line) of each run of non-blank lines."""
+        text = self.text
+        ends = self.line_starts[1:] + [len(text) + 1]
+        runs = []
+        current_start = None
+
+        for i, (start, end) in enumerate(zip(self.line_starts, ends, strict=True)):
+            if text[start:end - 1].strip():
+                if current_start is None:
+                    current_start = i
+            elif current_start is not None:
+                runs.append((current_start, i))
+                current_start = None
+
+        if current_start is not None:
+            runs.append((current_start, len(self.line_starts)))
+
+        return runs
+
+    def _split_sentences(self, start: int, end: int):
+        """Append the non-blank sentences between boundaries in [start, end)."""
+        text = self.text
+        i = bisect_left(self._boundaries, (start,))
+        position = start
+        while True:
+            if i < len(self._boundaries) and self._boundaries[i][0] < end:
+                boundary_start, boundary_end = self._boundaries[i]
+            else:
+                boundary_start = boundary_end = end
+            if text[position:boundary_start].strip():
+                self.sentences.append(Sentence(
+                    position, boundary_start, self.count_words(position, boundary_start)
+                ))
+            if boundary_end >= end:
+                return
+            position = boundary_end
+            i += 1
+
+    def count_words(self, start: int, end: int) -> int:
+        """Number of ``\\w+`` words starting in [start, end)."""
+        return bisect_left(self._word_starts, end) - bisect_left(self._word_starts, start)
+
+    def token_index(self, offset: int) -> int:
+        """Number of whitespace tokens that start before a character offset."""
+        return bisect_left(self.token_starts, offset)
+
+    def sentence_text(self, sentence: Sentence) -> str:
+        return self.text[sentence.start:sentence.end].strip()
+
+    def paragraph_text(self, paragraph: ParagraphSpan) -> str:
+        return self.text[paragraph.start:paragraph.end]
+
+    @cached_property
+    def syllable_counts(self) -> List[int]:
+        """Syllable count of each whitespace token."""
+        return [count_syllables(token) for token in self.tokens]
+
+    @cached_property
+    def token_sentences(self) -> List[TokenSentence]:
+        """
+        Sentences ending where a token ending in ``.!?`` is followed by whitespace.
+
+        The terminal punctuation is dropped from the sentence's last token,
+        unless that token ends the text.
+        """
+        sentences = []
+        syllable_counts = self.syllable_counts
+        last_token = len(self.tokens) - 1
+        first = 0
+
+        for i, token in enumerate(self.tokens):
+            followed_by_space = self.token_starts[i] + len(token) < len(self.text)
+            if followed_by_space and token[-1] in TERMINAL_PUNCTUATION:
+                words = self.tokens[first:i]
+                syllables = syllable_counts[first:i]
+                tail = token.rstrip(TERMINAL_PUNCTUATION)
+                if tail:
+                    words.append(tail)
+                    syllables.append(count_syllables(tail))
+            elif i == last_token:
+                words = self.tokens[first:]
+                syllables = syllable_counts[first:]
+            else:
+                continue
+            if words:
+                sentences.append(TokenSentence(words, syllables))
+            first = i + 1
+
+        return sentences
+
+    @cached_property
+    def normalized_words(self) -> List[str]:
+        """Lowercased words with punctuation other than ``.!?`` removed."""
+        words = NON_WORD.sub(' ', self.text.lower()).split()
+        return [w for w in words if w not in {'.', '!', '?'}]
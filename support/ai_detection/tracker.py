@@ -3,7 +3,7 @@
 import json
 import sqlite3
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 
 from .models import DetectionResult
@@ -47,6 +47,15 @@ class AICheckTracker:
                 CREATE INDEX IF NOT EXISTS idx_timestamp 
                 ON ai_check_history(timestamp)
             """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ai_check_cache (
+                    content_hash TEXT NOT NULL,
+                    config_key TEXT NOT NULL,
+                    result TEXT NOT NULL,  -- JSON
+                    checked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (content_hash, config_key)
+                )
+            """)
     
     def log_detection(self, result: DetectionResult, git_commit: Optional[str] = None):
         """Log a detection result to the database."""
@@ -74,6 +83,42 @@ class AICheckTracker:
                 result.ai_words_per_1000,
             ))
     
+    def get_cached_results(self, content_hashes: Iterable[str], config_key: str) -> Dict[str, dict]:
+        """
+        Look up earlier results for file contents.
+
+        Args:
+            content_hashes: SHA-256 hashes of file contents
+            config_key: Fingerprint of the detector configuration
+
+        Returns:
+            Dict of content hash -> result dict, for hashes already analyzed
+        """
+        hashes = list(dict.fromkeys(content_hashes))
+        cached = {}
+        with sqlite3.connect(self.db_path) as conn:
+            # Stay well under SQLite's host parameter limit
+            for i in range(0, len(hashes), 500):
+                chunk = hashes[i:i + 500]
+                cursor = conn.execute(f"""
+                    SELECT content_hash, result FROM ai_check_cache
+                    WHERE config_key = ? AND content_hash IN ({", ".join("?" * len(chunk))})
+                """, (config_key, *chunk))
+                for content_hash, result in cursor:
+                    cached[content_hash] = json.loads(result)
+        return cached
+    
+    def cache_results(self, config_key: str, results: Iterable[Tuple[str, dict]]):
+        """Store (content hash, result dict) pairs in one transaction."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO ai_check_cache (content_hash, config_key, result, checked_at)
+                VALUES (?, ?, ?, ?)
+            """, [
+                (content_hash, config_key, json.dumps(result), datetime.now().isoformat())
+                for content_hash, result in results
+            ])
+    
     def get_history(self, file_path: str, limit: int = 10) -> List[dict]:
         """Get detection history for a file."""
         with sqlite3.connect(self.db_path) as conn:
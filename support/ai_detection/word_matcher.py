@@ -0,0 +1,95 @@
+"""Single-pass matching of AI-typical vocabulary."""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation from a character trie (longest branches first)."""
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict) -> str:
+        alternatives = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if "" in node:
+            # A word ends here; tried after longer continuations
+            alternatives.append(r"\b")
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return "(?:" + "|".join(alternatives) + ")"
+
+    return emit(trie)
+
+
+class AIWordMatcher:
+    """
+    Count occurrences of many words and phrases in one pass.
+
+    All entries are compiled into one trie-derived regex inside a
+    lookahead, so every position where some entry starts is found in a
+    single scan. Counts match running ``\\bword\\b`` separately for each
+    entry: entries that are prefixes of a longer match at the same
+    position are counted too, and repeated matches of one entry do not
+    overlap.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Compile matcher.
+
+        Args:
+            words: Words and phrases (matched case-insensitively)
+        """
+        self.words = [word for word in dict.fromkeys(words) if word]
+        entries = sorted({word.lower() for word in self.words})
+
+        # Entry -> shorter entries it starts with, which may match at the same position
+        self._prefixes: Dict[str, List[Tuple[str, re.Pattern]]] = {
+            entry: [
+                (other, re.compile(r'\b' + re.escape(other) + r'\b'))
+                for other in entries
+                if other != entry and entry.startswith(other)
+            ]
+            for entry in entries
+        }
+        self._pattern = re.compile(r'(?=(\b' + _trie_pattern(entries) + '))') if entries else None
+
+    def count(self, text_lower: str) -> Dict[str, int]:
+        """
+        Count entries in lowercased text.
+
+        Args:
+            text_lower: Text, already lowercased
+
+        Returns:
+            Dict of entry (original spelling) -> count, for entries found
+        """
+        if self._pattern is None:
+            return {}
+
+        counts: Dict[str, int] = {}
+        last_end: Dict[str, int] = {}
+
+        def record(entry: str, start: int):
+            if start >= last_end.get(entry, 0):
+                counts[entry] = counts.get(entry, 0) + 1
+                last_end[entry] = start + len(entry)
+
+        for match in self._pattern.finditer(text_lower):
+            start = match.start()
+            entry = match.group(1)
+            record(entry, start)
+            for prefix, pattern in self._prefixes[entry]:
+                if pattern.match(text_lower, start):
+                    record(prefix, start)
+
+        found = {}
+        for word in self.words:
+            count = counts.get(word.lower(), 0)
+            if count:
+                found[word] = count
+        return found
@@ -0,0 +1,234 @@
+"""
+Tests for Agent Execution Engine
+
+Tests the persisted job queue, concurrency limits and autonomous driving
+of many projects, using the local stub runner.
+"""
+
+import pytest
+from pathlib import Path
+import asyncio
+import sys
+import time
+
+# Add code directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "code"))
+
+from agent_engine import (
+    ExecutionEngine, JobStore, JobStatus, LocalStubRunner, load_agent_definitions
+)
+from orchestrator import WorkflowOrchestrator, drive_autonomous
+from research_workflow import ResearchWorkflow
+from workflow_context import WorkflowContext, ResearchPhase, Mode
+
+
+DESIGN_FILES = {
+    "experimental_protocol": ("docs/experimental_protocol.md", "Sex as a biological variable.\n"),
+    "power_analysis": ("docs/power_analysis.md", "Power 0.8 (80%) with n=64.\n"),
+    "randomization": ("code/randomization.py", "SEED = 42\n"),
+}
+
+
+def make_context(root: Path, phase: ResearchPhase = ResearchPhase.EXPERIMENTAL_DESIGN,
+                 mode: Mode = Mode.AUTONOMOUS) -> WorkflowContext:
+    """Context in ``phase`` with every earlier phase completed"""
+    context = WorkflowContext(research_question=f"Question {root.name}?", mode=mode, project_root=root)
+    context.phase_history.clear()
+    for earlier in list(ResearchPhase)[:list(ResearchPhase).index(phase)]:
+        context.start_phase(earlier)
+        context.phase_history[-1].exited_at = context.phase_history[-1].entered_at
+    context.start_phase(phase)
+    return context
+
+
+def write_design_outputs(job, agent):
+    """Stub agent that writes the file its experiment-design sub-task asks for"""
+    for path, content in DESIGN_FILES.values():
+        if path in job.task:
+            target = Path(job.project_root) / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content)
+    return {"agent": agent.name}
+
+
+@pytest.fixture
+def agents():
+    return load_agent_definitions()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(tmp_path / "jobs.sqlite")
+
+
+class TestAgentDefinitions:
+    """Test parsing agents/*.md"""
+
+    def test_definitions_parsed_from_frontmatter(self, agents):
+        """Test name, tools, model and prompt come from each agent file"""
+        reviewer = agents["literature-reviewer"]
+
+        assert set(agents) >= set(a for a in WorkflowOrchestrator.PHASE_AGENTS.values() if a)
+        assert "WebFetch" in reviewer.tools
+        assert reviewer.model == "opus"
+        assert reviewer.prompt.startswith("# Literature Review")
+
+
+class TestExecutionEngine:
+    """Test queueing, dependencies, limits and recovery"""
+
+    def test_subtasks_run_concurrently_within_phase_limit(self, tmp_path, store, agents):
+        """Test independent sub-tasks overlap up to the phase limit and dependents wait"""
+        active, peak, finished = [], [], []
+
+        async def handler(job, agent):
+            active.append(job.job_id)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.remove(job.job_id)
+            finished.append(job)
+            return {}
+
+        engine = ExecutionEngine(
+            store, LocalStubRunner(handler), agents,
+            phase_limits={ResearchPhase.EXPERIMENTAL_DESIGN: 2}
+        )
+        for name in ("a", "b"):
+            engine.submit_phase(make_context(tmp_path / name), ResearchPhase.EXPERIMENTAL_DESIGN,
+                                "experiment-designer")
+
+        counts = asyncio.run(engine.run())
+
+        assert counts == {"succeeded": 8, "failed": 0}
+        assert max(peak) == 2
+        for name in ("a", "b"):
+            order = [job.agent for job in finished if job.project_root == str(tmp_path / name)]
+            assert order[-1] == "quality-assurance"  # Review ran after the three drafts
+
+    def test_failed_job_fails_dependents(self, tmp_path, store, agents):
+        """Test a failure cascades to jobs that depend on it, and re-executing retries the phase"""
+        def handler(job, agent):
+            if "power_analysis" in job.task:
+                raise RuntimeError("sample size tool crashed")
+            return {}
+
+        engine = ExecutionEngine(store, LocalStubRunner(handler), agents)
+        context = make_context(tmp_path / "a")
+        first = engine.submit_phase(context, ResearchPhase.EXPERIMENTAL_DESIGN, "experiment-designer")
+
+        assert asyncio.run(engine.run()) == {"succeeded": 2, "failed": 2}
+        review = store.get(first[-1])
+        assert review.status == JobStatus.FAILED
+        assert review.error == "Dependency failed or missing"
+        assert engine.submit_phase(context, ResearchPhase.EXPERIMENTAL_DESIGN, "experiment-designer") != first
+
+    def test_interrupted_run_resumes(self, tmp_path, store, agents):
+        """Test jobs left running are re-run and finished jobs are not"""
+        ran = []
+        engine = ExecutionEngine(store, LocalStubRunner(lambda job, agent: ran.append(job.job_id)), agents)
+        context = make_context(tmp_path / "a", ResearchPhase.ANALYSIS)
+        analysis_id, review_id = engine.submit_phase(context, ResearchPhase.ANALYSIS, "data-analyst")
+
+        # Simulate a crash while the analysis was running: its lease lapsed
+        job = store.get(analysis_id)
+        job.status, job.attempts = JobStatus.RUNNING, 1
+        job.owner, job.lease_expires = "crashed-engine", time.time() - 1
+        store.save(job)
+
+        asyncio.run(engine.run())
+
+        assert ran == [analysis_id, review_id]
+        assert store.get(analysis_id).attempts == 2
+        assert engine.submit_phase(context, ResearchPhase.ANALYSIS, "data-analyst") == [analysis_id, review_id]
+        asyncio.run(engine.run())
+        assert ran == [analysis_id, review_id]
+
+    def test_claim_is_exclusive(self, tmp_path, store):
+        """Test only one engine can claim a pending job, and only its owner can finish it"""
+        engine = ExecutionEngine(store, LocalStubRunner(), {})
+        job = store.get(engine.submit(tmp_path, ResearchPhase.ANALYSIS, "data-analyst", "Analyse"))
+
+        assert store.claim(job, "engine-a", 60)
+        assert not store.claim(store.get(job.job_id), "engine-b", 60)
+
+        job.status = JobStatus.SUCCEEDED
+        assert not store.finish(job, "engine-b")
+        assert store.finish(job, "engine-a")
+        assert store.get(job.job_id).status == JobStatus.SUCCEEDED
+
+    def test_second_engine_leaves_live_jobs_alone(self, tmp_path, store, agents):
+        """Test an engine started next to a running one does not re-run its jobs"""
+        ran = []
+
+        async def handler(job, agent):
+            ran.append(job.agent)
+            await asyncio.sleep(0.6)  # Outlives the lease unless heartbeats renew it
+            return {}
+
+        first = ExecutionEngine(store, LocalStubRunner(handler), agents, lease_seconds=0.3)
+        second = ExecutionEngine(store, LocalStubRunner(handler), agents, lease_seconds=0.3)
+        first.submit(tmp_path, ResearchPhase.ANALYSIS, "data-analyst", "Analyse")
+
+        async def both():
+            running = asyncio.create_task(first.run())
+            await asyncio.sleep(0.45)
+            return await second.run(), await running
+
+        late, early = asyncio.run(both())
+
+        assert ran == ["data-analyst"]
+        assert early == {"succeeded": 1, "failed": 0}
+        assert late == {"succeeded": 0, "failed": 0}
+
+
+class TestDriveAutonomous:
+    """Test advancing many autonomous projects through the engine"""
+
+    def test_slow_project_does_not_block_others(self, tmp_path, store, agents):
+        """Test a fast project advances several phases while another project's agent is still running"""
+        fast_done = asyncio.Event()
+        timeline, saved_while_waiting = [], []
+
+        async def handler(job, agent):
+            name = Path(job.project_root).name
+            if name == "slow":
+                saved_while_waiting.append(WorkflowContext.load(
+                    Path(job.project_root) / ".research_workflow" / "state.json"
+                ).current_phase)
+                # Only returns once the fast project finished its design review
+                await asyncio.wait_for(fast_done.wait(), timeout=5)
+            result = write_design_outputs(job, agent)
+            timeline.append((name, job.phase.value, agent.name))
+            if name == "fast" and agent.name == "quality-assurance":
+                fast_done.set()
+            return result
+
+        engine = ExecutionEngine(store, LocalStubRunner(handler), agents)
+        orchestrators = [
+            WorkflowOrchestrator(ResearchWorkflow(make_context(tmp_path / name, ResearchPhase.GAP_ANALYSIS)),
+                                 engine=engine)
+            for name in ("slow", "fast")
+        ]
+        assistant = WorkflowOrchestrator(
+            ResearchWorkflow(make_context(tmp_path / "assisted", ResearchPhase.GAP_ANALYSIS, Mode.ASSISTANT)),
+            engine=engine
+        )
+
+        phases = asyncio.run(drive_autonomous(orchestrators + [assistant], engine))
+
+        slow, fast = orchestrators
+        # Both stop at IRB approval, a human-only phase
+        assert phases[fast.context.workflow_id] == ResearchPhase.IRB_APPROVAL.value
+        assert phases[slow.context.workflow_id] == ResearchPhase.IRB_APPROVAL.value
+        assert phases[assistant.context.workflow_id] == ResearchPhase.GAP_ANALYSIS.value
+        assert timeline.index(("fast", "experimental_design", "quality-assurance")) < timeline.index(
+            ("slow", "gap_analysis", "gap-analyst")
+        )
+        outputs = fast.context.phase_history[-2].outputs
+        assert "docs/power_analysis.md" in outputs
+
+        # Progress is saved, not only held in memory
+        saved = WorkflowContext.load(tmp_path / "fast" / ".research_workflow" / "state.json")
+        assert saved.current_phase == ResearchPhase.IRB_APPROVAL
+        assert saved.has_completed_phase(ResearchPhase.EXPERIMENTAL_DESIGN)
+        assert saved_while_waiting[0] == ResearchPhase.GAP_ANALYSIS
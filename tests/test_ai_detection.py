@@ -0,0 +1,205 @@
+"""
+Tests for AI Text Detection
+
+Tests the AI-generated text detector used by tools/ai_check.py.
+"""
+
+import pytest
+from pathlib import Path
+import re
+import sys
+
+# Add support library to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "support"))
+
+from ai_detection.batch import BatchChecker, aggregate_report
+from ai_detection.config import AICheckConfig
+from ai_detection.detector import AITextDetector
+from ai_detection.enhanced_detector import EnhancedAITextDetector
+from ai_detection.tokenization import TokenizedDocument
+from ai_detection.tracker import AICheckTracker
+from ai_detection.word_matcher import AIWordMatcher
+
+
+AI_PARAGRAPH = (
+    "Moreover, we delve into robust methods that leverage comprehensive data to facilitate substantial gains overall in practice. "
+    "Moreover, we utilize innovative models that demonstrate considerable improvements across many realistic evaluation settings we studied. "
+    "Moreover, we implement enhanced pipelines that leverage the results to facilitate robust downstream decisions for teams. "
+    "Moreover, we utilize robust tools to delve into the findings and demonstrate comprehensive insights very quickly here. "
+    "Moreover, we leverage substantial resources to enhance the models and facilitate innovative research outcomes for all."
+)
+
+HUMAN_PARAGRAPH = (
+    "I ran the survey twice. The second round was a mess, honestly, "
+    "because half the forms came back blank and we had to chase people "
+    "for weeks. Still got enough to work with."
+)
+
+
+class TestAITextDetector:
+    """Test paragraph and document scoring."""
+
+    def test_single_long_paragraph(self):
+        """Test a single paragraph is analyzed without re-analyzing itself"""
+        detector = AITextDetector()
+
+        result = detector.analyze(" ".join([AI_PARAGRAPH] * 200))
+
+        assert result.total_words > 5000
+        assert result.overall_confidence > 0
+
+    def test_document_features_are_paragraph_sums(self):
+        """Test document-level features are the sum of paragraph vectors"""
+        detector = AITextDetector()
+        text = f"{HUMAN_PARAGRAPH}\n\n{AI_PARAGRAPH}\n\n{HUMAN_PARAGRAPH}"
+
+        document = detector.extract_features(text)
+
+        assert [(p.start_line, p.end_line) for p in document.paragraphs] == [(0, 1), (2, 3), (4, 5)]
+        assert document.total.word_count == sum(p.features.word_count for p in document.paragraphs)
+        assert document.total.paragraph_sentence_counts == [3, 5, 3]
+        assert detector.analyze(text).total_words == document.total.word_count
+
+    def test_flagged_sections_scored_per_paragraph(self):
+        """Test only the AI-like paragraph is flagged, with its line range"""
+        detector = AITextDetector()
+        # Long enough (>1000 words) for the grammar-perfection signal to count
+        long_ai = " ".join([AI_PARAGRAPH] * 13)
+        text = f"{HUMAN_PARAGRAPH}\n\n{long_ai}\n\n{HUMAN_PARAGRAPH}\n"
+
+        result = detector.analyze(text)
+
+        assert [(s.start_line, s.end_line) for s in result.flagged_sections] == [(3, 3)]
+        section = result.flagged_sections[0]
+        assert "AI-typical words" in section.patterns
+        assert section.ai_words
+
+
+class TestTokenizedDocument:
+    """Test the tokenization shared by all analyzers."""
+
+    def test_spans_match_per_analyzer_splitting(self):
+        """Test tokens, sentences and positions agree with splitting the text directly"""
+        text = f"Intro (Smith, 2020) e.g. here.\n\n  \n{HUMAN_PARAGRAPH}\nAs shown [1]. End!"
+
+        tokenized = TokenizedDocument(text)
+
+        assert tokenized.tokens == text.split()
+        assert [(p.start_line, p.end_line) for p in tokenized.paragraphs] == [(0, 1), (3, 5)]
+        first = tokenized.paragraphs[0]
+        assert [tokenized.sentence_text(s) for s in tokenized.sentences[first.first_sentence:first.last_sentence]] == [
+            "Intro (Smith, 2020) e", "g", "here"
+        ]
+        assert [s.word_count for s in tokenized.sentences] == [
+            len(re.findall(r'\b\w+\b', tokenized.sentence_text(s))) for s in tokenized.sentences
+        ]
+        assert [" ".join(s.words) for s in tokenized.token_sentences] == [
+            " ".join(s.split()) for s in re.split(r'[.!?]+\s+', text) if s.strip()
+        ]
+        offset = text.index("[1]")
+        assert tokenized.token_index(offset) == len(text[:offset].split())
+
+    def test_enhanced_analysis_tokenizes_once(self, monkeypatch):
+        """Test every analyzer reads the one tokenization built by the enhanced detector"""
+        built = []
+        original_init = TokenizedDocument.__init__
+
+        def counting_init(self, text):
+            built.append(text)
+            original_init(self, text)
+
+        monkeypatch.setattr(TokenizedDocument, "__init__", counting_init)
+        text = f"{AI_PARAGRAPH} (Smith, 2020)\n\n{HUMAN_PARAGRAPH}"
+
+        result = EnhancedAITextDetector().analyze(text)
+
+        assert len(built) == 1
+        assert result["base_confidence"] == AITextDetector().analyze(text).overall_confidence
+
+
+class TestAIWordMatcher:
+    """Test single-pass AI vocabulary matching."""
+
+    def test_counts_match_per_word_search(self):
+        """Test counts agree with a separate word-boundary search per entry"""
+        words = [
+            "state", "state-of-the-art", "art", "cutting-edge", "edge",
+            "very very", "in conclusion", "Delve", "leverage",
+        ]
+        text = (
+            "In conclusion, state-of-the-art and cutting-edge art: very very very "
+            "good. We delve, delve again, and leverage leverages.\n"
+        ).lower()
+
+        counts = AIWordMatcher(words).count(text)
+
+        expected = {}
+        for word in words:
+            found = len(re.findall(r'\b' + re.escape(word.lower()) + r'\b', text))
+            if found:
+                expected[word] = found
+        assert counts == expected
+        assert counts["very very"] == 1 and counts["state"] == 1
+
+    def test_matcher_cached_on_config(self):
+        """Test the matcher is compiled once and rebuilt when vocabulary changes"""
+        config = AICheckConfig()
+        matcher = config.get_ai_word_matcher()
+
+        assert config.get_ai_word_matcher() is matcher
+
+        config.ai_words = {**config.ai_words, "custom": ["paradigm shift"]}
+        rebuilt = config.get_ai_word_matcher()
+        assert rebuilt is not matcher
+        assert rebuilt.count("a paradigm shift.") == {"paradigm shift": 1}
+
+
+class TestBatchChecker:
+    """Test parallel batch checking with the content-hash cache."""
+
+    @pytest.fixture
+    def chapters(self, tmp_path):
+        files = []
+        for i, text in enumerate([AI_PARAGRAPH, HUMAN_PARAGRAPH, f"{HUMAN_PARAGRAPH}\n\n{AI_PARAGRAPH}"]):
+            path = tmp_path / f"chapter_{i}.md"
+            path.write_text(text)
+            files.append(path)
+        return files
+
+    def test_parallel_results_match_serial_detector(self, chapters):
+        """Test pooled results equal running the detector file by file"""
+        checker = BatchChecker(jobs=2)
+
+        records = {r["file_path"]: r for r in checker.run(chapters)}
+
+        detector = AITextDetector()
+        for path in chapters:
+            expected = detector.analyze(path.read_text(), str(path))
+            assert records[str(path)]["overall_confidence"] == expected.overall_confidence
+            assert records[str(path)]["cached"] is False
+
+    def test_unchanged_files_served_from_cache(self, chapters, tmp_path):
+        """Test a second run only re-analyzes the file whose content changed"""
+        tracker = AICheckTracker(str(tmp_path / "history.db"))
+        list(BatchChecker(tracker=tracker, jobs=1).run(chapters))
+        chapters[1].write_text(HUMAN_PARAGRAPH + " Changed.")
+
+        records = list(BatchChecker(tracker=tracker, jobs=1).run(chapters))
+
+        assert {r["file_path"]: r["cached"] for r in records} == {
+            str(chapters[0]): True, str(chapters[1]): False, str(chapters[2]): True,
+        }
+        summary = aggregate_report(records)
+        assert (summary["files_checked"], summary["files_analyzed"], summary["files_cached"]) == (3, 1, 2)
+        assert summary["total_words"] == sum(r["statistics"]["total_words"] for r in records)
+
+    def test_cache_keyed_by_configuration(self, chapters, tmp_path):
+        """Test changing the configuration invalidates cached results"""
+        tracker = AICheckTracker(str(tmp_path / "history.db"))
+        list(BatchChecker(tracker=tracker, jobs=1).run(chapters))
+        config = AICheckConfig()
+        config.thresholds = {**config.thresholds, "ai_words_per_1000": 5.0}
+
+        records = list(BatchChecker(config, tracker=tracker, jobs=1).run(chapters))
+
+        assert not any(r["cached"] for r in records)
@@ -0,0 +1,125 @@
+"""
+Tests for Phase Output Index
+
+Tests discovery of phase outputs and incremental manifest updates.
+"""
+
+import pytest
+from pathlib import Path
+import os
+import sys
+
+# Add code directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "code"))
+
+import phase_outputs
+from phase_outputs import PhaseOutputIndex, MANIFEST_FILE
+from workflow_context import ResearchPhase
+
+
+@pytest.fixture
+def hashed(monkeypatch):
+    """Record which files the index hashes"""
+    paths = []
+    original = phase_outputs._hash_file
+
+    def counting_hash(path):
+        paths.append(Path(path).name)
+        return original(path)
+
+    monkeypatch.setattr(phase_outputs, "_hash_file", counting_hash)
+    return paths
+
+
+def write(path: Path, content: str, age: float = 0):
+    """Write a file, optionally backdating its mtime by ``age`` seconds"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    if age:
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - int(age * 1e9)))
+
+
+class TestPhaseOutputIndex:
+    """Test output discovery and incremental updates"""
+
+    @pytest.mark.parametrize("use_inotify", [False, True])
+    def test_tracks_added_changed_and_removed_outputs(self, tmp_path, use_inotify):
+        """Test outputs follow files created, edited and deleted under the configured locations"""
+        if use_inotify and phase_outputs.inotify_simple is None:
+            pytest.skip("inotify_simple not installed")
+        literature = tmp_path / "data" / "literature"
+        write(literature / "search_results.csv", "id\n1\n")
+        write(tmp_path / "results" / "prisma_flow_diagram.md", "flow")
+        write(tmp_path / "results" / "unrelated.csv", "x")
+        index = PhaseOutputIndex(tmp_path, use_inotify=use_inotify)
+
+        assert index.outputs(ResearchPhase.LITERATURE_REVIEW) == [
+            "data/literature/search_results.csv",
+            "results/prisma_flow_diagram.md"
+        ]
+
+        write(literature / "extraction" / "study_1.csv", "a,b\n")
+        write(literature / "search_results.csv", "id\n1\n2\n")
+        (tmp_path / "results" / "prisma_flow_diagram.md").unlink()
+
+        records = {r.path: r for r in index.records(ResearchPhase.LITERATURE_REVIEW)}
+        assert sorted(records) == [
+            "data/literature/extraction/study_1.csv",
+            "data/literature/search_results.csv"
+        ]
+        assert records["data/literature/search_results.csv"].size == len("id\n1\n2\n")
+        index.close()
+
+    def test_unchanged_files_not_rehashed(self, tmp_path, hashed):
+        """Test a new process reuses the manifest and hashes only changed files"""
+        raw = tmp_path / "data" / "raw"
+        for i in range(5):
+            write(raw / f"subject_{i}.csv", f"row {i}\n", age=60)
+        PhaseOutputIndex(tmp_path, use_inotify=False).refresh()
+        assert len(hashed) == 5
+        assert (tmp_path / MANIFEST_FILE).exists()
+
+        write(raw / "subject_2.csv", "row 2 edited\n")
+        outputs = PhaseOutputIndex(tmp_path, use_inotify=False).outputs(ResearchPhase.DATA_COLLECTION)
+
+        assert outputs == [f"data/raw/subject_{i}.csv" for i in range(5)]
+        assert hashed[5:] == ["subject_2.csv"]
+
+    def test_recent_same_size_rewrite_detected(self, tmp_path):
+        """Test a file indexed right after a write is re-checked, so a same-size rewrite is seen"""
+        statement = tmp_path / "docs" / "problem_statement.md"
+        write(statement, "version one")
+        index = PhaseOutputIndex(tmp_path, use_inotify=False)
+        first = index.records(ResearchPhase.PROBLEM_FORMULATION)[0]
+
+        st = statement.stat()
+        statement.write_text("version two")
+        os.utime(statement, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        second = index.records(ResearchPhase.PROBLEM_FORMULATION)[0]
+        assert (second.size, second.mtime_ns) == (first.size, first.mtime_ns)
+        assert second.sha256 != first.sha256
+
+    def test_unwatchable_directory_checked_by_mtime(self, tmp_path, monkeypatch):
+        """Test a directory whose watch cannot be added still has its changes picked up"""
+        if phase_outputs.inotify_simple is None:
+            pytest.skip("inotify_simple not installed")
+        raw = tmp_path / "data" / "raw"
+        write(raw / "subject_1.csv", "1")
+        write(raw / "site_a" / "subject_2.csv", "2")
+        original = phase_outputs.inotify_simple.INotify.add_watch
+
+        def add_watch(inotify, path, mask):
+            if path.endswith("site_a"):
+                raise OSError(28, "No space left on device")  # max_user_watches
+            return original(inotify, path, mask)
+
+        monkeypatch.setattr(phase_outputs.inotify_simple.INotify, "add_watch", add_watch)
+        index = PhaseOutputIndex(tmp_path)
+        index.refresh()
+
+        write(raw / "site_a" / "subject_3.csv", "3")
+
+        assert "data/raw/site_a/subject_3.csv" in index.outputs(ResearchPhase.DATA_COLLECTION)
+        index.close()
@@ -6,6 +6,7 @@ import pytest
 from pathlib import Path
 import tempfile
 import sys
+import re
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "code"))
@@ -15,11 +16,24 @@ from quality_assurance.base import (
 )
 from quality_assurance.reproducibility_validator import ReproducibilityValidator
 from quality_assurance.citation_verifier import CitationVerifier
-from quality_assurance.statistical_validator import StatisticalValidator
+from quality_assurance.statistical_validator import (
+    StatisticalValidator, STATISTICAL_PATTERN_FAMILIES, STATISTICAL_SCANNER
+)
 from quality_assurance.qa_manager import QAManager, create_default_config
+from quality_assurance.file_index import ProjectSnapshot
+from quality_assurance.code_index import CodeIndex, build_module_index
 from workflow_context import WorkflowContext
 
 
+class SlowStatisticalValidator(StatisticalValidator):
+    """Statistical validator that hangs (module level so it can be pickled)."""
+
+    def validate(self):
+        import time
+        time.sleep(30)
+        return []
+
+
 class TestBase:
     """Test base validation framework."""
 
@@ -113,6 +127,133 @@ class TestBase:
         assert validator.results[0].is_passing()
 
 
+class TestProjectSnapshot:
+    """Test shared project file index."""
+
+    def test_excludes_and_gitignore(self, tmp_path):
+        """Test default exclusions and .gitignore rules."""
+        for rel in [
+            "analysis.py", "src/model.py", "src/generated/out.py", "notes/debug.log",
+            ".venv/lib/site.py", "node_modules/pkg/index.py", ".dvc/cache/ab/cdef",
+            "data/keep.csv", "data/raw.csv",
+        ]:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x = 1\n")
+        (tmp_path / ".gitignore").write_text("*.log\n/data/*.csv\n!/data/keep.csv\n")
+        (tmp_path / "src" / ".gitignore").write_text("generated/\n")
+
+        snapshot = ProjectSnapshot(tmp_path)
+
+        assert snapshot.find_files("**/*.py") == [tmp_path / "analysis.py", tmp_path / "src" / "model.py"]
+        assert snapshot.find_files("data/*.csv") == [tmp_path / "data" / "keep.csv"]
+        assert snapshot.find_files("**/*.log") == []
+        assert ".dvc/cache/ab/cdef" not in snapshot.paths
+
+    def test_contents_read_once(self, tmp_path):
+        """Test file contents are memoized."""
+        (tmp_path / "analysis.py").write_text("import numpy as np\nnp.random.seed(1)\n")
+
+        snapshot = ProjectSnapshot(tmp_path)
+        first = snapshot.read(tmp_path / "analysis.py")
+        (tmp_path / "analysis.py").write_text("changed")
+
+        assert snapshot.read("analysis.py") == first
+        assert snapshot.read("missing.py") is None
+        assert snapshot.read_count == 2
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_manager_shares_snapshot(self, tmp_path, parallel):
+        """Test QA manager builds one snapshot and reads each file once."""
+        (tmp_path / "requirements.txt").write_text("numpy==1.24.0")
+        (tmp_path / "README.md").write_text("# Project\nrandom seed 42")
+        (tmp_path / "analysis.py").write_text("import numpy as np\nnp.random.seed(42)\n")
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "methods.md").write_text("# Methods\npower analysis\n")
+
+        manager = QAManager(tmp_path)
+        manager.config["qa_manager"]["parallel"] = parallel
+        manager.run_full_qa()
+
+        snapshot = manager.snapshot
+        assert snapshot is not None
+        assert snapshot.read_count == len(snapshot._contents)
+        assert tmp_path / "analysis.py" in snapshot._contents
+        assert tmp_path / "README.md" in snapshot._contents
+        # Validators are detached after the run
+        assert manager.reproducibility.snapshot is None
+
+
+class TestCodeIndex:
+    """Test AST import/call index."""
+
+    def test_resolves_aliases_and_ignores_text(self):
+        """Test call targets resolve through imports; comments and strings don't count."""
+        module = build_module_index("""
+import numpy as np
+from scipy import stats
+# np.random.seed(0)
+note = "torch.manual_seed(1)"
+np.random.seed(42)
+for group in groups:
+    stats.ttest_ind(control, group)
+""")
+
+        assert module.parsed
+        assert [c.target for c in module.calls] == ["numpy.random.seed", "scipy.stats.ttest_ind"]
+        assert module.calls_to(["numpy.random.seed"])[0].line == 6
+        ttest = module.calls_named(["scipy"], ["ttest_ind"])[0]
+        assert ttest.line == 8 and ttest.in_loop
+        assert module.imports_from("scipy.stats")[0].alias == "stats"
+
+    def test_unparseable_source(self):
+        """Test notebook magics are tolerated and syntax errors are reported."""
+        assert build_module_index("%matplotlib inline\nimport numpy\n").parsed
+        assert not build_module_index("print 'python 2'\n").parsed
+
+    def test_persisted_by_content_hash(self, tmp_path):
+        """Test each file version is parsed once across index instances."""
+        store = tmp_path / "code_index.sqlite"
+        source = "import torch\ntorch.manual_seed(0)\n"
+
+        first = CodeIndex(store)
+        first.get(source)
+        first.get(source)
+        assert first.parse_count == 1
+
+        second = CodeIndex(store)
+        assert second.get(source).calls_to(["torch.manual_seed"])[0].line == 2
+        assert second.parse_count == 0
+        second.get(source + "\n")
+        assert second.parse_count == 1
+
+    def test_commented_seed_not_counted(self, tmp_path):
+        """Test seed check ignores commented-out seeding."""
+        (tmp_path / "train.py").write_text("import numpy as np\n# np.random.seed(42)\n")
+        validator = ReproducibilityValidator(tmp_path)
+
+        validator.validate_seed_usage()
+        assert validator.results[0].is_warning()
+
+        (tmp_path / "train.py").write_text(
+            "import numpy as np\nrng = np.random.default_rng(42)\n"
+        )
+        validator.clear_results()
+        validator.validate_seed_usage()
+        assert validator.results[0].is_passing()
+        assert validator.results[0].details["lines"] == {"train.py": [2]}
+
+    def test_statistical_checks_use_calls(self, tmp_path):
+        """Test statistical checks ignore test names mentioned only in comments."""
+        validator = StatisticalValidator(tmp_path)
+        code = "# TODO: for each arm run ttest_ind and check shapiro\nimport numpy as np\n"
+
+        validator.validate_multiple_comparisons([("plan.py", code)])
+        validator.validate_assumptions([("plan.py", code)])
+
+        assert [r.status for r in validator.results] == [ValidationStatus.SKIPPED] * 2
+
+
 class TestReproducibilityValidator:
     """Test reproducibility validator."""
 
@@ -393,6 +534,43 @@ reject, pvals_corrected, _, _ = multipletests(pvalues, method='bonferroni')
         assert len(validator.results) == 1
         assert validator.results[0].is_passing()
 
+    def test_scanner_matches_individual_patterns(self):
+        """Test single-pass scanner agrees with per-pattern searches."""
+        texts = [
+            "from scipy.stats import ttest_ind\nstat, p = ttest_ind(a, b)\n",
+            "The effect was marginally significant (CI: 0.1-0.4).\n",
+            "reject, p_adj, _, _ = multipletests(pvals, method='fdr_bh')\n",
+            "model = OLS(y, X).fit()\nci = model.conf_int()\nshapiro(resid)\n",
+            "for g in groups: ttest_ind(g, ctrl)\nDurbin-Watson: 1.9\n",
+            "Nothing statistical here, just a specification.\n",
+        ]
+
+        for text in texts:
+            hits = STATISTICAL_SCANNER.scan(text)
+            for family, sources in STATISTICAL_PATTERN_FAMILIES.items():
+                expected = any(re.search(source, text, re.IGNORECASE) for source in sources)
+                assert hits.has(family) == expected, (family, text)
+
+    def test_scanner_reports_overlapping_families_with_lines(self):
+        """Test one match position can hit several families."""
+        hits = STATISTICAL_SCANNER.scan("import numpy\n\nttest_ind(a, b)\n")
+
+        assert hits.has("p_value")
+        assert hits.has("parametric_test")
+        assert hits.lines("p_value") == [3]
+        assert hits.lines("parametric_test") == [3]
+        assert not hits.has("correction")
+
+    def test_problematic_pvalue_lines_reported(self, tmp_path):
+        """Test problematic p-value language is located by line."""
+        validator = StatisticalValidator(tmp_path)
+        code = "p_value = 0.07\n# marginally significant result\n"
+
+        validator.validate_p_values([("code/report.py", code)])
+
+        assert validator.results[0].is_warning()
+        assert validator.results[0].details["lines"] == {"code/report.py": [2]}
+
 
 class TestQAManager:
     """Test QA manager."""
@@ -531,7 +709,7 @@ class TestCitationVerifierExtended:
         }
 
         mock_get = Mock(return_value=mock_response)
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("requests.Session.get", mock_get)
 
         # Run validation
         results = verifier.validate()
@@ -556,7 +734,7 @@ class TestCitationVerifierExtended:
         }
 
         mock_get = Mock(return_value=mock_response)
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("requests.Session.get", mock_get)
 
         is_valid, metadata = verifier.check_doi_crossref("10.1234/test")
 
@@ -575,7 +753,7 @@ class TestCitationVerifierExtended:
         mock_response.status_code = 404
 
         mock_get = Mock(return_value=mock_response)
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("requests.Session.get", mock_get)
 
         is_valid, metadata = verifier.check_doi_crossref("10.invalid/doi")
 
@@ -596,7 +774,7 @@ class TestCitationVerifierExtended:
         mock_response.json.return_value = {"message": {}}
 
         mock_get = Mock(return_value=mock_response)
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("requests.Session.get", mock_get)
 
         verifier.check_doi_crossref("10.1234/test")
 
@@ -630,7 +808,7 @@ class TestCitationVerifierExtended:
         }
 
         mock_get = Mock(return_value=mock_response)
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("requests.Session.get", mock_get)
 
         results = verifier.validate()
 
@@ -667,7 +845,7 @@ class TestCitationVerifierExtended:
         }
 
         mock_get = Mock(return_value=mock_response)
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("requests.Session.get", mock_get)
 
         results = verifier.validate()
 
@@ -749,13 +927,134 @@ class TestCitationVerifierExtended:
 
         # Mock API (should not be called due to cache)
         mock_get = Mock()
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("requests.Session.get", mock_get)
 
         verifier.validate_dois_batch(entries)
 
         # API should not have been called
         assert not mock_get.called
 
+    def test_validity_and_retraction_share_one_fetch(self, tmp_path, monkeypatch):
+        """Test that each DOI is fetched once for both DOI and retraction checks"""
+        from unittest.mock import Mock
+
+        verifier = CitationVerifier(tmp_path, {"crossref_max_workers": 4})
+
+        entries = [
+            {"key": f"ref{i}", "doi": f"10.1234/paper{i % 6}"}
+            for i in range(12)
+        ]
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"X-Rate-Limit-Limit": "1000", "X-Rate-Limit-Interval": "1s"}
+        mock_response.json.return_value = {
+            "message": {"update-to": [], "type": "journal-article"}
+        }
+
+        mock_get = Mock(return_value=mock_response)
+        monkeypatch.setattr("requests.Session.get", mock_get)
+
+        verifier.validate_dois_batch(entries)
+        verifier.check_retractions_batch(entries)
+
+        # Six distinct DOIs, one request each
+        assert mock_get.call_count == 6
+        assert all(r.is_passing() for r in verifier.get_results())
+
+    def test_doi_store_persists_across_runs(self, tmp_path, monkeypatch):
+        """Test that a second verifier reuses stored DOIs and revalidates stale ones"""
+        from unittest.mock import Mock
+
+        entries = [{"key": "ref1", "doi": "10.1234/stored"}]
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": '"v1"'}
+        mock_response.json.return_value = {
+            "message": {"update-to": [], "type": "journal-article"}
+        }
+        mock_get = Mock(return_value=mock_response)
+        monkeypatch.setattr("requests.Session.get", mock_get)
+
+        CitationVerifier(tmp_path).check_retractions_batch(entries)
+        assert mock_get.call_count == 1
+        assert (tmp_path / ".research_workflow" / "doi_cache.sqlite").exists()
+
+        # Fresh record: no request at all
+        verifier = CitationVerifier(tmp_path)
+        verifier.validate_dois_batch(entries)
+        verifier.check_retractions_batch(entries)
+        assert mock_get.call_count == 1
+        assert all(r.is_passing() for r in verifier.get_results())
+
+        # Stale retraction status: conditional request, 304 keeps the record
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        mock_get.return_value = not_modified
+
+        verifier = CitationVerifier(tmp_path, {"retraction_ttl_days": 0})
+        verifier.check_retractions_batch(entries)
+        assert mock_get.call_count == 2
+        assert mock_get.call_args[1]["headers"]["If-None-Match"] == '"v1"'
+        assert verifier.get_results()[0].is_passing()
+
+    def test_doi_store_keys_prefix_forms_alike(self, tmp_path):
+        """Test every resolver prefix form of a DOI reads and writes one row"""
+        from quality_assurance.doi_store import DOIMetadataStore
+
+        store = DOIMetadataStore(tmp_path / "doi_cache.sqlite")
+        store.put("doi:10.1000/ABC", True, {"title": ["T"]})
+
+        for form in ("10.1000/abc", "https://dx.doi.org/10.1000/ABC", "http://doi.org/10.1000/abc"):
+            assert store.get(form)["metadata"] == {"title": ["T"]}
+        assert store.stats()["entries"] == 1
+
+    @pytest.mark.parametrize("server", [
+        "citation-management.py",
+        "citation-management/src/research_citations/server.py",
+    ])
+    def test_mcp_server_doi_keys_match_store(self, server):
+        """Test the citation MCP servers key the shared DOI store like QA does"""
+        import ast
+        from quality_assurance.doi_store import normalize_doi
+
+        # Only the key functions: importing the server needs the MCP framework
+        source = (Path(__file__).parent.parent / "mcp-servers" / server).read_text()
+        wanted = {"DOI_PREFIXES", "clean_doi", "normalize_doi"}
+
+        def defines_wanted(node):
+            if isinstance(node, ast.FunctionDef):
+                return node.name in wanted
+            return isinstance(node, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id in wanted for target in node.targets
+            )
+
+        nodes = [node for node in ast.parse(source).body if defines_wanted(node)]
+        namespace = {}
+        exec(compile(ast.Module(nodes, type_ignores=[]), server, "exec"), namespace)
+
+        for doi in ("10.1000/ABC", "doi:10.1000/ABC", "https://dx.doi.org/10.1000/abc",
+                    "http://dx.doi.org/10.1000/abc", " HTTPS://DOI.ORG/10.1000/Abc "):
+            assert namespace["normalize_doi"](doi) == normalize_doi(doi)
+
+    def test_rate_limiter_follows_crossref_headers(self):
+        """Test rate limiter adopts X-Rate-Limit-* headers"""
+        from quality_assurance.citation_verifier import CrossrefRateLimiter
+
+        limiter = CrossrefRateLimiter()
+        limiter.update({"X-Rate-Limit-Limit": "50", "X-Rate-Limit-Interval": "1s"})
+
+        assert limiter.limit == 50
+        assert limiter.interval == 1.0
+        assert limiter.spacing == pytest.approx(0.02)
+
+        # Malformed headers leave the current limits untouched
+        limiter.update({"X-Rate-Limit-Limit": "lots", "X-Rate-Limit-Interval": "soon"})
+        assert limiter.limit == 50
+        assert limiter.interval == 1.0
+
 
 class TestStatisticalValidatorExtended:
     """Extended statistical validator tests for comprehensive coverage"""
@@ -818,6 +1117,37 @@ class TestStatisticalValidatorExtended:
         assert code is not None
         assert "scipy.stats" in code
 
+    def test_extract_notebook_code_streaming(self, tmp_path, monkeypatch):
+        """Test streamed and whole-document extraction agree and skip outputs"""
+        import json
+        pytest.importorskip("ijson")
+        from quality_assurance import notebook_reader
+
+        notebook = {
+            "cells": [
+                {
+                    # Keys out of nbformat order: source before cell_type
+                    "source": ["import numpy as np\n", "np.random.seed(0)"],
+                    "outputs": [{"data": {"image/png": "iVBOR" * 10000}}],
+                    "cell_type": "code",
+                },
+                {"cell_type": "markdown", "source": "# ttest_ind in prose"},
+                {"cell_type": "code", "source": "x = 1", "outputs": []},
+            ]
+        }
+        nb_file = tmp_path / "figures.ipynb"
+        nb_file.write_text(json.dumps(notebook))
+
+        validator = StatisticalValidator(tmp_path, snapshot=ProjectSnapshot(tmp_path))
+        streamed = validator.extract_notebook_code(nb_file)
+        monkeypatch.setattr(notebook_reader, "ijson", None)
+        loaded = validator.extract_notebook_code(nb_file)
+
+        assert streamed == loaded == "import numpy as np\nnp.random.seed(0)\n\nx = 1"
+        # Tracked as an input, but never cached in the snapshot
+        assert "figures.ipynb" in validator.input_manifest()["files"]
+        assert nb_file not in validator.snapshot._contents
+
     def test_validate_with_notebooks(self, tmp_path):
         """Test validation including notebook files"""
         import json
@@ -1028,6 +1358,106 @@ class TestQAManagerExtended:
         manager = QAManager(project_root=tmp_path)
         assert hasattr(manager, 'project_root')
 
+    def test_parallel_results_match_sequential(self, tmp_path):
+        """Test concurrent validators give the same ordered results as sequential"""
+        (tmp_path / "requirements.txt").write_text("numpy==1.24.0")
+        (tmp_path / "analysis.py").write_text("import numpy as np\nnp.random.seed(42)\n")
+
+        manager = QAManager(tmp_path)
+        parallel = manager.run_full_qa()
+
+        manager.config["qa_manager"]["parallel"] = False
+        sequential = manager.run_full_qa()
+
+        key = lambda r: (r.category, r.check_name, r.status, r.message)
+        assert [key(r) for r in parallel.results] == [key(r) for r in sequential.results]
+        assert set(parallel.validator_timings) == {
+            "Reproducibility Validator", "Citation Verifier", "Statistical Validator"
+        }
+        assert "validator_timings" in parallel.to_dict()
+        assert "Validator Timings" in parallel.to_markdown()
+
+        # Category blocks stay in fixed order
+        categories = [r.category for r in parallel.results]
+        assert categories == sorted(
+            categories, key=["reproducibility", "citation", "statistical"].index
+        )
+
+    def test_incremental_qa(self, tmp_path, monkeypatch):
+        """Test incremental runs reuse results until inputs, config or version change"""
+        (tmp_path / "requirements.txt").write_text("numpy==1.24.0")
+        (tmp_path / "analysis.py").write_text("import numpy as np\nnp.random.seed(42)\n")
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "methods.md").write_text("# Methods\n")
+
+        manager = QAManager(tmp_path)
+        first = manager.run_full_qa(incremental=True)
+        assert first.cached_checks == []
+        assert (tmp_path / ".research_workflow" / "qa_cache" / "manifest.json").exists()
+
+        second = QAManager(tmp_path).run_full_qa(incremental=True)
+        assert len(second.cached_checks) == second.total_checks
+        assert [r.to_dict()["message"] for r in second.results] == \
+            [r.to_dict()["message"] for r in first.results]
+
+        def cached_categories(report):
+            return {r.category for r in report.results if r.cached}
+
+        # A new file matching a validator's glob invalidates that validator only
+        (tmp_path / "docs" / "stats.md").write_text("p < 0.05 with power analysis\n")
+        third = QAManager(tmp_path).run_full_qa(incremental=True)
+        assert "citation" in cached_categories(third)
+        assert "statistical" not in cached_categories(third)
+
+        # Config change
+        manager = QAManager(tmp_path)
+        manager.config["reproducibility"]["require_docker"] = True
+        fourth = manager.run_full_qa(incremental=True)
+        assert "reproducibility" not in cached_categories(fourth)
+        assert "statistical" in cached_categories(fourth)
+
+        # Validator version bump
+        monkeypatch.setattr(StatisticalValidator, "VERSION", "test-bump")
+        manager = QAManager(tmp_path)
+        manager.config["reproducibility"]["require_docker"] = True
+        fifth = manager.run_full_qa(incremental=True)
+        assert "statistical" not in cached_categories(fifth)
+        assert "reproducibility" in cached_categories(fifth)
+
+    def test_validator_timeout(self, tmp_path):
+        """Test a slow validator is reported as timed out"""
+        import time as time_module
+
+        class SlowValidator(BaseValidator):
+            def validate(self):
+                time_module.sleep(1.0)
+                return []
+
+        manager = QAManager(tmp_path)
+        manager.config["qa_manager"]["validator_timeouts"] = {"citations": 0.1}
+        manager.citations = SlowValidator(tmp_path)
+
+        report = manager.run_phase_qa("literature_review")
+
+        assert len(report.results) == 1
+        assert report.results[0].is_error()
+        assert "timed out" in report.results[0].message
+        assert report.validator_timings["Citation Verifier"] < 1.0
+
+    def test_timed_out_process_terminated(self, tmp_path):
+        """Test a validator process that times out is killed"""
+        import multiprocessing
+
+        manager = QAManager(tmp_path)
+        manager.config["qa_manager"]["validator_timeouts"] = {"statistics": 0.5}
+        manager.statistics = SlowStatisticalValidator(tmp_path)
+
+        report = manager.run_phase_qa("interpretation")
+
+        assert "timed out" in report.results[0].message
+        assert report.validator_timings["Statistical Validator"] < 5
+        assert multiprocessing.active_children() == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -15,7 +15,8 @@ from workflow_context import (
     ResearchPhase,
     Mode,
     ValidationResult,
-    PhaseRecord
+    PhaseRecord,
+    create_backup
 )
 from research_workflow import ResearchWorkflow, create_workflow
 
@@ -89,6 +90,80 @@ class TestWorkflowContext:
         assert len(restored.phase_history) == len(context.phase_history)
 
 
+class TestWorkflowJournal:
+    """Test journaled state storage"""
+
+    def test_saves_append_to_journal(self, tmp_path):
+        """Test later saves append changes instead of rewriting the snapshot"""
+        state_path = tmp_path / "state.json"
+        context = WorkflowContext(research_question="Journal")
+        context.start_phase(ResearchPhase.PROBLEM_FORMULATION)
+        context.save(state_path)
+        snapshot = state_path.read_text()
+
+        context.complete_phase(ValidationResult(passed=True, score=0.8), outputs=["a.md"])
+        context.start_phase(ResearchPhase.LITERATURE_REVIEW)
+        context.resources["n_studies"] = 12
+        context.save(state_path)
+
+        assert state_path.read_text() == snapshot
+        events = [json.loads(line) for line in state_path.with_name("state.journal.jsonl").open()]
+        assert [e["type"] for e in events] == ["audit", "audit", "phase", "phase", "fields"]
+
+        loaded = WorkflowContext.load(state_path)
+        assert loaded.to_dict() == context.to_dict()
+        assert loaded.phase_history[0].validation_score == 0.8
+        assert loaded.resources == {"n_studies": 12}
+
+    def test_compaction_writes_snapshot(self, tmp_path):
+        """Test the journal is folded into a new snapshot once it grows long enough"""
+        state_path = tmp_path / "state.json"
+        context = WorkflowContext()
+        context.save(state_path)
+        context._journals[state_path].compact_every = 3
+
+        for i in range(5):
+            context.add_audit_entry("step", {"i": i})
+            context.save(state_path)
+
+        # Each save appends an audit entry and the new updated_at; the third save compacts
+        journal_lines = state_path.with_name("state.journal.jsonl").read_text().splitlines()
+        assert len(journal_lines) == 4
+        assert len(json.loads(state_path.read_text())["audit_trail"]) == 3
+        assert len(WorkflowContext.load(state_path).audit_trail) == 5
+
+    def test_load_ignores_torn_and_replayed_events(self, tmp_path):
+        """Test a torn final line and events already in the snapshot are skipped"""
+        state_path = tmp_path / "state.json"
+        journal_path = state_path.with_name("state.journal.jsonl")
+        context = WorkflowContext()
+        context.save(state_path)
+        context.add_audit_entry("kept", {})
+        context.save(state_path)
+        stale = journal_path.read_text()
+
+        # Crash after the snapshot was written but before the journal was emptied
+        context._journals[state_path].write_snapshot(context)
+        journal_path.write_text(stale + '{"seq": 2, "type": "aud')
+
+        loaded = WorkflowContext.load(state_path)
+        assert [entry["action"] for entry in loaded.audit_trail] == ["kept"]
+
+    def test_backup_retention(self, tmp_path):
+        """Test only the newest backups are kept"""
+        backup_dir = tmp_path / "backups"
+        backup_dir.mkdir()
+        for i in range(5):
+            (backup_dir / f"state_20240101_00000{i}.json").write_text("{}")
+
+        backup_file = create_backup(WorkflowContext(), backup_dir, keep=3)
+
+        assert sorted(p.name for p in backup_dir.iterdir()) == [
+            "state_20240101_000003.json", "state_20240101_000004.json", backup_file.name
+        ]
+        assert WorkflowContext.load(backup_file).workflow_id
+
+
 class TestResearchWorkflow:
     """Test ResearchWorkflow state machine"""
 
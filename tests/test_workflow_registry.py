@@ -0,0 +1,87 @@
+"""
+Tests for Workflow Registry
+
+Tests indexing workflow summaries across project roots.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+# Add code directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "code"))
+
+from workflow_context import WorkflowContext, ResearchPhase, Mode, ValidationResult
+from workflow_registry import WorkflowRegistry, STATE_FILE
+
+
+def make_project(root: Path, phases, mode=Mode.ASSISTANT, score=0.9) -> WorkflowContext:
+    """Save a workflow that has completed all but the last of ``phases``"""
+    context = WorkflowContext(research_question=f"Question for {root.name}", mode=mode, project_root=root)
+    for phase in phases[:-1]:
+        context.start_phase(phase)
+        context.complete_phase(ValidationResult(passed=True, score=score), outputs=[])
+    context.start_phase(phases[-1])
+    context.save()
+    return context
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return WorkflowRegistry(tmp_path / "registry.sqlite")
+
+
+class TestWorkflowRegistry:
+    """Test registry indexing and queries"""
+
+    def test_register_tree_and_query(self, tmp_path, registry):
+        """Test projects found under a directory are indexed and queryable"""
+        phases = list(ResearchPhase)
+        make_project(tmp_path / "labs" / "a", phases[:8], score=0.7)  # In ANALYSIS
+        make_project(tmp_path / "labs" / "b", phases[:8], mode=Mode.AUTONOMOUS)
+        make_project(tmp_path / "labs" / "c", phases[:2])
+
+        assert registry.register_tree(tmp_path / "labs") == 3
+
+        in_analysis = registry.query(phase=ResearchPhase.ANALYSIS)
+        assert sorted(Path(s.project_root).name for s in in_analysis) == ["a", "b"]
+        assert [Path(s.project_root).name for s in registry.query(
+            phase=ResearchPhase.ANALYSIS, mode=Mode.AUTONOMOUS
+        )] == ["b"]
+        assert [Path(s.project_root).name for s in registry.query(max_score=0.8)] == ["a"]
+
+        summary = registry.get(tmp_path / "labs" / "a")
+        assert summary.completed_phases == 7
+        assert summary.last_validation_score == 0.7
+        assert registry.phase_counts() == {"analysis": 2, "literature_review": 1}
+
+    def test_refresh_reloads_only_changed_projects(self, tmp_path, registry):
+        """Test refresh re-indexes a project only when its state or journal changes"""
+        context = make_project(tmp_path / "a", [ResearchPhase.PROBLEM_FORMULATION])
+        make_project(tmp_path / "b", [ResearchPhase.PROBLEM_FORMULATION])
+        registry.register(tmp_path / "a")
+        registry.register(tmp_path / "b")
+
+        assert registry.refresh().updated == 0
+
+        # Journaled save: the snapshot is untouched, the journal grows
+        context.complete_phase(ValidationResult(passed=True, score=0.8), outputs=[])
+        context.start_phase(ResearchPhase.LITERATURE_REVIEW)
+        context.save()
+
+        stats = registry.refresh()
+        assert (stats.checked, stats.updated) == (2, 1)
+        assert registry.get(tmp_path / "a").current_phase == ResearchPhase.LITERATURE_REVIEW
+
+    def test_stuck_projects_and_missing_state(self, tmp_path, registry):
+        """Test phase-entry queries and removal of projects whose state disappeared"""
+        make_project(tmp_path / "a", [ResearchPhase.ANALYSIS])
+        registry.register(tmp_path / "a")
+
+        assert registry.query(phase=ResearchPhase.ANALYSIS, entered_before=datetime.now() - timedelta(days=14)) == []
+        assert len(registry.query(phase=ResearchPhase.ANALYSIS, entered_before=datetime.now())) == 1
+
+        (tmp_path / "a" / STATE_FILE).unlink()
+        assert registry.refresh().removed == 1
+        assert registry.get(tmp_path / "a") is None
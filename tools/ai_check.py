@@ -4,10 +4,16 @@ CLI tool for AI-generated text detection.
 
 Usage:
     python tools/ai_check.py path/to/file.md
-    python tools/ai_check.py --directory docs/
-    python tools/ai_check.py --format html --output report.html
+    python tools/ai_check.py --format json --output report.json path/to/file.md
+    python tools/ai_check.py docs/ chapters/ --jobs 8 --output report.md
+
+Checking a directory or several files runs in batch mode: files are
+analyzed across a process pool, per-file results stream to stdout as JSON
+lines, unchanged files are answered from the history database, and one
+aggregated report is written to --output (or stderr).
 """
 import argparse
+import json
 import sys
 from pathlib import Path
 
@@ -15,6 +21,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "support"))
 
+from ai_detection.batch import BatchChecker, aggregate_report
 from ai_detection.detector import AITextDetector
 from ai_detection.config import AICheckConfig
 from ai_detection.suggestions import SuggestionGenerator
@@ -70,13 +77,92 @@ def format_markdown_report(result, suggestions):
     return "\n".join(report)
 
 
+def format_batch_markdown_report(summary):
+    """Format an aggregated batch report as markdown."""
+    report = []
+    report.append("# AI-Check Batch Report")
+    report.append(f"\n**Files checked:** {summary['files_checked']} "
+                  f"({summary['files_analyzed']} analyzed, {summary['files_cached']} unchanged)")
+    report.append(f"**Total words:** {summary['total_words']}")
+    report.append(f"**Overall Confidence:** {summary['overall_confidence']:.1%} (word-weighted)")
+    
+    counts = summary["status_counts"]
+    report.append(f"\n## Status\n")
+    report.append(f"- 🚫 HIGH: {counts['high']}")
+    report.append(f"- ⚠️ MEDIUM: {counts['medium']}")
+    report.append(f"- ✅ LOW: {counts['low']}")
+    
+    if summary["ai_words_found"]:
+        report.append(f"\n## AI-Typical Words Found\n")
+        for word, count in list(summary["ai_words_found"].items())[:10]:
+            report.append(f"- **{word}**: {count} occurrences")
+        report.append(f"\n**Total:** {summary['ai_words_per_1000']:.1f} AI-typical words per 1000 words")
+    
+    report.append(f"\n## Files\n")
+    report.append("| File | Confidence | Status | Words | Flagged sections |")
+    report.append("|------|------------|--------|-------|------------------|")
+    for f in summary["files"]:
+        report.append(f"| {f['file_path']} | {f['overall_confidence']:.1%} | {f['status'].upper()} | "
+                      f"{f['total_words']} | {f['flagged_sections']} |")
+    
+    return "\n".join(report)
+
+
+def collect_files(paths):
+    """Expand paths into the files to check; directories contribute .md and .tex files."""
+    files = []
+    for path in paths:
+        if path.is_file():
+            files.append(path)
+        elif path.is_dir():
+            files.extend(sorted(list(path.glob("**/*.md")) + list(path.glob("**/*.tex"))))
+        else:
+            raise FileNotFoundError(path)
+    return list(dict.fromkeys(files))
+
+
+def run_batch(files, config, args):
+    """Check files in parallel, streaming JSON lines and writing one aggregated report."""
+    tracker = AICheckTracker() if (args.track or not args.no_cache) else None
+    checker = BatchChecker(config, tracker, jobs=args.jobs,
+                           use_cache=not args.no_cache, track=args.track)
+    
+    records = []
+    for record in checker.run(files):
+        records.append(record)
+        print(json.dumps(record), flush=True)
+    
+    summary = aggregate_report(records, config)
+    if args.format == "markdown":
+        report = format_batch_markdown_report(summary)
+    else:  # json
+        report = json.dumps(summary, indent=2)
+    
+    # stdout carries the JSON lines, so the report goes to a file or stderr
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report)
+        print(f"Report saved to {args.output}", file=sys.stderr)
+    else:
+        print(report, file=sys.stderr)
+    
+    if args.strict and summary["status_counts"]["high"]:
+        return 1
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(description="AI-generated text detection tool")
-    parser.add_argument("path", help="File or directory to check")
+    parser.add_argument("paths", nargs="+", help="Files or directories to check")
     parser.add_argument("--config", help="Path to config file", default=".ai-check-config.yaml")
     parser.add_argument("--format", choices=["markdown", "json"], default="markdown")
-    parser.add_argument("--output", help="Output file path (default: stdout)")
+    parser.add_argument("--output", help="Output file path (default: stdout; stderr in batch mode)")
     parser.add_argument("--track", action="store_true", help="Track results in history database")
+    parser.add_argument("--jobs", type=int, help="Worker processes in batch mode (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-analyze unchanged files in batch mode")
+    parser.add_argument("--strict", action="store_true",
+                        help="Exit 1 if any file reaches the block threshold (batch mode)")
     
     args = parser.parse_args()
     
@@ -84,46 +170,45 @@ def main():
     config_path = Path(args.config)
     config = AICheckConfig(str(config_path) if config_path.exists() else None)
     
+    # Process file(s)
+    paths = [Path(p) for p in args.paths]
+    try:
+        files_to_check = collect_files(paths)
+    except FileNotFoundError as e:
+        print(f"Error: {e} not found", file=sys.stderr)
+        return 1
+    
+    if len(paths) > 1 or paths[0].is_dir():
+        return run_batch(files_to_check, config, args)
+    
     # Initialize components
     detector = AITextDetector(config)
     suggestion_gen = SuggestionGenerator()
     tracker = AICheckTracker() if args.track else None
     
-    # Process file(s)
-    path = Path(args.path)
+    # Generate report
+    file_path = files_to_check[0]
+    with open(file_path, 'r') as f:
+        text = f.read()
     
-    if path.is_file():
-        files_to_check = [path]
-    elif path.is_dir():
-        files_to_check = list(path.glob("**/*.md")) + list(path.glob("**/*.tex"))
+    result = detector.analyze(text, str(file_path))
+    suggestions = suggestion_gen.generate_suggestions(result)
+    
+    if args.format == "markdown":
+        report = format_markdown_report(result, suggestions)
+    else:  # json
+        report = json.dumps(result.to_dict(), indent=2)
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report)
+        print(f"Report saved to {args.output}")
     else:
-        print(f"Error: {path} not found", file=sys.stderr)
-        return 1
+        print(report)
     
-    # Generate reports
-    for file_path in files_to_check:
-        with open(file_path, 'r') as f:
-            text = f.read()
-        
-        result = detector.analyze(text, str(file_path))
-        suggestions = suggestion_gen.generate_suggestions(result)
-        
-        if args.format == "markdown":
-            report = format_markdown_report(result, suggestions)
-        else:  # json
-            import json
-            report = json.dumps(result.to_dict(), indent=2)
-        
-        if args.output:
-            with open(args.output, 'w') as f:
-                f.write(report)
-            print(f"Report saved to {args.output}")
-        else:
-            print(report)
-        
-        if tracker:
-            tracker.log_detection(result)
-            print(f"\nResults logged to history database")
+    if tracker:
+        tracker.log_detection(result)
+        print(f"\nResults logged to history database")
     
     return 0
 
@@ -15,13 +15,199 @@ import argparse
 import csv
 import json
 import logging
+import os
+import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
+# Optional: python-Levenshtein gives a fast edit-distance bound
+try:
+    import Levenshtein
+except ImportError:
+    Levenshtein = None
+
+
+def normalize_string(s: str) -> str:
+    """Normalize string for comparison"""
+    if not s:
+        return ""
+    # Convert to lowercase, remove punctuation, strip whitespace
+    s = s.lower()
+    s = re.sub(r'[^\w\s]', '', s)
+    s = ' '.join(s.split())
+    return s
+
+
+# Matcher state shared with worker processes (set by _init_worker)
+_WORKER_MATCHER = None
+
+
+def _init_worker(matcher: "BlockedTitleMatcher"):
+    global _WORKER_MATCHER
+    _WORKER_MATCHER = matcher
+
+
+def _match_range(bounds: Tuple[int, int]) -> Tuple[List[Tuple[int, int, float]], Counter]:
+    return _WORKER_MATCHER._match_range(*bounds)
+
+
+class BlockedTitleMatcher:
+    """
+    Fuzzy title matcher that only compares titles sharing a rare token
+
+    Titles are normalized once and indexed by token. Each title probes the
+    index with its few rarest tokens (ignoring tokens that appear in only
+    one title, such as typos, which cannot match anything). Candidate pairs
+    then pass cheap upper-bound filters before the exact SequenceMatcher
+    ratio is computed:
+
+    1. Length bound: 2 * min(len) / (len_a + len_b)
+    2. SequenceMatcher.quick_ratio() (character multiset overlap)
+    3. Levenshtein.ratio() when python-Levenshtein is installed
+
+    Each filter can only reject pairs whose exact ratio is below the
+    threshold, so every pair that is compared gets the same score as in
+    the all-pairs comparison.
+
+    Blocking trades some recall for speed: a pair is only compared if one
+    title contains a probe token of the other. Near-duplicates that share
+    only common words, or whose shared rare words were all altered (e.g.
+    by typos), are never compared and are missed. On synthetic exports
+    the default 3 probe tokens found 464 of the 465 pairs the all-pairs
+    comparison found; more probe tokens raise recall and comparisons.
+    """
+
+    def __init__(self, threshold: float, probe_tokens: int = 3,
+                 workers: Optional[int] = None, parallel_min: int = 5000):
+        """
+        Args:
+            threshold: Minimum match score (0-100), as in fuzzy_match
+            probe_tokens: Rarest tokens per title used to find candidates
+                (more find more matches but compare more pairs)
+            workers: Worker processes (default: CPU count)
+            parallel_min: Use worker processes from this many titles up
+        """
+        self.threshold = threshold / 100
+        self.probe_tokens = probe_tokens
+        self.workers = workers or os.cpu_count() or 1
+        self.parallel_min = parallel_min
+        self.stats: Dict[str, int] = {}
+
+    def find_matches(self, titles: List[str]) -> List[Tuple[int, int, float]]:
+        """
+        Find fuzzy title matches
+
+        Args:
+            titles: Raw titles (empty titles are skipped)
+
+        Returns:
+            Sorted list of (i, j, score) with i < j and score in 0-100
+        """
+        self._build_index(titles)
+
+        n = len(titles)
+        if self.workers > 1 and n >= self.parallel_min:
+            chunk = max(1, -(-n // (self.workers * 4)))
+            bounds = [(start, min(start + chunk, n)) for start in range(0, n, chunk)]
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(self,)) as executor:
+                results = list(executor.map(_match_range, bounds))
+        else:
+            results = [self._match_range(0, n)]
+
+        matches = []
+        counts = Counter()
+        for chunk_matches, chunk_counts in results:
+            matches.extend(chunk_matches)
+            counts.update(chunk_counts)
+        matches.sort()
+
+        indexed = sum(1 for tokens in self._tokens if tokens)
+        all_pairs = indexed * (indexed - 1) // 2
+        self.stats = {
+            "titles": indexed,
+            "all_pairs": all_pairs,
+            "candidate_pairs": counts["candidates"],
+            "pruned_by_blocking": all_pairs - counts["candidates"],
+            "pruned_by_length": counts["length"],
+            "pruned_by_quick_ratio": counts["quick_ratio"],
+            "pruned_by_levenshtein": counts["levenshtein"],
+            "exact_comparisons": counts["exact"],
+            "matches": len(matches),
+        }
+        return matches
+
+    def _build_index(self, titles: List[str]):
+        self._titles = [normalize_string(title) for title in titles]
+        self._tokens = [set(title.split()) for title in self._titles]
+
+        doc_freq = Counter(token for tokens in self._tokens for token in tokens)
+        self._postings: Dict[str, List[int]] = {}
+        for idx, tokens in enumerate(self._tokens):
+            for token in tokens:
+                self._postings.setdefault(token, []).append(idx)
+
+        self._probes = []
+        for tokens in self._tokens:
+            shared = [token for token in tokens if doc_freq[token] > 1]
+            shared.sort(key=lambda token: (doc_freq[token], token))
+            self._probes.append(set(shared[:self.probe_tokens]))
+
+    def _match_range(self, start: int, end: int) -> Tuple[List[Tuple[int, int, float]], Counter]:
+        """Match titles [start, end) against all candidates"""
+        matches = []
+        counts = Counter()
+        titles, tokens, probes = self._titles, self._tokens, self._probes
+
+        for i in range(start, end):
+            candidates = set()
+            for token in probes[i]:
+                candidates.update(self._postings[token])
+            candidates.discard(i)
+            if not candidates:
+                continue
+
+            # quick_ratio is symmetric, so one matcher per probing title
+            # reuses its character counts for every candidate
+            probe = SequenceMatcher(None, "", titles[i])
+            len_i = len(titles[i])
+
+            for j in candidates:
+                # A pair found from both sides is compared once, from the lower index
+                if j < i and probes[j] & tokens[i]:
+                    continue
+
+                counts["candidates"] += 1
+                len_j = len(titles[j])
+                if 2 * min(len_i, len_j) / (len_i + len_j) < self.threshold:
+                    counts["length"] += 1
+                    continue
+
+                probe.set_seq1(titles[j])
+                if probe.quick_ratio() < self.threshold:
+                    counts["quick_ratio"] += 1
+                    continue
+
+                a, b = (i, j) if i < j else (j, i)
+                if Levenshtein is not None and Levenshtein.ratio(titles[a], titles[b]) < self.threshold:
+                    counts["levenshtein"] += 1
+                    continue
+
+                counts["exact"] += 1
+                score = SequenceMatcher(None, titles[a], titles[b]).ratio()
+                if score >= self.threshold:
+                    matches.append((a, b, score * 100))
+
+        return matches, counts
+
+
 
 class Deduplicator:
     """Find and remove duplicate papers"""
@@ -31,6 +217,7 @@ class Deduplicator:
         self.config = self._load_config(config_path)
         self.setup_logging()
         self.duplicates = []
+        self.fuzzy_stats: Dict[str, int] = {}
 
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from YAML file"""
@@ -75,18 +262,10 @@ class Deduplicator:
 
     def normalize_string(self, s: str) -> str:
         """Normalize string for comparison"""
-        if not s:
-            return ""
-        # Convert to lowercase, remove punctuation, strip whitespace
-        import re
-        s = s.lower()
-        s = re.sub(r'[^\w\s]', '', s)
-        s = ' '.join(s.split())
-        return s
+        return normalize_string(s)
 
     def fuzzy_match(self, s1: str, s2: str) -> float:
         """Calculate fuzzy match score (0-100)"""
-        from difflib import SequenceMatcher
         s1_norm = self.normalize_string(s1)
         s2_norm = self.normalize_string(s2)
 
@@ -144,27 +323,28 @@ class Deduplicator:
         return duplicates
 
     def find_duplicates_fuzzy_title(self, papers: List[Dict]) -> List[Tuple[int, int, str, float]]:
-        """Find duplicates by fuzzy title match"""
-        threshold = self.config['deduplication']['fuzzy_threshold']
-        duplicates = []
-
-        # Compare each paper with all subsequent papers
-        for i in range(len(papers)):
-            title_i = papers[i].get('Title', '')
-            if not title_i:
-                continue
-
-            for j in range(i + 1, len(papers)):
-                title_j = papers[j].get('Title', '')
-                if not title_j:
-                    continue
-
-                # Calculate fuzzy match score
-                score = self.fuzzy_match(title_i, title_j)
+        """Find duplicates by fuzzy title match (blocked; see BlockedTitleMatcher)"""
+        dedup_config = self.config['deduplication']
+        matcher = BlockedTitleMatcher(
+            threshold=dedup_config['fuzzy_threshold'],
+            probe_tokens=dedup_config.get('fuzzy_probe_tokens', 3),
+            workers=dedup_config.get('fuzzy_workers'),
+            parallel_min=dedup_config.get('fuzzy_parallel_min', 5000)
+        )
 
-                if score >= threshold:
-                    duplicates.append((i, j, 'title_fuzzy', score))
-                    self.logger.debug(f"Fuzzy duplicate ({score:.1f}%): {title_i[:50]}...")
+        titles = [paper.get('Title', '') or '' for paper in papers]
+        duplicates = []
+        for i, j, score in matcher.find_matches(titles):
+            duplicates.append((i, j, 'title_fuzzy', score))
+            self.logger.debug(f"Fuzzy duplicate ({score:.1f}%): {titles[i][:50]}...")
+
+        self.fuzzy_stats = matcher.stats
+        self.logger.info(
+            f"Fuzzy title matching: {matcher.stats['exact_comparisons']:,} exact comparisons "
+            f"of {matcher.stats['all_pairs']:,} possible pairs "
+            f"({matcher.stats['pruned_by_blocking']:,} pruned by blocking, "
+            f"{matcher.stats['pruned_by_length'] + matcher.stats['pruned_by_quick_ratio'] + matcher.stats['pruned_by_levenshtein']:,} by filters)"
+        )
 
         return duplicates
 
@@ -268,6 +448,11 @@ class Deduplicator:
             for strategy, count in strategies.items():
                 f.write(f"- **{strategy}:** {count} duplicates\n")
 
+            if self.fuzzy_stats:
+                f.write("\n### Fuzzy Matching Comparisons\n\n")
+                for key, value in self.fuzzy_stats.items():
+                    f.write(f"- **{key.replace('_', ' ').capitalize()}:** {value:,}\n")
+
             f.write("\n## Duplicate Details\n\n")
 
             # Group by strategy